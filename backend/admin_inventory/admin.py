@@ -1,8 +1,10 @@
 from django.contrib import admin
-from .models import Pet, AdoptionRequest, Account, UserProfile
+from .models import Pet, AdoptionRequest, Account, UserProfile, Favorite, ArchivedAdoptionRequest
 
 # Register your models here.
 admin.site.register(Pet)
 admin.site.register(AdoptionRequest)   
 admin.site.register(Account)
 admin.site.register(UserProfile)
+admin.site.register(Favorite)
+admin.site.register(ArchivedAdoptionRequest)
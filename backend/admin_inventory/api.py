@@ -1,4 +1,6 @@
-from rest_framework import serializers, viewsets, status, mixins, routers
+from rest_framework import serializers, viewsets, status, mixins, routers, permissions
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.views import APIView
@@ -6,26 +8,67 @@ from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.authtoken.models import Token
 
 from django.contrib.auth.models import User
-from django.db.models.functions import TruncMonth
-from django.db.models import Count
-
-from .models import Pet, AdoptionRequest, Account, UserProfile
+from django.db.models import Count, Max, Sum
+
+from .models import Pet, AdoptionRequest, ArchivedAdoptionRequest, Account, UserProfile, Favorite, StatusRollup
+from .pagination import KeysetPagination, PagedKeysetPagination
+from .read_serializers import AdoptionRequestReadSerializer, PetReadSerializer, ValuesListMixin
+from .catalogue_cache import CachedCatalogueMixin, catalogue_cache_stats
+from .conditional import ConditionalGetMixin, collection_version, conditional_response, make_etag
+from .filters import PetCatalogueFilter
+from .fieldsets import SparseFieldsMixin
+from .favorites import LegacyFavoritesField, add_favorite, favorites_prefetch, remove_favorite, set_favorites
+from .matching import get_match_predicates, invalidate_match_predicates, rank_matches
+from .purge import purge_requests
+from .stats import get_summary
+from .trends import LABEL_FORMATS, TrendsQuerySerializer, trend_series
+from .transitions import MAX_BULK_IDS, TransitionConflict, bulk_transition
+from .thumbnails import thumbnail_urls
 
 class  UserProfileSerializer(serializers.ModelSerializer):
+    profile_image_thumbnails = serializers.SerializerMethodField()
+    favorites = LegacyFavoritesField(required=False)
+
     class Meta:
         model = UserProfile
         fields = '__all__'
 
+    def get_profile_image_thumbnails(self, obj):
+        return thumbnail_urls(obj.profile_image_thumbnails, obj.profile_image.storage, self.context.get('request'))
+
+    def update(self, instance, validated_data):
+        preferences_changed = (
+            'preferences' in validated_data and validated_data['preferences'] != instance.preferences
+        )
+        favorites = validated_data.pop('favorites', None)
+        instance = super().update(instance, validated_data)
+        if favorites is not None:
+            set_favorites(instance.user, favorites)
+        if preferences_changed:
+            invalidate_match_predicates(instance.user_id)
+        return instance
+
 
 # ---------------------
 # SERIALIZERS
 # ---------------------
 
 class PetSerializer(serializers.ModelSerializer):
+    has_pending_request = serializers.BooleanField(read_only=True)
+    image_thumbnails = serializers.SerializerMethodField()
+
     class Meta:
         model = Pet
         fields = '__all__'
 
+    def get_image_thumbnails(self, obj):
+        # {'200': {'webp': url, 'jpeg': url}, '400': ..., '800': ...}; empty until generated
+        return thumbnail_urls(obj.image_thumbnails, obj.image.storage, self.context.get('request'))
+
+
+class PetMatchSerializer(PetSerializer):
+    match_score = serializers.IntegerField(read_only=True)
+
 
 class AdoptionRequestSerializer(serializers.ModelSerializer):
     pet_name = serializers.CharField(source='pet.name', read_only=True)
@@ -75,7 +118,7 @@ class LoginAPIView(ObtainAuthToken):
         if not username or not password:
             return Response({'detail': 'Username and password required.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        user = User.objects.filter(username=username).first()
+        user = User.objects.select_related('account').filter(username=username).first()
         if user and user.check_password(password):
             token, _ = Token.objects.get_or_create(user=user)
             # Get role
@@ -94,24 +137,169 @@ class LoginAPIView(ObtainAuthToken):
 # PET VIEWSET
 # ---------------------
 
-class PetViewSet(viewsets.ModelViewSet):
+class PetViewSet(CachedCatalogueMixin, ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = Pet.objects.all().order_by('-id')
     serializer_class = PetSerializer
+    read_serializer_class = PetReadSerializer
     parser_classes = [MultiPartParser, FormParser]
+    pagination_class = KeysetPagination
+    filter_backends = [PetCatalogueFilter]
+    cursor_ordering = '-id'
+    sparse_field_columns = {
+        'has_pending_request': ('pending_requests',),
+        'image_thumbnails': ('image_thumbnails', 'image'),
+    }
 
     def destroy(self, request, *args, **kwargs):
         pet = self.get_object()
         pet.delete()
         return Response({'success': True}, status=status.HTTP_204_NO_CONTENT)
 
+    @action(detail=False, methods=['get'], url_path='matches',
+            serializer_class=PetMatchSerializer,
+            permission_classes=[permissions.IsAuthenticated],
+            cursor_ordering=('-match_score', '-id'))
+    def matches(self, request):
+        """
+        "Soulmates": pets ranked by how many of the user's saved preferences they
+        match. Catalogue filters (?status=Available ...) and ?ordering= still apply.
+        """
+        predicates = get_match_predicates(request.user)
+        queryset = rank_matches(self.filter_queryset(self.get_queryset()), predicates)
+        if 'ordering' not in request.query_params:
+            queryset = queryset.order_by('-match_score', '-id')
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
 
 # ---------------------
 # ADOPTION REQUEST VIEWSET
 # ---------------------
 
-class AdoptionRequestViewSet(viewsets.ModelViewSet):
-    queryset = AdoptionRequest.objects.all().order_by('-id')
+class BulkStatusSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=MAX_BULK_IDS
+    )
+    status = serializers.ChoiceField(choices=AdoptionRequest.STATUS_CHOICES)
+    expected_status = serializers.ChoiceField(choices=AdoptionRequest.STATUS_CHOICES, default='Pending')
+
+    def validate(self, attrs):
+        if attrs['status'] == attrs['expected_status']:
+            raise ValidationError({'status': ['Must differ from expected_status.']})
+        return attrs
+
+
+class AdoptionRequestViewSet(ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
+    # pet_name reads pet.name, so join the pet instead of one query per row
+    queryset = AdoptionRequest.objects.select_related('pet').order_by('-id')
     serializer_class = AdoptionRequestSerializer
+    read_serializer_class = AdoptionRequestReadSerializer
+    pagination_class = KeysetPagination
+    cursor_ordering = '-created_at'
+
+    def get_version(self, queryset):
+        # Renaming a pet changes pet_name in its applications. The newest write to
+        # any pet is one index read; max(pet__updated_at) would join every row.
+        latest, rows = super().get_version(queryset)
+        pets_latest = Pet.objects.aggregate(latest=Max('updated_at'))['latest']
+        return max(filter(None, (latest, pets_latest)), default=None), rows
+
+    def get_queryset(self):
+        """
+        ?requester_name=... (UserApplications.jsx), ?email=..., ?status=Pending,
+        ?pet=<id>. Each is served by an index on AdoptionRequest.Meta.
+        """
+        qs = super().get_queryset()
+        params = self.request.query_params
+        for param in ('requester_name', 'email'):
+            if params.get(param):
+                qs = qs.filter(**{param: params[param]})
+        if params.get('status'):
+            statuses = [part.strip() for part in params['status'].split(',') if part.strip()]
+            valid = {value for value, _ in AdoptionRequest.STATUS_CHOICES}
+            if not set(statuses) <= valid:
+                raise ValidationError({'status': [f'Choose from: {", ".join(sorted(valid))}.']})
+            qs = qs.filter(status__in=statuses)
+        if params.get('pet'):
+            if not params['pet'].isdigit():
+                raise ValidationError({'pet': ['A valid integer is required.']})
+            qs = qs.filter(pet_id=int(params['pet']))
+        return qs
+
+    @action(detail=False, methods=['post'], url_path='bulk-status')
+    def bulk_status(self, request):
+        """
+        POST /api/applications/bulk-status/
+            {"ids": [1, 2, 3], "status": "Rejected", "expected_status": "Pending"}
+
+        Applies the status to every id in one transaction, or to none of them:
+        if any application is no longer `expected_status` (default Pending) the
+        response is 409 with the current status of the conflicting ids.
+        Approving also rejects the pet's other pending applications and marks
+        the pet Adopted.
+        """
+        params = BulkStatusSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        try:
+            result = bulk_transition(**params.validated_data)
+        except TransitionConflict as conflict:
+            return Response({
+                'detail': f"Some applications are no longer {params.validated_data['expected_status']}.",
+                'conflicts': conflict.conflicts,
+            }, status=status.HTTP_409_CONFLICT)
+        return Response(result)
+
+    @action(detail=False, methods=['post'], permission_classes=[permissions.IsAdminUser])
+    def purge(self, request):
+        """
+        POST /api/applications/purge/?status=Rejected
+
+        Deletes every application matching the list filters (all of them
+        without any) through purge_requests(): short per-batch transactions
+        instead of one long delete() holding the write lock.
+        """
+        return Response({'deleted': purge_requests(self.get_queryset())})
+
+
+# ---------------------
+# ARCHIVED APPLICATIONS
+# ---------------------
+
+class ArchivedAdoptionRequestSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ArchivedAdoptionRequest
+        fields = ['id', 'pet', 'pet_name', 'requester_name', 'email', 'status',
+                  'created_at', 'status_changed_at', 'archived_at']
+
+
+class ArchivedAdoptionRequestViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Closed applications moved out of /api/applications/ by
+    `manage.py archive_applications`. Newest first, cursor paginated.
+
+    ?status=Approved  ?email=...  ?requester_name=...  ?pet=<id>
+    """
+    queryset = ArchivedAdoptionRequest.objects.order_by('-created_at', '-id')
+    serializer_class = ArchivedAdoptionRequestSerializer
+    pagination_class = PagedKeysetPagination
+    cursor_ordering = '-created_at'
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        params = self.request.query_params
+        for param in ('status', 'email', 'requester_name'):
+            if params.get(param):
+                qs = qs.filter(**{param: params[param]})
+        if params.get('pet'):
+            if not params['pet'].isdigit():
+                raise ValidationError({'pet': ['A valid integer is required.']})
+            qs = qs.filter(pet_id=int(params['pet']))
+        return qs
 
 
 # ---------------------
@@ -119,23 +307,71 @@ class AdoptionRequestViewSet(viewsets.ModelViewSet):
 # ---------------------
 
 class AdoptionTrendsAPIView(APIView):
+    """
+    Adoptions (or any status transition) per day, week or month, read from the
+    daily StatusRollup table instead of scanning Pet.
+
+    ?granularity=day|week|month  ?start=YYYY-MM-DD  ?end=YYYY-MM-DD
+    ?kind=pet|request            ?status=Adopted (default)
+    """
     def get(self, request):
-        if hasattr(Pet, 'created_at'):
-            qs = (
-                Pet.objects.filter(status='Adopted')
-                .annotate(month=TruncMonth('created_at'))
-                .values('month')
-                .annotate(count=Count('id'))
-                .order_by('month')
-            )
-            trends = [entry['count'] for entry in qs]
-            months = [entry['month'].strftime('%b %Y') for entry in qs]
-            data = {"trends": trends, "months": months}
-        else:
-            data = {"trends": [Pet.objects.filter(status='Adopted').count()], "months": ["All Time"]}
+        params = TrendsQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+
+        # Rollup counts only ever grow, so (rows, total) versions the range. The
+        # resolved dates are part of the ETag because `end` defaults to today.
+        version = StatusRollup.objects.filter(
+            kind=query['kind'], status=query['status'], day__range=(query['start'], query['end'])
+        ).aggregate(rows=Count('id'), total=Sum('count'))
+        etag = make_etag(request, query['start'], query['end'], version['rows'], version['total'])
+        return conditional_response(request, lambda: self.trends_response(query), etag)
+
+    def trends_response(self, query):
+        series = trend_series(
+            query['kind'], query['status'], query['granularity'], query['start'], query['end']
+        )
+        label_format = LABEL_FORMATS[query['granularity']]
+        data = {
+            "trends": [count for _, count in series],
+            "months": [bucket.strftime(label_format) for bucket, _ in series],
+            "buckets": [{"start": bucket, "count": count} for bucket, count in series],
+            "granularity": query['granularity'],
+        }
         return Response(data)
 
 
+# ---------------------
+# DASHBOARD SUMMARY
+# ---------------------
+
+class StatsSummaryAPIView(APIView):
+    """
+    Pet and application counts for AdminStats, served from a short-TTL cache.
+    Answers 304 while no pet or application changed since the client's copy.
+    """
+    def get(self, request):
+        pets = collection_version(Pet.objects.all(), 'updated_at')
+        requests = collection_version(AdoptionRequest.objects.all(), 'updated_at')
+        archived = collection_version(ArchivedAdoptionRequest.objects.all(), 'archived_at')
+        stamps = [latest for latest, _ in (pets, requests, archived) if latest is not None]
+        return conditional_response(
+            request,
+            lambda: Response(get_summary()),
+            make_etag(request, pets, requests, archived),
+            max(stamps) if stamps else None,
+            check_last_modified=False,
+        )
+
+
+class CatalogueCacheStatsAPIView(APIView):
+    """Hit / miss counters of the anonymous pet catalogue cache (catalogue_cache.py)."""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(catalogue_cache_stats())
+
+
 # ---------------------
 # USER REGISTRATION
 # ---------------------
@@ -159,18 +395,106 @@ class RegisterAPIView(APIView):
 # USER VIEWSET
 # ---------------------
 
-class UserViewSet(mixins.ListModelMixin,
+class UserViewSet(SparseFieldsMixin,
+                  mixins.ListModelMixin,
                   mixins.RetrieveModelMixin,
                   viewsets.GenericViewSet):
-    queryset = User.objects.all().order_by('id')
+    queryset = User.objects.select_related('account').order_by('id')
     serializer_class = UserSerializer
 
-
-class UserProfileViewSet(viewsets.ModelViewSet):
-    queryset = UserProfile.objects.all().order_by('id')
+    def get_queryset(self):
+        """
+        Supports exact-match lookups used by SignIn.jsx, e.g. ?username=alice
+        (User.username has a unique index).
+        """
+        qs = super().get_queryset()
+        username = self.request.query_params.get('username')
+        if username is not None:
+            qs = qs.filter(username=username)
+        return qs
+
+    @action(detail=False, methods=['get'], url_path=r'by-username/(?P<username>[\w.@+-]+)')
+    def by_username(self, request, username=None):
+        """Direct lookup: /api/accounts/by-username/<username>/"""
+        user = self.get_queryset().filter(username=username).first()
+        if user is None:
+            return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(self.get_serializer(user).data)
+
+
+class UserProfileViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    # favorites reads user.favorite_pets: join the user so the prefetch starts
+    # from it rather than from an `id IN (...)` query per page of profiles
+    queryset = UserProfile.objects.select_related('user').prefetch_related(favorites_prefetch()).order_by('id')
     serializer_class = UserProfileSerializer
+    sparse_field_columns = {
+        'profile_image_thumbnails': ('profile_image_thumbnails', 'profile_image'),
+        'favorites': ('user__id',),
+    }
+
+    def get_queryset(self):
+        """
+        Supports ?user=<id> (used by AdoptPage.jsx) and ?username=<name>; both
+        go through unique indexes (UserProfile.user, User.username).
+        """
+        qs = super().get_queryset()
+        fields = self.get_sparse_fields()
+        if fields is not None and 'favorites' not in fields:
+            qs = qs.prefetch_related(None)
+        user_id = self.request.query_params.get('user')
+        username = self.request.query_params.get('username')
+        if user_id is not None:
+            if not user_id.isdigit():
+                raise ValidationError({'user': ['A valid integer is required.']})
+            qs = qs.filter(user_id=int(user_id))
+        if username is not None:
+            qs = qs.filter(user__username=username)
+        return qs
+
+
+# ---------------------
+# FAVORITES
+# ---------------------
+
+class FavoriteSerializer(serializers.ModelSerializer):
+    pet = PetSerializer(read_only=True)
+
+    class Meta:
+        model = Favorite
+        fields = ['id', 'pet', 'created_at']
+
+
+class FavoriteViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    The logged-in user's favorite pets.
+
+        GET    /api/favorites/            newest first, cursor paginated
+        PUT    /api/favorites/<pet_id>/   add one pet (a single INSERT, no-op if already there)
+        DELETE /api/favorites/<pet_id>/   remove one pet (a single DELETE)
+    """
+    serializer_class = FavoriteSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = PagedKeysetPagination
+    cursor_ordering = '-created_at'
+    lookup_url_kwarg = 'pet_id'
+    lookup_value_regex = r'\d+'
+
+    def get_queryset(self):
+        return (
+            Favorite.objects.filter(user=self.request.user)
+            .select_related('pet')
+            .order_by('-created_at', '-id')
+        )
 
+    def update(self, request, pet_id=None):
+        if not Pet.objects.filter(pk=pet_id).exists():
+            raise NotFound('Pet not found.')
+        add_favorite(request.user, pet_id)
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
+    def destroy(self, request, pet_id=None):
+        remove_favorite(request.user, pet_id)
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 # ---------------------
@@ -180,7 +504,9 @@ class UserProfileViewSet(viewsets.ModelViewSet):
 router = routers.DefaultRouter()
 router.register(r'pets', PetViewSet)
 router.register(r'applications', AdoptionRequestViewSet)
+router.register(r'archived-applications', ArchivedAdoptionRequestViewSet)
 router.register(r'accounts', UserViewSet)
 router.register(r'user-profiles', UserProfileViewSet)
+router.register(r'favorites', FavoriteViewSet, basename='favorite')
 
 
@@ -2,3 +2,7 @@ from django.apps import AppConfig
 
 class AdminInventoryConfig(AppConfig):
     name = 'admin_inventory'
+
+    def ready(self):
+        # Registers the cache-invalidation and thumbnail receivers
+        from . import signals  # noqa: F401
@@ -0,0 +1,52 @@
+import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import AdoptionRequest, ArchivedAdoptionRequest
+from .purge import PURGE_BATCH_SIZE, purge_requests
+
+CLOSED_STATUSES = ('Approved', 'Rejected')
+
+
+def archive_to_table(rows):
+    """
+    purge_requests() sink copying a batch into ArchivedAdoptionRequest. An id
+    that is already archived raises IntegrityError, which rolls back the whole
+    batch, so no request is deleted without its archive row.
+    """
+    ArchivedAdoptionRequest.objects.bulk_create([
+        ArchivedAdoptionRequest(
+            id=row['id'],
+            pet_id=row['pet_id'],
+            pet_name=row['pet__name'] or '',
+            requester_name=row['requester_name'],
+            email=row['email'],
+            status=row['status'],
+            created_at=row['created_at'],
+            status_changed_at=row['status_changed_at'],
+        )
+        for row in rows
+    ])
+
+
+def closed_requests(older_than_days=None):
+    """Approved/Rejected requests closed (or, if never timestamped, created) over N days ago."""
+    if older_than_days is None:
+        older_than_days = settings.ARCHIVE_CLOSED_REQUESTS_AFTER_DAYS
+    cutoff = timezone.now() - datetime.timedelta(days=older_than_days)
+    return AdoptionRequest.objects.filter(status__in=CLOSED_STATUSES).filter(
+        Q(status_changed_at__lt=cutoff) | Q(status_changed_at__isnull=True, created_at__lt=cutoff)
+    )
+
+
+def archive_closed_requests(older_than_days=None, batch_size=PURGE_BATCH_SIZE, progress=None, pause=0):
+    """
+    Moves closed requests into ArchivedAdoptionRequest in batches: each batch
+    is copied and deleted in the same short transaction. Returns how many moved.
+    """
+    return purge_requests(
+        closed_requests(older_than_days),
+        batch_size=batch_size, sink=archive_to_table, progress=progress, pause=pause,
+    )
@@ -0,0 +1,58 @@
+"""
+Performance benchmarks for admin_inventory.
+
+Run them with `python manage.py benchmark <name> [--rows N ...]`. Every run
+builds a throwaway test database (the same one `manage.py test` uses), so
+db.sqlite3 is never touched. Modules in this package register themselves with
+the @benchmark decorator. Seed data and the EXPLAIN helpers are shared with
+the test suite (admin_inventory/tests/base.py).
+
+Correctness checks belong in admin_inventory/tests, where `manage.py test`
+runs them; benchmarks only report timings and sizes.
+"""
+import time
+from contextlib import contextmanager
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from admin_inventory.tests.base import (  # noqa: F401
+    analyze, captured_sql, explain_sql, plan_uses_index, seed_applications, seed_pets, seed_users,
+)
+
+BENCHMARKS = {}
+
+
+def benchmark(name, help='', rows=(1000,)):
+    """Registers `func(out, rows)` as `manage.py benchmark <name>`."""
+    def decorator(func):
+        func.help = help
+        func.default_rows = tuple(rows)
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def best_of(func, repeat=5):
+    """Runs func `repeat` times and returns the fastest run in milliseconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def count_queries(func):
+    with CaptureQueriesContext(connection) as ctx:
+        func()
+    return len(ctx.captured_queries)
+
+
+@contextmanager
+def rollback():
+    """Discards everything seeded inside the block, so each row count starts clean."""
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
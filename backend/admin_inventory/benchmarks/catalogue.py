@@ -0,0 +1,37 @@
+from rest_framework.test import APIClient
+
+from . import analyze, benchmark, best_of, captured_sql, explain_sql, plan_uses_index, rollback, seed_pets
+
+# Catalogue queries the AdoptPage / AdminInventory screens issue.
+CATALOGUE_QUERIES = [
+    'status=Available',
+    'type=Dog&status=Available',
+    'type=Cat&status=Available&sex=female',
+    'breed=Labrador',
+    'age_group=young&ordering=age',
+    'weight_band=5-15&ordering=-weight',
+    'ordering=name',
+]
+
+
+@benchmark('catalogue', help='Filtered, sorted pet catalogue pages and their query plans.', rows=(100000,))
+def run(out, rows):
+    client = APIClient()
+    for count in rows:
+        with rollback():
+            seed_pets(count)
+            analyze()
+            out.write(f'-- {count} pets --')
+
+            legacy_ms = best_of(lambda: client.get('/api/pets/'), repeat=1)
+            out.write(f'{"legacy full list (?paginate=false)":<45} {legacy_ms:9.1f} ms')
+
+            for query in CATALOGUE_QUERIES:
+                url = f'/api/pets/?{query}&page_size=50'
+                elapsed = best_of(lambda: client.get(url))
+                statements = captured_sql(lambda: client.get(url))
+                plan = explain_sql(statements[-1])
+                verdict = 'index' if plan_uses_index(plan) else 'FULL SCAN'
+                out.write(f'{query:<45} {elapsed:9.1f} ms  [{verdict}]')
+                for line in plan.splitlines():
+                    out.write(f'    {line}')
@@ -0,0 +1,46 @@
+from django.core.cache import cache
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from admin_inventory.catalogue_cache import (
+    catalogue_cache_stats, invalidate_catalogue, reset_catalogue_cache_stats,
+)
+from . import analyze, benchmark, best_of, count_queries, rollback, seed_pets
+
+# What anonymous AdoptPage visitors request.
+URLS = [
+    '/api/pets/?paginate=false',
+    '/api/pets/?status=Available&page_size=50',
+    '/api/pets/?type=Dog&status=Available&page_size=50',
+    '/api/pets/?age_group=young&ordering=age&page_size=50',
+]
+
+
+@benchmark('catalogue_cache', help='Anonymous pet list: uncached vs cached pages, hit/miss counters.',
+           rows=(1000, 10000))
+def run(out, rows):
+    # Correctness (hits run no queries, saves retire pages) is covered by
+    # admin_inventory/tests/test_catalogue_cache.py.
+    client = APIClient()
+    with override_settings(CATALOGUE_CACHE_TIMEOUT=300, CATALOGUE_CACHE_STATS=True):
+        for count in rows:
+            with rollback():
+                seed_pets(count)
+                analyze()
+                cache.clear()
+                reset_catalogue_cache_stats()
+                out.write(f'-- {count} pets --')
+                out.write(f'{"endpoint":<55} {"miss ms":>9} {"hit ms":>9}  hit queries')
+
+                for url in URLS:
+                    def miss():
+                        invalidate_catalogue()
+                        client.get(url)
+                    miss_ms = best_of(miss)
+                    client.get(url)
+                    hit_ms = best_of(lambda: client.get(url))
+                    queries = count_queries(lambda: client.get(url))
+                    out.write(f'{url:<55} {miss_ms:9.1f} {hit_ms:9.1f}  {queries}')
+
+                out.write(f'counters: {catalogue_cache_stats()}')
+
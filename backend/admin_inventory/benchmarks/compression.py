@@ -0,0 +1,47 @@
+import gzip
+
+from rest_framework.test import APIClient
+
+from admin_inventory.compression import brotli, brotli_compress
+from admin_inventory.models import Pet, recount_pending_requests
+
+from . import benchmark, best_of, rollback, seed_applications, seed_pets
+
+URLS = ['/api/pets/?paginate=false', '/api/applications/?paginate=false']
+GZIP_LEVELS = (1, 4, 6, 9)
+BROTLI_QUALITIES = (1, 4, 6, 9, 11)
+
+
+def gzip_compress(data, level):
+    return gzip.compress(data, compresslevel=level)
+
+
+@benchmark('compression', help='gzip / Brotli on the full list payloads: bytes saved and CPU per level.',
+           rows=(1000, 10000))
+def run(out, rows):
+    # What the middleware compresses and skips is covered by
+    # admin_inventory/tests/test_compression.py.
+    if brotli is None:
+        out.write('brotli is not installed: responses are gzipped only, Brotli rows are skipped.')
+
+    client = APIClient()
+    for count in rows:
+        with rollback():
+            seed_pets(count)
+            seed_applications(count)
+            recount_pending_requests(Pet.objects.values('id'))
+            out.write(f'-- {count} rows --')
+
+            for url in URLS:
+                body = client.get(url, HTTP_ACCEPT_ENCODING='identity').content
+                out.write(f'{url}: {len(body)} bytes')
+                out.write(f'  {"codec":<10} {"bytes":>10} {"saved":>7} {"ms":>8} {"MB/s":>8}')
+                codecs = [(f'gzip {level}', gzip_compress, level) for level in GZIP_LEVELS]
+                if brotli is not None:
+                    codecs += [(f'br {quality}', brotli_compress, quality) for quality in BROTLI_QUALITIES]
+                for label, compress, level in codecs:
+                    size = len(compress(body, level))
+                    ms = best_of(lambda: compress(body, level), repeat=3)
+                    out.write(f'  {label:<10} {size:10} {1 - size / len(body):6.1%} {ms:8.1f} '
+                              f'{len(body) / 1e6 / (ms / 1000):8.1f}')
+
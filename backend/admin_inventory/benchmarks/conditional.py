@@ -0,0 +1,38 @@
+from rest_framework.test import APIClient
+
+from admin_inventory.models import Pet, recount_pending_requests
+
+from . import analyze, benchmark, best_of, count_queries, rollback, seed_applications, seed_pets
+
+# What AdoptPage, AdminInventory and AdminStats poll.
+URLS = [
+    '/api/pets/?paginate=false',
+    '/api/pets/?status=Available&page_size=50',
+    '/api/applications/?paginate=false',
+    '/api/stats/summary/',
+    '/api/adoption-trends/?granularity=day',
+]
+
+
+@benchmark('conditional_get', help='Full response vs 304 Not Modified for the polled list endpoints.',
+           rows=(1000, 10000))
+def run(out, rows):
+    # 304s and their invalidation are covered by admin_inventory/tests/test_conditional.py.
+    client = APIClient()
+    for count in rows:
+        with rollback():
+            seed_pets(count)
+            seed_applications(count)
+            recount_pending_requests(Pet.objects.values('id'))
+            analyze()
+            out.write(f'-- {count} pets / applications --')
+            out.write(f'{"endpoint":<45} {"200 ms":>9} {"304 ms":>9} {"bytes":>10}  queries')
+
+            for url in URLS:
+                response = client.get(url)
+                etag = response.get('ETag')
+                full_ms = best_of(lambda: client.get(url))
+                cached_ms = best_of(lambda: client.get(url, HTTP_IF_NONE_MATCH=etag))
+                queries = count_queries(lambda: client.get(url, HTTP_IF_NONE_MATCH=etag))
+                out.write(f'{url:<45} {full_ms:9.1f} {cached_ms:9.1f} {len(response.content):10}  {queries}')
+
@@ -0,0 +1,63 @@
+from django.contrib.auth.models import User
+
+from admin_inventory.models import FosterPet, FosterProfile
+from admin_inventory.serializers import FosterProfileSerializer
+
+from . import benchmark, best_of, count_queries, rollback
+
+
+def replace_all(profile, pets_data):
+    """What FosterProfileSerializer.update used to do: drop every row and re-create them one by one."""
+    profile.current_fosters.all().delete()
+    for pet_data in pets_data:
+        pet_data = {key: value for key, value in pet_data.items() if key != 'id'}
+        FosterPet.objects.create(profile=profile, **pet_data)
+
+
+def edited_payload(profile):
+    """A typical profile save: every pet sent back, one renamed, one removed, one added."""
+    pets = FosterProfileSerializer(profile).data['currentFosters']
+    pets = [dict(pet) for pet in pets]
+    pets[0]['name'] = 'Renamed'
+    pets.pop()
+    pets.append({'name': 'New foster', 'type': 'Cat', 'breed': 'Puspin', 'age': '3 Months'})
+    return pets
+
+
+class LegacyFosterProfileSerializer(FosterProfileSerializer):
+    def sync_current_fosters(self, instance, pets_data):
+        replace_all(instance, pets_data)
+
+
+def save_profile(serializer_class, profile, payload):
+    """The whole PUT /api/profile/ save: profile fields, user and fosters."""
+    profile = FosterProfile.objects.select_related('user').prefetch_related('current_fosters').get(pk=profile.pk)
+    serializer = serializer_class(profile, data={'currentFosters': payload}, partial=True)
+    serializer.is_valid(raise_exception=True)
+    serializer.save()
+
+
+@benchmark('fosters', help='Saving a foster profile: delete and re-create vs diffed nested update.',
+           rows=(5, 50, 500))
+def run(out, rows):
+    out.write(f'{"fosters":>8}{"before queries":>16}{"before ms":>11}{"after queries":>15}{"after ms":>10}')
+    for count in rows:
+        with rollback():
+            user = User.objects.create(username='foster-bench', password='!')
+            profile = FosterProfile.objects.create(user=user)
+            FosterPet.objects.bulk_create([
+                FosterPet(profile=profile, name=f'Foster {i}', type='Dog', breed='Aspin', age='2 Years')
+                for i in range(count)
+            ])
+            payload = edited_payload(profile)
+
+            results = []
+            for serializer_class in (LegacyFosterProfileSerializer, FosterProfileSerializer):
+                def run_once():
+                    with rollback():
+                        save_profile(serializer_class, profile, payload)
+                queries = count_queries(run_once)
+                results.append((queries, best_of(run_once)))
+
+            (before_q, before_ms), (after_q, after_ms) = results
+            out.write(f'{count:>8}{before_q:>16}{before_ms:>11.1f}{after_q:>15}{after_ms:>10.1f}')
@@ -0,0 +1,43 @@
+import io
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from admin_inventory.api import AdoptionRequestSerializer, PetSerializer
+from admin_inventory.models import AdoptionRequest, Pet
+from admin_inventory.parsers import FastJSONParser
+from admin_inventory.renderers import FastJSONRenderer, orjson
+
+from . import benchmark, best_of, rollback, seed_applications, seed_pets
+
+
+@benchmark('json_render', help='Stdlib JSONRenderer/JSONParser vs the orjson-backed ones on pet lists.',
+           rows=(1000, 10000, 100000))
+def run(out, rows):
+    if orjson is None:
+        out.write('orjson is not installed: FastJSONRenderer falls back to JSONRenderer.')
+
+    # Output parity with JSONRenderer is covered by admin_inventory/tests/test_renderers.py.
+    stdlib, fast = JSONRenderer(), FastJSONRenderer()
+
+    for count in rows:
+        with rollback():
+            seed_pets(count)
+            seed_applications(count)
+            pets = PetSerializer(Pet.objects.order_by('-id'), many=True).data
+            applications = AdoptionRequestSerializer(
+                AdoptionRequest.objects.select_related('pet').order_by('-id'), many=True
+            ).data
+
+        out.write(f'-- {count} rows --')
+        out.write(f'{"payload":<14} {"bytes":>10} {"json ms":>9} {"orjson ms":>9}  {"parse json":>10} {"parse orjson":>12}')
+        for label, data in (('pets', pets), ('applications', applications)):
+            body = fast.render(data)
+            repeat = 3 if count < 100000 else 1
+            render_ms = best_of(lambda: stdlib.render(data), repeat=repeat)
+            fast_ms = best_of(lambda: fast.render(data), repeat=repeat)
+            parse_ms = best_of(lambda: JSONParser().parse(io.BytesIO(body)), repeat=repeat)
+            fast_parse_ms = best_of(lambda: FastJSONParser().parse(io.BytesIO(body)), repeat=repeat)
+            out.write(f'{label:<14} {len(body):10} {render_ms:9.1f} {fast_ms:9.1f}  '
+                      f'{parse_ms:10.1f} {fast_parse_ms:12.1f}')
+
@@ -0,0 +1,38 @@
+import time
+
+from django.db import transaction
+
+from admin_inventory.models import AdoptionRequest
+from admin_inventory.purge import purge_requests
+
+from . import benchmark, rollback, seed_applications, seed_pets
+
+
+@benchmark('purge', help='Deleting every adoption request: one queryset.delete() vs batched purge.',
+           rows=(10000, 100000))
+def run(out, rows):
+    out.write(f'{"requests":>9}{"delete() ms":>13}{"purge ms":>10}{"longest batch ms":>18}')
+    for count in rows:
+        with rollback():
+            seed_pets(max(count // 10, 1))
+            seed_applications(count)
+
+            # The old DELETE-all: one transaction holding the write lock throughout.
+            with rollback():
+                start = time.perf_counter()
+                with transaction.atomic():
+                    AdoptionRequest.objects.all().delete()
+                legacy_ms = (time.perf_counter() - start) * 1000
+
+            batches = []
+            last = [time.perf_counter()]
+
+            def progress(deleted, total):
+                now = time.perf_counter()
+                batches.append((now - last[0]) * 1000)
+                last[0] = now
+
+            start = time.perf_counter()
+            purge_requests(progress=progress)
+            purge_ms = (time.perf_counter() - start) * 1000
+            out.write(f'{count:>9}{legacy_ms:>13.0f}{purge_ms:>10.0f}{max(batches):>18.1f}')
@@ -0,0 +1,50 @@
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from admin_inventory.api import AdoptionRequestSerializer, PetSerializer
+from admin_inventory.models import AdoptionRequest, Pet, recount_pending_requests
+from admin_inventory.read_serializers import AdoptionRequestReadSerializer, PetReadSerializer
+
+from . import benchmark, best_of, rollback, seed_applications, seed_pets
+
+# (label, ModelSerializer, ValuesSerializer, queryset)
+PAIRS = [
+    ('pets', PetSerializer, PetReadSerializer, lambda: Pet.objects.order_by('-id')),
+    ('applications', AdoptionRequestSerializer, AdoptionRequestReadSerializer,
+     lambda: AdoptionRequest.objects.select_related('pet').order_by('-id')),
+]
+
+
+def seed_variety():
+    """Images, thumbnails, adopted pets and NULL weights, so every branch gets timed."""
+    now = timezone.now()
+    Pet.objects.filter(id__lte=20).update(image='pet_images/rex.jpg', image_thumbnails={
+        'source': 'pet_images/rex.jpg', 'digest': 'abc',
+        'sizes': {'200': {'webp': 'pet_images/thumbs/abc/200.webp', 'jpeg': 'pet_images/thumbs/abc/200.jpeg'}},
+    })
+    Pet.objects.filter(id__gt=20, id__lte=40).update(status='Adopted', status_changed_at=now, adopted_at=now)
+    Pet.objects.filter(id__gt=40, id__lte=50).update(weight=None, name='Ñandú 🐶')
+    recount_pending_requests(Pet.objects.values('id'))
+
+
+@benchmark('read_serializers', help='ModelSerializer vs values()-based list serializers: throughput.',
+           rows=(1000, 10000, 100000))
+def run(out, rows):
+    # Output parity is covered by admin_inventory/tests/test_read_serializers.py.
+    factory = APIRequestFactory()
+    for count in rows:
+        with rollback():
+            seed_pets(count)
+            seed_applications(count)
+            seed_variety()
+            out.write(f'-- {count} rows --')
+            out.write(f'{"payload":<14} {"serializer ms":>14} {"values() ms":>12} {"speedup":>8}')
+
+            context = {'request': Request(factory.get('/api/pets/'))}
+            repeat = 3 if count < 100000 else 1
+            for label, serializer_class, read_class, queryset in PAIRS:
+                model_ms = best_of(lambda: serializer_class(queryset(), many=True, context=context).data, repeat)
+                values_ms = best_of(lambda: read_class(read_class.prepare(queryset()), context=context).data, repeat)
+                out.write(f'{label:<14} {model_ms:14.1f} {values_ms:12.1f} {model_ms / values_ms:7.1f}x')
+
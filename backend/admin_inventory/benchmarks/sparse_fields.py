@@ -0,0 +1,42 @@
+from rest_framework.test import APIClient
+
+from admin_inventory.models import Pet, recount_pending_requests
+
+from . import analyze, benchmark, best_of, rollback, seed_applications, seed_pets, seed_users
+
+# (full url, sparse query); tests/test_sparse_fields.py checks the same selections.
+CASES = [
+    ('/api/pets/?paginate=false', 'fields=id,name,status'),
+    ('/api/pets/?page_size=50&ordering=age', 'fields=name'),
+    ('/api/pets/?paginate=false', 'exclude=image,image_thumbnails'),
+    ('/api/applications/?paginate=false', 'fields=id,status'),
+    ('/api/applications/?page_size=50', 'fields=pet_name'),
+    ('/api/accounts/', 'fields=id,username'),
+    ('/api/user-profiles/', 'fields=id,phone'),
+]
+
+
+@benchmark('sparse_fields', help='Full lists vs ?fields= / ?exclude=: bytes and time.',
+           rows=(1000, 10000))
+def run(out, rows):
+    # Output and the columns read are covered by admin_inventory/tests/test_sparse_fields.py.
+    client = APIClient()
+    for count in rows:
+        with rollback():
+            seed_pets(count)
+            seed_applications(count)
+            seed_users(min(count, 2000))
+            recount_pending_requests(Pet.objects.values('id'))
+            analyze()
+            out.write(f'-- {count} rows --')
+            out.write(f'{"endpoint":<40} {"selection":<32} {"full ms":>8} {"sparse ms":>9} '
+                      f'{"full bytes":>10} {"sparse bytes":>12}')
+
+            for url, query in CASES:
+                sparse_url = f'{url}&{query}' if '?' in url else f'{url}?{query}'
+                full, sparse = client.get(url), client.get(sparse_url)
+                full_ms = best_of(lambda: client.get(url), repeat=3)
+                sparse_ms = best_of(lambda: client.get(sparse_url), repeat=3)
+                out.write(f'{url:<40} {query:<32} {full_ms:8.1f} {sparse_ms:9.1f} '
+                          f'{len(full.content):10} {len(sparse.content):12}')
+
@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import CommandError
+
+from . import benchmark
+
+DURATION = 3.0      # seconds per run
+WRITE_RATIO = 0.2   # share of operations that write
+PETS = 20000
+
+# (label, init_command, BEGIN statement). 'default' is what Django did before:
+# rollback journal, deferred transactions, Python's 5 s busy timeout. 'tuned'
+# takes init_command from the default database's OPTIONS.
+PROFILES = [
+    ('default', '', 'BEGIN'),
+    ('tuned', None, 'BEGIN IMMEDIATE'),
+]
+
+
+def _connect(path, init_command):
+    db = sqlite3.connect(path, timeout=5.0, isolation_level=None)
+    # Same as django.db.backends.sqlite3 does with OPTIONS['init_command'].
+    for statement in init_command.split(';'):
+        if statement := statement.strip():
+            db.execute(statement)
+    return db
+
+
+def _create(path, init_command):
+    db = _connect(path, init_command)
+    db.execute('CREATE TABLE pet (id INTEGER PRIMARY KEY, name TEXT, status TEXT, pending_requests INTEGER)')
+    db.execute('CREATE INDEX pet_status_idx ON pet (status, id)')
+    rng = random.Random(1)
+    db.executemany('INSERT INTO pet (name, status, pending_requests) VALUES (?, ?, 0)', [
+        (f'Pet {i}', rng.choice(('Available', 'Pending', 'Adopted'))) for i in range(PETS)
+    ])
+    db.close()
+
+
+def _worker(path, init_command, begin, deadline, seed, results):
+    rng = random.Random(seed)
+    db = _connect(path, init_command)
+    reads = writes = errors = 0
+    while time.time() < deadline:
+        try:
+            if rng.random() < WRITE_RATIO:
+                # Read-then-write in one transaction, like Model.save() inside atomic().
+                pet_id = rng.randint(1, PETS)
+                db.execute(begin)
+                try:
+                    db.execute('SELECT pending_requests FROM pet WHERE id = ?', (pet_id,)).fetchone()
+                    db.execute('UPDATE pet SET pending_requests = pending_requests + 1 WHERE id = ?', (pet_id,))
+                    db.execute('COMMIT')
+                except sqlite3.Error:
+                    db.execute('ROLLBACK')
+                    raise
+                writes += 1
+            else:
+                status = rng.choice(('Available', 'Pending', 'Adopted'))
+                db.execute('SELECT id, name FROM pet WHERE status = ? ORDER BY id DESC LIMIT 50', (status,)).fetchall()
+                reads += 1
+        except sqlite3.OperationalError:
+            # "database is locked"
+            errors += 1
+    db.close()
+    results.put((reads, writes, errors))
+
+
+@benchmark('sqlite_load', help='Concurrent read/write throughput on a SQLite file, default vs tuned settings.',
+           rows=(1, 4, 8))
+def run(out, rows):
+    """`rows` is the list of worker process counts."""
+    database = settings.DATABASES['default']
+    if database['ENGINE'] != 'django.db.backends.sqlite3':
+        raise CommandError('sqlite_load compares SQLite settings; run it with DB_ENGINE=sqlite3.')
+    ctx = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+    out.write(f'{"profile":<9}{"workers":>8}{"reads/s":>10}{"writes/s":>10}{"locked errors":>15}')
+    for label, init_command, begin in PROFILES:
+        if init_command is None:
+            init_command = database['OPTIONS'].get('init_command', '')
+        for workers in rows:
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'load.sqlite3')
+                _create(path, init_command)
+                results = ctx.Queue()
+                deadline = time.time() + DURATION
+                processes = [
+                    ctx.Process(target=_worker, args=(path, init_command, begin, deadline, seed, results))
+                    for seed in range(workers)
+                ]
+                for process in processes:
+                    process.start()
+                totals = [results.get() for _ in processes]
+                for process in processes:
+                    process.join()
+            reads, writes, errors = (sum(column) for column in zip(*totals))
+            out.write(f'{label:<9}{workers:>8}{reads / DURATION:>10.0f}{writes / DURATION:>10.0f}{errors:>15}')
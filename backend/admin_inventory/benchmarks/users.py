@@ -0,0 +1,30 @@
+from rest_framework.test import APIClient
+
+from . import benchmark, best_of, rollback, seed_users
+
+# (label, before: what the old viewsets effectively returned, after: the filtered lookup)
+LOOKUPS = [
+    ('accounts ?username=', '/api/accounts/', '/api/accounts/?username=user{n}'),
+    ('accounts by-username', '/api/accounts/', '/api/accounts/by-username/user{n}/'),
+    ('user-profiles ?user=', '/api/user-profiles/', '/api/user-profiles/?user={id}'),
+]
+
+
+@benchmark('user_lookup', help='Response size and latency of user/profile lookups, full table vs filtered.',
+           rows=(50000,))
+def run(out, rows):
+    client = APIClient()
+    for count in rows:
+        with rollback():
+            users = seed_users(count)
+            target = users[len(users) // 2]
+            n = len(users) // 2
+            out.write(f'-- {count} users --')
+            out.write(f'{"lookup":<24}{"before bytes":>14}{"before ms":>11}{"after bytes":>13}{"after ms":>10}')
+            for label, before_url, after_url in LOOKUPS:
+                after_url = after_url.format(n=n, id=target.pk)
+                before_bytes = len(client.get(before_url).content)
+                before_ms = best_of(lambda: client.get(before_url), repeat=1)
+                after_bytes = len(client.get(after_url).content)
+                after_ms = best_of(lambda: client.get(after_url))
+                out.write(f'{label:<24}{before_bytes:>14}{before_ms:>11.1f}{after_bytes:>13}{after_ms:>10.1f}')
@@ -0,0 +1,130 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+
+CATALOGUE_CACHE_PREFIX = 'catalogue'
+VERSION_KEY = f'{CATALOGUE_CACHE_PREFIX}:version'
+HITS_KEY = f'{CATALOGUE_CACHE_PREFIX}:hits'
+MISSES_KEY = f'{CATALOGUE_CACHE_PREFIX}:misses'
+
+# Response headers stored with a cached page and replayed on a hit.
+CACHED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+def _increment(key, start=1):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Not set yet, or evicted.
+        cache.add(key, start, timeout=None)
+        return cache.get(key, start)
+
+
+def catalogue_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Start from the clock rather than 1, so a version lost to eviction can't
+        # come back and make pages cached under it reachable again.
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate_catalogue():
+    """Bumps the version; every page cached under the old one is never read again."""
+    _increment(VERSION_KEY, start=time.time_ns())
+
+
+def _count(key):
+    # Off by default: incr() is a cache round trip on every request.
+    if getattr(settings, 'CATALOGUE_CACHE_STATS', False):
+        _increment(key)
+
+
+def catalogue_cache_stats():
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    lookups = hits + misses
+    return {
+        'enabled': getattr(settings, 'CATALOGUE_CACHE_STATS', False),
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / lookups, 4) if lookups else None,
+        'version': cache.get(VERSION_KEY),
+        'backend': settings.CACHES['default']['BACKEND'].rsplit('.', 1)[-1],
+    }
+
+
+def reset_catalogue_cache_stats():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
+
+
+def normalized_query(request):
+    """
+    The query string with keys sorted and blank parameters dropped, so
+    ?status=Available&type=Dog, ?type=Dog&status=Available and
+    ?type=Dog&status=Available&breed= share one cache entry.
+    """
+    params = []
+    for key, values in sorted(request.query_params.lists()):
+        values = [value for value in values if value.strip()]
+        if values:
+            params.append((key, values))
+    return params
+
+
+def catalogue_cache_key(request):
+    # Host and scheme are in the key because pagination links and image URLs are absolute.
+    key = repr((
+        request.build_absolute_uri(request.path),
+        normalized_query(request),
+        getattr(request, 'accepted_media_type', None),
+    ))
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return f'{CATALOGUE_CACHE_PREFIX}:{catalogue_version()}:{digest}'
+
+
+class CachedCatalogueMixin:
+    """
+    Serves anonymous list() requests from Django's cache. Pages are stored
+    rendered, so a hit costs no queries and no serialization. Saves and deletes of
+    Pet and AdoptionRequest bump the catalogue version (admin_inventory.signals),
+    which retires every cached page at once; CATALOGUE_CACHE_TIMEOUT bounds how
+    long an entry lives otherwise; 0 turns the cache off. Hits and misses are
+    only counted with CATALOGUE_CACHE_STATS on.
+    """
+
+    def list(self, request, *args, **kwargs):
+        timeout = getattr(settings, 'CATALOGUE_CACHE_TIMEOUT', 300)
+        if not timeout or request.method != 'GET' or request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+
+        key = catalogue_cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            _count(HITS_KEY)
+            response = get_conditional_response(request, etag=cached['headers'].get('ETag'))
+            if response is None:
+                response = HttpResponse(cached['content'])
+            for header, value in cached['headers'].items():
+                if response.status_code == 200 or header == 'ETag':
+                    response[header] = value
+            response['X-Cache'] = 'HIT'
+            return response
+
+        _count(MISSES_KEY)
+        response = super().list(request, *args, **kwargs)
+        response['X-Cache'] = 'MISS'
+        if response.status_code == 200:
+            response.add_post_render_callback(lambda rendered: self.store_page(key, rendered, timeout))
+        return response
+
+    def store_page(self, key, response, timeout):
+        cache.set(key, {
+            'content': response.content,
+            'headers': {name: response[name] for name in CACHED_HEADERS if response.has_header(name)},
+        }, timeout)
@@ -0,0 +1,105 @@
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # optional: without it responses are only ever gzipped
+    brotli = None
+
+# Content types worth compressing. Images (other than SVG), video, archives and
+# fonts are already compressed and come out the same size or larger.
+COMPRESSIBLE_TYPES = (
+    'text/', 'application/json', 'application/javascript', 'application/xml', 'image/svg+xml',
+)
+COMPRESSIBLE_SUFFIXES = ('+json', '+xml')
+
+
+def brotli_compress(data, quality):
+    return brotli.compress(data, quality=quality, mode=brotli.MODE_TEXT)
+
+
+def available_encodings():
+    """The codings this install can produce: gzip always, br with the brotli package."""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def accepted_encodings(header):
+    """Accept-Encoding as {coding: q}; 'identity;q=0' style refusals come out as 0."""
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(header, preferred):
+    """First of `preferred` the client accepts with the highest q, or None."""
+    accepted = accepted_encodings(header)
+    best, best_q = None, 0.0
+    for coding in preferred:
+        q = accepted.get(coding, accepted.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def is_compressible(content_type):
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    return media_type.startswith(COMPRESSIBLE_TYPES) or media_type.endswith(COMPRESSIBLE_SUFFIXES)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Django's GZipMiddleware plus Brotli, for response bodies, mainly the full
+    pet and application lists. Brotli is used when the brotli package is
+    installed and the client prefers or equally accepts it
+    (COMPRESSION_ENCODINGS sets the order); gzip is left to GZipMiddleware, so
+    it keeps the random-length header padding Django adds against BREACH.
+
+    Left alone: bodies under COMPRESSION_MIN_SIZE bytes, streaming responses,
+    responses that already have a Content-Encoding, and content types that are
+    already compressed (images, archives). A strong ETag becomes weak, as in
+    GZipMiddleware, so If-None-Match still matches the compressed copy.
+    """
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if not is_compressible(response.get('Content-Type', '')):
+            return response
+        if len(response.content) < getattr(settings, 'COMPRESSION_MIN_SIZE', 1024):
+            return response
+
+        available = available_encodings()
+        preferred = [coding for coding in getattr(settings, 'COMPRESSION_ENCODINGS', ('br', 'gzip'))
+                     if coding in available]
+        coding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), preferred)
+        if coding == 'gzip':
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if coding != 'br':
+            return response
+        compressed = brotli_compress(response.content, getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 4))
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers['Content-Length'] = str(len(compressed))
+        response.headers['Content-Encoding'] = 'br'
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        return response
@@ -0,0 +1,90 @@
+import hashlib
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+
+def collection_version(queryset, *timestamp_fields):
+    """
+    (latest timestamp, row count) of a queryset in one aggregate query. Any
+    insert or update moves the timestamp and any delete moves the count, so the
+    pair changes whenever the rows behind a response do.
+    """
+    aggregates = {f'latest_{i}': Max(field) for i, field in enumerate(timestamp_fields)}
+    row = queryset.order_by().aggregate(rows=Count('pk'), **aggregates)
+    stamps = [row[name] for name in aggregates if row[name] is not None]
+    return (max(stamps) if stamps else None), row['rows']
+
+
+def make_etag(request, *parts):
+    """
+    Strong ETag over the version parts plus everything else that shapes the
+    body: path and query string (filters, cursor) and the negotiated format.
+    """
+    key = repr((request.get_full_path(), getattr(request, 'accepted_media_type', None)) + parts)
+    return quote_etag(hashlib.sha1(key.encode()).hexdigest())
+
+
+def conditional_response(request, respond, etag, last_modified=None, check_last_modified=True):
+    """
+    Returns 304 Not Modified (or 412 for a failed If-Match) without calling
+    `respond` when the client's validators are current; otherwise the response
+    from `respond()` with ETag / Last-Modified set.
+
+    Pass check_last_modified=False for collections: deleting a row doesn't move
+    max(updated_at), so If-Modified-Since alone can't tell the list changed.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+    not_modified = get_conditional_response(
+        request, etag=etag, last_modified=timestamp if check_last_modified else None
+    )
+    if not_modified is not None:
+        if not_modified.status_code == 304:
+            not_modified['ETag'] = etag
+        return not_modified
+    response = respond()
+    if response.status_code == 200:
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified for list() and retrieve() of a ModelViewSet. The version
+    query runs before pagination and serialization, so an unchanged resource
+    answers 304 after a single aggregate query.
+
+    version_fields: timestamps whose maximum versions a response. Override
+    get_version() when the body also depends on other tables.
+    """
+    version_fields = ('updated_at',)
+
+    def get_version(self, queryset):
+        return collection_version(queryset, *self.version_fields)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        latest, rows = self.get_version(queryset)
+        return conditional_response(
+            request,
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+            make_etag(request, latest, rows),
+            latest,
+            check_last_modified=False,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        respond = lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs)
+        try:
+            queryset = self.get_queryset().filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+            latest, rows = self.get_version(queryset)
+        except (TypeError, ValueError, DjangoValidationError):
+            rows = 0
+        if not rows:
+            return respond()  # 404 as usual
+        return conditional_response(request, respond, make_etag(request, latest), latest)
@@ -0,0 +1,96 @@
+from django.db import transaction
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from .models import Favorite, Pet
+
+
+def favorite_pet_id(item):
+    """Pet id out of one legacy favorites entry: {"pet": {"id": 1, ...}}, {"id": 1} or 1."""
+    if isinstance(item, dict):
+        item = item.get('pet', item)
+        if isinstance(item, dict):
+            item = item.get('id')
+    if isinstance(item, bool):
+        return None
+    try:
+        return int(item)
+    except (TypeError, ValueError):
+        return None
+
+
+def favorites_prefetch(lookup='user__favorite_pets'):
+    """Prefetch for LegacyFavoritesField, so profile lists don't query per row."""
+    return Prefetch(lookup, queryset=Favorite.objects.select_related('pet').order_by('created_at', 'id'))
+
+
+def add_favorite(user, pet_id):
+    """One INSERT; favoriting a pet twice is a no-op thanks to the unique constraint."""
+    Favorite.objects.bulk_create([Favorite(user=user, pet_id=pet_id)], ignore_conflicts=True)
+
+
+def remove_favorite(user, pet_id):
+    """One DELETE; returns how many rows went (0 or 1)."""
+    deleted, _ = Favorite.objects.filter(user=user, pet_id=pet_id).delete()
+    return deleted
+
+
+@transaction.atomic
+def set_favorites(user, pet_ids):
+    """
+    Makes the user's favorites exactly `pet_ids`, writing only the difference.
+    Ids of pets that don't exist are ignored, as the old JSON list never
+    checked them either.
+    """
+    wanted = set(Pet.objects.filter(pk__in=set(pet_ids)).values_list('id', flat=True))
+    current = set(Favorite.objects.filter(user=user).values_list('pet_id', flat=True))
+    if current - wanted:
+        Favorite.objects.filter(user=user, pet_id__in=current - wanted).delete()
+    added = [pet_id for pet_id in dict.fromkeys(pet_ids) if pet_id in wanted - current]
+    if added:
+        Favorite.objects.bulk_create(
+            [Favorite(user=user, pet_id=pet_id) for pet_id in added], ignore_conflicts=True
+        )
+    # Drop a stale favorites_prefetch() result so the response shows the new list.
+    getattr(user, '_prefetched_objects_cache', {}).pop('favorite_pets', None)
+
+
+class LegacyFavoritesField(serializers.Field):
+    """
+    The profile's `favorites` in the shape the JSON column used to have,
+    [{"pet": {"id", "name", "image"}}, ...], read from the Favorite table.
+    Writing a list replaces the user's favorites; /api/favorites/<pet_id>/
+    adds or removes a single pet without sending the list back.
+    """
+    default_error_messages = {
+        'not_a_list': 'Expected a list of favorites.',
+        'invalid_item': 'Each favorite needs a pet id.',
+    }
+
+    def get_attribute(self, instance):
+        user = instance.user
+        if 'favorite_pets' in getattr(user, '_prefetched_objects_cache', {}):
+            return user.favorite_pets.all()
+        return user.favorite_pets.select_related('pet').order_by('created_at', 'id')
+
+    def to_representation(self, favorites):
+        request = self.context.get('request')
+        items = []
+        for favorite in favorites:
+            pet = favorite.pet
+            image = None
+            if pet.image:
+                image = request.build_absolute_uri(pet.image.url) if request is not None else pet.image.url
+            items.append({'pet': {'id': pet.id, 'name': pet.name, 'image': image}})
+        return items
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            self.fail('not_a_list')
+        pet_ids = []
+        for item in data:
+            pet_id = favorite_pet_id(item)
+            if pet_id is None:
+                self.fail('invalid_item')
+            pet_ids.append(pet_id)
+        return pet_ids
@@ -0,0 +1,97 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = 'fields'
+EXCLUDE_PARAM = 'exclude'
+
+
+def _split(value):
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+def restrict_columns(queryset, columns):
+    """
+    queryset.only(*columns), keeping only the select_related joins some column
+    reads through ('pet__name' keeps the pet join, 'pet' alone is just pet_id).
+    """
+    columns = set(columns)
+    joined = queryset.query.select_related
+    if isinstance(joined, dict):
+        kept = [relation for relation in joined if any(c.startswith(f'{relation}__') for c in columns)]
+        queryset = queryset.select_related(None)
+        if kept:
+            queryset = queryset.select_related(*kept)
+            columns.update(kept)
+    return queryset.only(*columns)
+
+
+class SparseFieldsMixin:
+    """
+    Sparse fieldsets for GET requests:
+
+        ?fields=id,name,status        only these fields
+        ?exclude=image,image_thumbnails  every field but these
+
+    Unknown names are a 400. The selection is pushed down into the SELECT
+    (queryset.only(), or values() for ValuesListMixin lists), so columns nobody
+    asked for are neither read nor serialized.
+
+    sparse_field_columns maps output fields whose source isn't a single column
+    (properties, method fields, related lookups) to the model paths they read.
+    """
+    sparse_field_columns = {}
+
+    def get_sparse_fields(self):
+        """Selected field names in serializer order, or None for all of them."""
+        if hasattr(self, '_sparse_fields'):
+            return self._sparse_fields
+        self._sparse_fields = None
+        params = self.request.query_params
+        if self.request.method in SAFE_METHODS and (params.get(FIELDS_PARAM) or params.get(EXCLUDE_PARAM)):
+            self._serializer_fields = self.get_serializer_class()().fields
+            available = list(self._serializer_fields)
+            requested = _split(params.get(FIELDS_PARAM, ''))
+            excluded = _split(params.get(EXCLUDE_PARAM, ''))
+            for param, names in ((FIELDS_PARAM, requested), (EXCLUDE_PARAM, excluded)):
+                unknown = [name for name in names if name not in available]
+                if unknown:
+                    raise ValidationError({param: [
+                        f'Unknown field(s): {", ".join(unknown)}. Choose from: {", ".join(available)}.'
+                    ]})
+            self._sparse_fields = [
+                name for name in available
+                if (not requested or name in requested) and name not in excluded
+            ]
+        return self._sparse_fields
+
+    def get_sparse_columns(self, fields):
+        """Model paths the given fields read, or None if one needs the whole object."""
+        serializer_fields = self._serializer_fields
+        columns = {'pk'}
+        for name in fields:
+            if name in self.sparse_field_columns:
+                columns.update(self.sparse_field_columns[name])
+            elif serializer_fields[name].source == '*':
+                return None
+            else:
+                columns.add(serializer_fields[name].source.replace('.', '__'))
+        return columns
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_sparse_fields()
+        if fields is not None and self.action in ('list', 'retrieve'):
+            columns = self.get_sparse_columns(fields)
+            if columns is not None:
+                queryset = restrict_columns(queryset, columns)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            target = getattr(serializer, 'child', serializer)
+            for name in list(target.fields):
+                if name not in fields:
+                    target.fields.pop(name)
+        return serializer
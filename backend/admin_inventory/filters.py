@@ -0,0 +1,161 @@
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .models import Pet, PET_SEX_CHOICES
+from .pagination import is_truthy, normalize_ordering, order_by_keyset
+
+# --- Catalogue buckets (same boundaries as the AdoptPage.jsx filters) ---
+AGE_GROUPS = {
+    'young': (None, 2),     # Young (0-2)
+    'adult': (3, 8),        # Adult (3-8)
+    'senior': (9, None),    # Senior (9+)
+}
+
+WEIGHT_BANDS = {
+    'under-5': (None, 5, False),   # Under 5 kg (upper bound exclusive)
+    '5-15': (5, 15, True),         # 5 - 15 kg
+    '16-30': (16, 30, True),       # 16 - 30 kg
+    'over-30': (30, None, False),  # Over 30 kg (lower bound exclusive)
+}
+
+
+def age_group_q(group):
+    low, high = AGE_GROUPS[group]
+    q = Q()
+    if low is not None:
+        q &= Q(age__gte=low)
+    if high is not None:
+        q &= Q(age__lte=high)
+    return q
+
+
+def weight_band_q(band):
+    low, high, inclusive = WEIGHT_BANDS[band]
+    q = Q()
+    if low is not None:
+        q &= Q(weight__gte=low) if inclusive else Q(weight__gt=low)
+    if high is not None:
+        q &= Q(weight__lte=high) if inclusive else Q(weight__lt=high)
+    return q
+
+
+def _split(value):
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+def _choice_values(param, raw, choices):
+    """Maps 'dog,CAT' onto the stored choice values ('Dog', 'Cat')."""
+    lookup = {value.lower(): value for value, _ in choices}
+    values = []
+    for part in _split(raw):
+        if part.lower() not in lookup:
+            raise ValidationError({param: [f'"{part}" is not a valid choice.']})
+        values.append(lookup[part.lower()])
+    return values
+
+
+def _number(param, raw, cast):
+    try:
+        return cast(raw)
+    except (TypeError, ValueError):
+        raise ValidationError({param: ['A valid number is required.']})
+
+
+def _bucket_q(param, raw, buckets, to_q):
+    q = Q()
+    for part in _split(raw):
+        key = part.lower()
+        if key not in buckets:
+            raise ValidationError({param: [f'"{part}" is not a valid choice.']})
+        q |= to_q(key)
+    return q
+
+
+# ---------------------
+# PET CATALOGUE FILTER
+# ---------------------
+
+class PetCatalogueFilter(BaseFilterBackend):
+    """
+    Server-side filtering and sorting for the pet catalogue, so the browser only
+    receives the rows it shows.
+
+    Filters (comma separated values are OR-ed):
+        ?type=Dog,Cat          ?status=Available      ?sex=female
+        ?breed=Labrador        ?age_min=1&age_max=5   ?age_group=young,senior
+        ?weight_min=5&weight_max=15                   ?weight_band=5-15,over-30
+        ?search=lab            (name or breed contains, case-insensitive)
+        ?has_pending=true      (has at least one Pending application)
+
+    Sorting:
+        ?ordering=age, ?ordering=-weight ...  (only ORDERING_FIELDS, ties broken by id)
+
+    type/status/sex/breed/age/weight lookups are covered by the indexes declared
+    on Pet.Meta.
+    """
+    ORDERING_FIELDS = ('id', 'name', 'breed', 'age', 'weight')
+    ordering_param = 'ordering'
+
+    def get_ordering(self, request, queryset, view):
+        raw = request.query_params.get(self.ordering_param)
+        if not raw:
+            return None
+        ordering = []
+        for term in _split(raw):
+            if term.lstrip('-') not in self.ORDERING_FIELDS:
+                raise ValidationError({
+                    self.ordering_param: [
+                        f'"{term}" is not sortable. Choose from: {", ".join(self.ORDERING_FIELDS)}.'
+                    ]
+                })
+            ordering.append(term)
+        return tuple(ordering)
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+
+        if params.get('type'):
+            queryset = queryset.filter(type__in=_choice_values('type', params['type'], Pet.TYPE_CHOICES))
+        if params.get('status'):
+            queryset = queryset.filter(status__in=_choice_values('status', params['status'], Pet.STATUS_CHOICES))
+        if params.get('sex'):
+            queryset = queryset.filter(sex__in=_choice_values('sex', params['sex'], PET_SEX_CHOICES))
+        if params.get('breed'):
+            queryset = queryset.filter(breed__in=_split(params['breed']))
+        if params.get('has_pending'):
+            if is_truthy(params['has_pending']):
+                queryset = queryset.filter(pending_requests__gt=0)
+            else:
+                queryset = queryset.filter(pending_requests=0)
+
+        if params.get('age_min'):
+            queryset = queryset.filter(age__gte=_number('age_min', params['age_min'], int))
+        if params.get('age_max'):
+            queryset = queryset.filter(age__lte=_number('age_max', params['age_max'], int))
+        if params.get('age_group'):
+            queryset = queryset.filter(_bucket_q('age_group', params['age_group'], AGE_GROUPS, age_group_q))
+
+        if params.get('weight_min'):
+            queryset = queryset.filter(weight__gte=_number('weight_min', params['weight_min'], float))
+        if params.get('weight_max'):
+            queryset = queryset.filter(weight__lte=_number('weight_max', params['weight_max'], float))
+        if params.get('weight_band'):
+            queryset = queryset.filter(_bucket_q('weight_band', params['weight_band'], WEIGHT_BANDS, weight_band_q))
+
+        if params.get('search'):
+            term = params['search'].strip()
+            queryset = queryset.filter(Q(name__icontains=term) | Q(breed__icontains=term))
+
+        ordering = self.get_ordering(request, queryset, view)
+        if ordering:
+            queryset = order_by_keyset(queryset, normalize_ordering(ordering))
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        names = ('type', 'status', 'sex', 'breed', 'has_pending', 'age_min', 'age_max', 'age_group',
+                 'weight_min', 'weight_max', 'weight_band', 'search', self.ordering_param)
+        return [
+            {'name': name, 'required': False, 'in': 'query', 'schema': {'type': 'string'}}
+            for name in names
+        ]
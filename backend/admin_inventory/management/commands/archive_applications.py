@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from admin_inventory.archive import archive_closed_requests, closed_requests
+from admin_inventory.purge import PURGE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = ('Moves Approved/Rejected adoption requests closed more than N days ago into the archive '
+            'table. Meant to run daily from cron.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than-days', type=int, default=None,
+                            help='Age in days (default: settings.ARCHIVE_CLOSED_REQUESTS_AFTER_DAYS).')
+        parser.add_argument('--batch-size', type=int, default=PURGE_BATCH_SIZE)
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Seconds to wait between batches so other writers get the database.')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows would move.')
+
+    def handle(self, *args, **options):
+        days = options['older_than_days']
+        if days is None:
+            days = settings.ARCHIVE_CLOSED_REQUESTS_AFTER_DAYS
+        if days < 0:
+            raise CommandError('--older-than-days must not be negative.')
+        if options['batch_size'] <= 0:
+            raise CommandError('--batch-size must be positive.')
+
+        if options['dry_run']:
+            self.stdout.write(f'{closed_requests(days).count()} closed adoption requests would be archived.')
+            return
+
+        def progress(moved, total):
+            percent = 100 * moved / total if total else 100
+            self.stdout.write(f'  archived {moved}/{total} ({percent:.1f}%)')
+
+        moved = archive_closed_requests(days, batch_size=options['batch_size'], progress=progress,
+                                        pause=options['pause'])
+        self.stdout.write(self.style.SUCCESS(f'Archived {moved} adoption requests closed over {days} days ago.'))
@@ -0,0 +1,42 @@
+import importlib
+import pkgutil
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings, setup_databases, teardown_databases
+
+from admin_inventory import benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Runs admin_inventory performance benchmarks against a throwaway test database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', help='Benchmarks to run (default: list them).')
+        parser.add_argument('--rows', nargs='+', type=int,
+                            help='Row counts to benchmark instead of the defaults.')
+
+    def handle(self, *args, **options):
+        for module in pkgutil.iter_modules(benchmarks.__path__):
+            importlib.import_module(f'{benchmarks.__name__}.{module.name}')
+
+        names = options['names']
+        if not names:
+            for name, func in sorted(benchmarks.BENCHMARKS.items()):
+                self.stdout.write(f'{name:<20} {func.help}')
+            return
+
+        unknown = [name for name in names if name not in benchmarks.BENCHMARKS]
+        if unknown:
+            raise CommandError(f'Unknown benchmark(s): {", ".join(unknown)}')
+
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            # Benchmarks measure queries and serialization, so anonymous catalogue
+            # pages must not come from the response cache (catalogue_cache turns it on).
+            with override_settings(CATALOGUE_CACHE_TIMEOUT=0):
+                for name in names:
+                    func = benchmarks.BENCHMARKS[name]
+                    self.stdout.write(self.style.MIGRATE_HEADING(f'== {name} =='))
+                    func(self.stdout, options['rows'] or func.default_rows)
+        finally:
+            teardown_databases(old_config, verbosity=0)
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from admin_inventory.thumbnails import IMAGE_FIELDS, generate_thumbnails, needs_thumbnails
+
+
+class Command(BaseCommand):
+    help = 'Creates missing thumbnails for existing pet and profile images.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true',
+                            help='Re-render the thumbnails of every image, replacing existing files.')
+
+    def handle(self, *args, **options):
+        force = options['force']
+        for model, (image_field, thumbnails_field) in IMAGE_FIELDS.items():
+            generated = failed = 0
+            rows = (
+                model.objects.exclude(Q(**{f'{image_field}__isnull': True}) | Q(**{image_field: ''}))
+                .only('pk', image_field, thumbnails_field)
+                .order_by('pk')
+            )
+            for instance in rows.iterator(chunk_size=500):
+                if not force and not needs_thumbnails(instance, image_field, thumbnails_field):
+                    continue
+                try:
+                    generate_thumbnails(model, instance.pk, image_field, thumbnails_field, force=force)
+                    generated += 1
+                except (OSError, ValueError) as exc:
+                    # Missing or unreadable originals shouldn't stop the backfill.
+                    failed += 1
+                    self.stderr.write(f'{model.__name__} {instance.pk}: {exc}')
+            self.stdout.write(f'{model.__name__}: {generated} generated, {failed} failed')
@@ -0,0 +1,52 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from admin_inventory.models import AdoptionRequest
+from admin_inventory.purge import PURGE_BATCH_SIZE, jsonl_sink, open_archive, purge_requests
+
+
+class Command(BaseCommand):
+    help = 'Deletes adoption requests in small batches, optionally archiving them to a .jsonl.gz file first.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--status', action='append', choices=[value for value, _ in AdoptionRequest.STATUS_CHOICES],
+                            help='Only purge requests with this status (repeatable).')
+        parser.add_argument('--before', help='Only purge requests created before this date (YYYY-MM-DD).')
+        parser.add_argument('--batch-size', type=int, default=PURGE_BATCH_SIZE)
+        parser.add_argument('--archive', metavar='PATH', help='Write the purged rows to this gzip JSON-lines file.')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Seconds to wait between batches so other writers get the database.')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows would go.')
+
+    def handle(self, *args, **options):
+        queryset = AdoptionRequest.objects.all()
+        if options['status']:
+            queryset = queryset.filter(status__in=options['status'])
+        if options['before']:
+            try:
+                day = datetime.date.fromisoformat(options['before'])
+            except ValueError:
+                raise CommandError('--before must be a date like 2024-01-31.')
+            start = timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+            queryset = queryset.filter(created_at__lt=start)
+        if options['batch_size'] <= 0:
+            raise CommandError('--batch-size must be positive.')
+
+        if options['dry_run']:
+            self.stdout.write(f'{queryset.count()} adoption requests would be purged.')
+            return
+
+        def progress(deleted, total):
+            percent = 100 * deleted / total if total else 100
+            self.stdout.write(f'  deleted {deleted}/{total} ({percent:.1f}%)')
+
+        kwargs = {'batch_size': options['batch_size'], 'progress': progress, 'pause': options['pause']}
+        if options['archive']:
+            with open_archive(options['archive']) as archive:
+                deleted = purge_requests(queryset, sink=jsonl_sink(archive), **kwargs)
+            self.stdout.write(self.style.SUCCESS(f'Purged {deleted} adoption requests, archived to {options["archive"]}.'))
+        else:
+            deleted = purge_requests(queryset, **kwargs)
+            self.stdout.write(self.style.SUCCESS(f'Purged {deleted} adoption requests.'))
@@ -0,0 +1,100 @@
+import operator
+from functools import reduce
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, IntegerField, Q, Value, When
+
+from .filters import AGE_GROUPS, age_group_q, weight_band_q
+from .models import Pet, PET_SEX_CHOICES, UserProfile
+
+MATCH_CACHE_PREFIX = 'pet-matches'
+
+# "Under 5 kg" / "5 - 15 kg" ... as sent by the AdoptPage preferences modal.
+WEIGHT_PREFERENCES = {
+    'under5kg': 'under-5',
+    '5-15kg': '5-15',
+    '16-30kg': '16-30',
+    'over30kg': 'over-30',
+}
+
+
+def compile_preference(preference):
+    """
+    Turns one free-form preference ("Dog", "Female", "Young (0-2)", "5 - 15 kg",
+    "Labrador") into (key, Q). Mirrors matchesPreference() in AdoptPage.jsx.
+    Returns None for preferences no pet can match (e.g. "Rabbit").
+    """
+    text = str(preference).strip().lower()
+    if not text:
+        return None
+    first_word = text.split(' ')[0]
+
+    types = {value.lower(): value for value, _ in Pet.TYPE_CHOICES}
+    for word in (text, first_word):
+        if word in types:
+            return f'type:{types[word]}', Q(type=types[word])
+
+    sexes = {value.lower(): value for value, _ in PET_SEX_CHOICES}
+    for word in (text, first_word):
+        if word in sexes:
+            return f'sex:{sexes[word]}', Q(sex=sexes[word])
+
+    band = WEIGHT_PREFERENCES.get(text.replace(' ', ''))
+    if band:
+        return f'weight:{band}', weight_band_q(band)
+
+    for group in AGE_GROUPS:
+        if group in text:
+            return f'age:{group}', age_group_q(group)
+
+    return f'breed:{text}', Q(breed__iexact=text)
+
+
+def compile_preferences(preferences):
+    """Compiles a preferences list into a de-duplicated list of Q predicates."""
+    compiled = {}
+    for preference in preferences or []:
+        result = compile_preference(preference)
+        if result is not None:
+            key, q = result
+            compiled.setdefault(key, q)
+    return list(compiled.values())
+
+
+def _cache_key(user_id):
+    return f'{MATCH_CACHE_PREFIX}:{user_id}'
+
+
+def get_match_predicates(user):
+    """Compiled predicates for a user's saved preferences, cached per user."""
+    key = _cache_key(user.pk)
+    predicates = cache.get(key)
+    if predicates is None:
+        preferences = (
+            UserProfile.objects.filter(user=user)
+            .values_list('preferences', flat=True)
+            .first()
+        )
+        predicates = compile_preferences(preferences)
+        cache.set(key, predicates, getattr(settings, 'MATCH_CACHE_TIMEOUT', 3600))
+    return predicates
+
+
+def invalidate_match_predicates(user_id):
+    cache.delete(_cache_key(user_id))
+
+
+def rank_matches(queryset, predicates):
+    """
+    Keeps pets matching at least one predicate and annotates `match_score`
+    with how many they match. The OR filter lets the catalogue indexes narrow
+    the rows before the score is computed.
+    """
+    if not predicates:
+        return queryset.none().annotate(match_score=Value(0, output_field=IntegerField()))
+    score = reduce(operator.add, [
+        Case(When(q, then=Value(1)), default=Value(0), output_field=IntegerField())
+        for q in predicates
+    ])
+    return queryset.filter(reduce(operator.or_, predicates)).annotate(match_score=score)
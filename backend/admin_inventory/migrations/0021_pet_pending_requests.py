@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:24
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_pending_requests(apps, schema_editor):
+    Pet = apps.get_model('admin_inventory', 'Pet')
+    AdoptionRequest = apps.get_model('admin_inventory', 'AdoptionRequest')
+    pending = (
+        AdoptionRequest.objects.filter(pet=OuterRef('pk'), status='Pending')
+        .order_by()
+        .values('pet')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    Pet.objects.update(pending_requests=Coalesce(Subquery(pending), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_inventory', '0020_pet_catalogue_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pet',
+            name='pending_requests',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_pending_requests, migrations.RunPython.noop),
+    ]
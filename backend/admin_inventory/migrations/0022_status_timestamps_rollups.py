@@ -0,0 +1,73 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:31
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+
+
+def backfill_request_rollups(apps, schema_editor):
+    """
+    Applications already know when they were submitted, so the "received"
+    history can be rebuilt. Earlier status changes and adoptions were never
+    timestamped and start being tracked from this migration on.
+    """
+    AdoptionRequest = apps.get_model('admin_inventory', 'AdoptionRequest')
+    StatusRollup = apps.get_model('admin_inventory', 'StatusRollup')
+
+    AdoptionRequest.objects.filter(status='Pending').update(status_changed_at=F('created_at'))
+    received = (
+        AdoptionRequest.objects.order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values('day')
+        .annotate(total=Count('id'))
+    )
+    StatusRollup.objects.bulk_create([
+        StatusRollup(kind='request', status='Pending', day=row['day'], count=row['total'])
+        for row in received
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_inventory', '0021_pet_pending_requests'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pet',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='pet',
+            name='status_changed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='pet',
+            name='adopted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='adoptionrequest',
+            name='status_changed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='StatusRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('pet', 'Pet'), ('request', 'Adoption request')], max_length=10)),
+                ('status', models.CharField(max_length=10)),
+                ('day', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'status', 'day'), name='status_rollup_unique_day')],
+            },
+        ),
+        migrations.RunPython(backfill_request_rollups, migrations.RunPython.noop),
+    ]
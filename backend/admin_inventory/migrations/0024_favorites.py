@@ -0,0 +1,84 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Intentionally frozen copy of admin_inventory.favorites.favorite_pet_id as it was
+# when this migration was written: migrations must not import app code that can
+# change later. Don't "deduplicate" it.
+def favorite_pet_id(item):
+    """Pet id out of one legacy entry: {"pet": {"id": 1, ...}}, {"id": 1} or 1."""
+    if isinstance(item, dict):
+        item = item.get('pet', item)
+        if isinstance(item, dict):
+            item = item.get('id')
+    try:
+        return int(item)
+    except (TypeError, ValueError):
+        return None
+
+
+def copy_favorites(apps, schema_editor):
+    UserProfile = apps.get_model('admin_inventory', 'UserProfile')
+    Favorite = apps.get_model('admin_inventory', 'Favorite')
+    Pet = apps.get_model('admin_inventory', 'Pet')
+    pet_ids = set(Pet.objects.values_list('id', flat=True))
+
+    rows = []
+    profiles = UserProfile.objects.exclude(favorites=[]).values_list('user_id', 'favorites')
+    for user_id, favorites in profiles.iterator():
+        seen = set()
+        for item in favorites if isinstance(favorites, list) else []:
+            pet_id = favorite_pet_id(item)
+            # Entries for pets deleted since they were favorited are dropped.
+            if pet_id in pet_ids and pet_id not in seen:
+                seen.add(pet_id)
+                rows.append(Favorite(user_id=user_id, pet_id=pet_id))
+    Favorite.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+def restore_favorites(apps, schema_editor):
+    UserProfile = apps.get_model('admin_inventory', 'UserProfile')
+    Favorite = apps.get_model('admin_inventory', 'Favorite')
+
+    by_user = {}
+    favorites = Favorite.objects.select_related('pet').order_by('created_at', 'id')
+    for favorite in favorites.iterator():
+        pet = favorite.pet
+        image = settings.MEDIA_URL + pet.image.name if pet.image else None
+        by_user.setdefault(favorite.user_id, []).append(
+            {'pet': {'id': pet.id, 'name': pet.name, 'image': image}}
+        )
+    for user_id, items in by_user.items():
+        UserProfile.objects.filter(user_id=user_id).update(favorites=items)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_inventory', '0023_image_thumbnails'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Favorite',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('pet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='favorited_by', to='admin_inventory.pet')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='favorite_pets', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'created_at', 'id'], name='favorite_user_created_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'pet'), name='favorite_unique_user_pet')],
+            },
+        ),
+        migrations.RunPython(copy_favorites, restore_favorites),
+        migrations.RemoveField(
+            model_name='userprofile',
+            name='favorites',
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_inventory', '0024_favorites'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedAdoptionRequest',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('pet_name', models.CharField(blank=True, max_length=100)),
+                ('requester_name', models.CharField(max_length=100)),
+                ('email', models.EmailField(blank=True, default='', max_length=100)),
+                ('status', models.CharField(choices=[('Pending', 'Pending'), ('Approved', 'Approved'), ('Rejected', 'Rejected')], max_length=10)),
+                ('created_at', models.DateTimeField()),
+                ('status_changed_at', models.DateTimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('pet', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_requests', to='admin_inventory.pet')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['created_at', 'id'], name='archived_request_created_idx'), models.Index(fields=['status', 'created_at', 'id'], name='archived_request_status_idx'), models.Index(fields=['email', 'created_at', 'id'], name='archived_request_email_idx'), models.Index(fields=['requester_name', 'created_at', 'id'], name='archived_request_name_idx')],
+            },
+        ),
+    ]
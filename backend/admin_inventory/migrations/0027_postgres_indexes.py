@@ -0,0 +1,44 @@
+from django.db import migrations
+
+# PostgreSQL-only indexes. They can't be declared on Model.Meta because SQLite has
+# no GIN indexes, so they are created here and skipped on every other database.
+POSTGRES_INDEXES = (
+    # preferences @> '["Dog"]' (preferences__contains) - e.g. finding the users to
+    # tell about a new pet - without reading every profile's JSON.
+    ('userprofile_preferences_gin', 'userprofile',
+     'USING gin ("preferences" jsonb_path_ops)'),
+    # ?search= runs name/breed__icontains, which Django sends as
+    # UPPER(col) LIKE UPPER('%term%'); a trigram index on UPPER(col) serves it.
+    ('pet_name_trgm_idx', 'pet', 'USING gin (UPPER("name") gin_trgm_ops)'),
+    ('pet_breed_trgm_idx', 'pet', 'USING gin (UPPER("breed") gin_trgm_ops)'),
+)
+
+
+def create_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, model_name, definition in POSTGRES_INDEXES:
+        table = apps.get_model('admin_inventory', model_name)._meta.db_table
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} '
+            f'ON {schema_editor.quote_name(table)} {definition}'
+        )
+
+
+def drop_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _, _ in POSTGRES_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_inventory', '0026_adoption_request_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_postgres_indexes, drop_postgres_indexes),
+    ]
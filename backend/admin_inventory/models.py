@@ -1,6 +1,8 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone 
 
@@ -21,6 +23,8 @@ class Pet(models.Model):
     type = models.CharField(max_length=10, choices=TYPE_CHOICES)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='Available')
     image = models.ImageField(upload_to='pet_images/', null=True, blank=True)
+    # Paths of the resized copies of `image`, filled in by admin_inventory.thumbnails
+    image_thumbnails = models.JSONField(default=dict, blank=True, editable=False)
     
     sex = models.CharField(
         max_length=10,
@@ -30,9 +34,101 @@ class Pet(models.Model):
     
     weight = models.FloatField(null=True, blank=True)
 
+    # Denormalized count of Pending AdoptionRequests, kept in sync by AdoptionRequest.save()
+    # and the post_delete signal below, so the catalogue doesn't need the applications list.
+    pending_requests = models.PositiveIntegerField(default=0, editable=False)
+
+    # Set by save() so adoption trends can be bucketed by date (see StatusRollup)
+    created_at = models.DateTimeField(auto_now_add=True)
+    status_changed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    adopted_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # Moves on every write; queryset.update() callers set it themselves.
+    # Feeds the ETag / Last-Modified of the pet endpoints (admin_inventory/conditional.py).
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Composite indexes for the catalogue filters (admin_inventory/filters.py).
+        # The trailing id keeps "newest first" pages inside the index.
+        indexes = [
+            models.Index(fields=['type', 'status', 'id'], name='pet_type_status_idx'),
+            models.Index(fields=['status', 'id'], name='pet_status_idx'),
+            models.Index(fields=['sex', 'status', 'id'], name='pet_sex_status_idx'),
+            models.Index(fields=['breed', 'id'], name='pet_breed_idx'),
+            models.Index(fields=['age', 'id'], name='pet_age_idx'),
+            models.Index(fields=['weight', 'id'], name='pet_weight_idx'),
+            models.Index(fields=['name', 'id'], name='pet_name_idx'),
+            # ?has_pending=true: only pets with open applications are indexed.
+            models.Index(fields=['id'], condition=models.Q(pending_requests__gt=0), name='pet_pending_idx'),
+            models.Index(fields=['updated_at'], name='pet_updated_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
+    @property
+    def has_pending_request(self):
+        return self.pending_requests > 0
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._stored_status = instance.__dict__.get('status')
+        return instance
+
+    def save(self, *args, **kwargs):
+        _add_update_fields(kwargs, 'updated_at')
+        changed = getattr(self, '_stored_status', None) != self.status
+        if changed:
+            now = timezone.now()
+            self.status_changed_at = now
+            if self.status == 'Adopted':
+                self.adopted_at = now
+            _add_update_fields(kwargs, 'status_changed_at', 'adopted_at')
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if changed:
+                StatusRollup.record('pet', self.status, self.status_changed_at)
+        self._stored_status = self.status
+
+
+def _add_update_fields(kwargs, *names):
+    # save(update_fields=[...]) must also write the timestamps save() just set.
+    if kwargs.get('update_fields') is not None:
+        kwargs['update_fields'] = set(kwargs['update_fields']) | set(names)
+
+
+def adjust_pending_requests(pet_id, delta):
+    """Atomically moves Pet.pending_requests by delta (never below zero)."""
+    if not pet_id or not delta:
+        return
+    pets = Pet.objects.filter(pk=pet_id)
+    if delta < 0:
+        pets = pets.filter(pending_requests__gte=-delta)
+    pets.update(pending_requests=F('pending_requests') + delta, updated_at=timezone.now())
+
+
+def recount_pending_requests(pet_ids):
+    """
+    Recomputes Pet.pending_requests for the given pets in one UPDATE, for
+    queryset.update() callers that bypass AdoptionRequest.save().
+    """
+    pending = (
+        AdoptionRequest.objects.filter(pet=OuterRef('pk'), status='Pending')
+        .order_by()
+        .values('pet')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    # Only pets whose count actually changes get a new updated_at.
+    recount = Coalesce(Subquery(pending), Value(0))
+    (
+        Pet.objects.filter(pk__in=pet_ids)
+        .alias(recount=recount)
+        .exclude(pending_requests=F('recount'))
+        .update(pending_requests=recount, updated_at=timezone.now())
+    )
+
+
 class AdoptionRequest(models.Model):
     STATUS_CHOICES = (
         ('Pending', 'Pending'),
@@ -44,10 +140,126 @@ class AdoptionRequest(models.Model):
     email = models.EmailField(max_length=100, default='', blank=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='Pending')
     created_at = models.DateTimeField(auto_now_add=True)
+    status_changed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Every filter on /api/applications/ is followed by the keyset order
+        # (-created_at, -id), so pages are read straight out of these indexes.
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='request_created_idx'),
+            models.Index(fields=['status', 'created_at', 'id'], name='request_status_idx'),
+            models.Index(fields=['email', 'created_at', 'id'], name='request_email_idx'),
+            models.Index(fields=['requester_name', 'created_at', 'id'], name='request_requester_idx'),
+            # Pending requests per pet (pending counter recounts, auto-rejecting rivals)
+            models.Index(fields=['pet', 'status'], name='request_pet_status_idx'),
+            models.Index(fields=['updated_at'], name='request_updated_idx'),
+        ]
 
     def __str__(self):
         return f"{self.requester_name} - {self.pet.name} ({self.status})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what was stored so save() can tell what changed.
+        instance._stored_pending_pet = instance._pending_pet_id()
+        instance._stored_status = instance.__dict__.get('status')
+        return instance
+
+    def _pending_pet_id(self):
+        if 'status' in self.get_deferred_fields() or 'pet_id' in self.get_deferred_fields():
+            return None
+        return self.pet_id if self.status == 'Pending' else None
+
+    def save(self, *args, **kwargs):
+        _add_update_fields(kwargs, 'updated_at')
+        previous = getattr(self, '_stored_pending_pet', None)
+        status_changed = getattr(self, '_stored_status', None) != self.status
+        if status_changed:
+            self.status_changed_at = timezone.now()
+            _add_update_fields(kwargs, 'status_changed_at')
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            current = self._pending_pet_id()
+            if previous != current:
+                adjust_pending_requests(previous, -1)
+                adjust_pending_requests(current, 1)
+            if status_changed:
+                StatusRollup.record('request', self.status, self.status_changed_at)
+        self._stored_pending_pet = current
+        self._stored_status = self.status
+
+
+@receiver(post_delete, sender=AdoptionRequest)
+def release_pending_request(sender, instance, **kwargs):
+    # Runs inside the delete's transaction, for single and queryset deletes alike.
+    adjust_pending_requests(getattr(instance, '_stored_pending_pet', None), -1)
+
+
+class ArchivedAdoptionRequest(models.Model):
+    """
+    Approved/Rejected adoption requests moved out of AdoptionRequest by
+    `manage.py archive_applications`, so the live table only holds requests
+    that still matter day to day. Keeps the original id.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    pet = models.ForeignKey(Pet, related_name='archived_requests', null=True, on_delete=models.SET_NULL)
+    pet_name = models.CharField(max_length=100, blank=True)
+    requester_name = models.CharField(max_length=100)
+    email = models.EmailField(max_length=100, default='', blank=True)
+    status = models.CharField(max_length=10, choices=AdoptionRequest.STATUS_CHOICES)
+    created_at = models.DateTimeField()
+    status_changed_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='archived_request_created_idx'),
+            models.Index(fields=['status', 'created_at', 'id'], name='archived_request_status_idx'),
+            models.Index(fields=['email', 'created_at', 'id'], name='archived_request_email_idx'),
+            models.Index(fields=['requester_name', 'created_at', 'id'], name='archived_request_name_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.requester_name} - {self.pet_name} ({self.status}, archived)"
+
+
+class StatusRollup(models.Model):
+    """
+    Daily count of status transitions, e.g. how many pets became Adopted on a
+    given day. Updated incrementally by Pet.save() / AdoptionRequest.save(), so
+    adoption trends are read from here instead of scanning Pet.
+    """
+    KIND_CHOICES = (('pet', 'Pet'), ('request', 'Adoption request'))
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    status = models.CharField(max_length=10)
+    day = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'status', 'day'], name='status_rollup_unique_day'),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.kind} {self.status}: {self.count}"
+
+    @classmethod
+    def record(cls, kind, status, when=None, count=1):
+        """Adds `count` transitions into `status` on the day of `when`."""
+        day = timezone.localdate(when or timezone.now())
+        rows = cls.objects.filter(kind=kind, status=status, day=day)
+        if rows.update(count=F('count') + count):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(kind=kind, status=status, day=day, count=count)
+        except IntegrityError:
+            # Another writer created today's row first.
+            rows.update(count=F('count') + count)
+
 # --- User Extension Models ---
 
 
@@ -64,13 +276,33 @@ class Account(models.Model):
 
     def save(self, *args, **kwargs):
         # ADMIN LOGIC: Set role to 'admin' if superuser/staff
-        if self.user.is_superuser or self.user.is_staff:
+        if is_admin_user(self.user):
             self.role = 'admin'
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.user.username} - {self.role}"
 
+
+# User fields that decide the account role
+ROLE_FIELDS = {'is_staff', 'is_superuser'}
+
+
+def is_admin_user(user):
+    return user.is_superuser or user.is_staff
+
+
+def sync_account_role(user):
+    """
+    Promotes the user's Account to 'admin' once they are staff or superuser,
+    the same rule Account.save applies. Writes only when the stored role
+    actually differs, and never touches the user's other related rows.
+    """
+    if not is_admin_user(user):
+        return 0
+    return Account.objects.filter(user=user).exclude(role='admin').update(role='admin')
+
+
 # --- Signal to ensure Account is created for every new User ---
 @receiver(post_save, sender=User)
 def create_user_account(sender, instance, created, **kwargs):
@@ -82,13 +314,16 @@ def create_user_account(sender, instance, created, **kwargs):
     #        Account.objects.create(user=instance, role=role)
         pass
 
+
 @receiver(post_save, sender=User)
-def save_user_account(sender, instance, **kwargs):
-    # This remains active to save existing objects and run the admin check.
-    if hasattr(instance, 'account'):
-        instance.account.save()
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
+def sync_admin_role(sender, instance, created, update_fields=None, **kwargs):
+    # Saves that can't have changed the staff flags (login's last_login, profile
+    # edits passing update_fields) don't touch the account at all, and regular
+    # users never need a write. Call sync_account_role() directly after
+    # queryset updates, which skip this signal.
+    if created or (update_fields is not None and not ROLE_FIELDS & set(update_fields)):
+        return
+    sync_account_role(instance)
 
 class FosterProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='foster_profile')
@@ -96,6 +331,7 @@ class FosterProfile(models.Model):
     address = models.CharField(max_length=255, blank=True)
     household = models.TextField(blank=True, help_text="Description of household")
     profile_image = models.ImageField(upload_to='profile_images/', blank=True, null=True)
+    profile_image_thumbnails = models.JSONField(default=dict, blank=True, editable=False)
     
     # Stats (Optional, based on your UI)
     fostered_count = models.IntegerField(default=0)
@@ -129,18 +365,40 @@ class UserProfile(models.Model):
     address = models.CharField(max_length=255, blank=True)
     household = models.TextField(blank=True)
     profile_image = models.ImageField(upload_to='profile_images/', blank=True, null=True)
+    profile_image_thumbnails = models.JSONField(default=dict, blank=True, editable=False)
 
-    # Optional — to match your UI
-    favorites = models.JSONField(default=list, blank=True)
-    
     # ⭐ ADDED: Field for user preferences (e.g., Cat-friendly, Small Dog)
     preferences = models.JSONField(default=list, blank=True)
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
+
+class Favorite(models.Model):
+    """
+    A pet a user has favorited. Replaces the JSON list that used to live on
+    UserProfile.favorites, so toggling one pet is a single INSERT or DELETE.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='favorite_pets')
+    pet = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name='favorited_by')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'pet'], name='favorite_unique_user_pet'),
+        ]
+        indexes = [
+            # The favorites list: one user's rows, newest first.
+            models.Index(fields=['user', 'created_at', 'id'], name='favorite_user_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} ♥ {self.pet.name}"
+
 # --- AUTO CREATE USER PROFILE ---
 @receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
-    if created:
+def create_user_profile(sender, instance, created, raw=False, **kwargs):
+    # Fixtures (loaddata) bring their own profile rows. Code may also create the
+    # profile before post_save runs; the lookup goes through the unique index.
+    if created and not raw:
         UserProfile.objects.get_or_create(user=instance)
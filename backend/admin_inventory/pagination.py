@@ -0,0 +1,302 @@
+import datetime
+import decimal
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+FALSE_VALUES = ('0', 'false', 'no', 'off')
+
+CURSOR_SALT = 'admin_inventory.pagination.cursor'
+
+
+def is_truthy(value):
+    return str(value).strip().lower() in TRUE_VALUES
+
+
+def normalize_ordering(ordering):
+    """
+    Returns the ordering as a tuple that always ends on the primary key, so
+    every row has a unique position (e.g. 'age' -> ('age', 'id')).
+    """
+    if isinstance(ordering, str):
+        ordering = (ordering,)
+    ordering = tuple(ordering)
+    if ordering[-1].lstrip('-') in ('id', 'pk'):
+        return ordering
+    tiebreak = '-id' if ordering[-1].startswith('-') else 'id'
+    return ordering + (tiebreak,)
+
+
+def _order_expression(field, nullable, reverse=False):
+    descending = field.startswith('-') != reverse
+    name = field.lstrip('-')
+    if not nullable:
+        return f'-{name}' if descending else name
+    # NULLs always sort after every value in the forward direction, on every backend.
+    nulls = {'nulls_first': True} if reverse else {'nulls_last': True}
+    if descending:
+        return F(name).desc(**nulls)
+    return F(name).asc(**nulls)
+
+
+def _after(field, value, nullable, reverse):
+    """Q for rows strictly after `value` on one key (before it when reverse)."""
+    name = field.lstrip('-')
+    lookup = 'lt' if field.startswith('-') != reverse else 'gt'
+    if not nullable:
+        return Q(**{f'{name}__{lookup}': value})
+    if not reverse:
+        if value is None:
+            return Q(pk__in=[])
+        return Q(**{f'{name}__{lookup}': value}) | Q(**{f'{name}__isnull': True})
+    if value is None:
+        return Q(**{f'{name}__isnull': False})
+    return Q(**{f'{name}__{lookup}': value})
+
+
+def _equal(field, value):
+    name = field.lstrip('-')
+    if value is None:
+        return Q(**{f'{name}__isnull': True})
+    return Q(**{name: value})
+
+
+def keyset_filter(ordering, position, nullable=(), reverse=False):
+    """
+    Builds the lexicographic "row comes after position" predicate:
+    (k1 > p1) OR (k1 = p1 AND k2 > p2) OR ...
+    """
+    condition = Q(pk__in=[])
+    equal_prefix = Q()
+    for field, value in zip(ordering, position):
+        is_nullable = field.lstrip('-') in nullable
+        condition |= equal_prefix & _after(field, value, is_nullable, reverse)
+        equal_prefix &= _equal(field, value)
+    return condition
+
+
+def nullable_fields(model, ordering):
+    names = set()
+    for field in ordering:
+        name = field.lstrip('-')
+        try:
+            if name != 'pk' and model._meta.get_field(name).null:
+                names.add(name)
+        except FieldDoesNotExist:
+            # Annotations such as match_score are never NULL.
+            continue
+    return names
+
+
+def order_by_keyset(queryset, ordering, reverse=False):
+    """Applies a keyset ordering, keeping NULLs last like the cursor filter expects."""
+    nullable = nullable_fields(queryset.model, ordering)
+    return queryset.order_by(*[
+        _order_expression(field, field.lstrip('-') in nullable, reverse)
+        for field in ordering
+    ])
+
+
+def _cursor_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+# ---------------------
+# KEYSET (CURSOR) PAGINATION
+# ---------------------
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination for the large admin_inventory lists.
+
+    Pages are fetched with `WHERE (sort key, id) < (last seen row)` instead of
+    OFFSET, so page 1000 costs the same as page 1, and sorting on non-unique
+    columns (age, weight, ...) stays exact because the id breaks ties. The
+    cursor is a signed, opaque token and stays valid while rows are added or
+    removed.
+
+    Query params:
+        ?cursor=...      opaque cursor taken from `next` / `previous`
+        ?page_size=N     page size (capped at API_MAX_PAGE_SIZE)
+        ?count=true      also return the total number of matching rows
+        ?paginate=false  opt out and get the plain list (legacy clients)
+
+    While API_PAGINATE_BY_DEFAULT is False, requests without any of the params
+    above keep getting the plain list, so older frontends still work. Endpoints
+    without legacy clients can set paginate_by_default = True.
+    """
+    page_size = getattr(settings, 'API_PAGE_SIZE', 50)
+    max_page_size = getattr(settings, 'API_MAX_PAGE_SIZE', 500)
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    paginate_query_param = 'paginate'
+    count_query_param = 'count'
+    ordering = '-id'
+    paginate_by_default = None  # None: follow settings.API_PAGINATE_BY_DEFAULT
+    invalid_cursor_message = 'Invalid cursor'
+
+    def is_requested(self, request):
+        params = request.query_params
+        flag = params.get(self.paginate_query_param)
+        if flag is not None and flag.strip().lower() in FALSE_VALUES:
+            return False
+        if flag is not None and is_truthy(flag):
+            return True
+        if self.cursor_query_param in params or self.page_size_query_param in params:
+            return True
+        if self.paginate_by_default is not None:
+            return self.paginate_by_default
+        return getattr(settings, 'API_PAGINATE_BY_DEFAULT', False)
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_ordering(self, request, queryset, view):
+        # A filter backend that exposes get_ordering (e.g. ?ordering=age) wins,
+        # then the view's own keyset column, e.g. '-created_at' for applications.
+        for backend in getattr(view, 'filter_backends', []):
+            if hasattr(backend, 'get_ordering'):
+                ordering = backend().get_ordering(request, queryset, view)
+                if ordering:
+                    return normalize_ordering(ordering)
+        return normalize_ordering(getattr(view, 'cursor_ordering', None) or self.ordering)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = signing.loads(encoded, salt=CURSOR_SALT)
+            position = list(payload['p'])
+            reverse = bool(payload.get('r', False))
+            ordering = tuple(payload['o'])
+        except (signing.BadSignature, KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if ordering != self.ordering or len(position) != len(ordering):
+            # The cursor was issued for a different sort order.
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        payload = {'o': list(self.ordering), 'p': position}
+        if reverse:
+            payload['r'] = 1
+        token = signing.dumps(payload, salt=CURSOR_SALT, compress=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def get_position(self, item):
+        position = []
+        for field in self.ordering:
+            name = field.lstrip('-')
+            if name == 'pk':
+                name = 'id'
+            value = item[name] if isinstance(item, dict) else getattr(item, name)
+            position.append(_cursor_value(value))
+        return position
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.count = None
+        if is_truthy(request.query_params.get(self.count_query_param, '')):
+            self.count = queryset.count()
+
+        cursor = self.decode_cursor(request)
+        position, reverse = cursor if cursor else (None, False)
+
+        nullable = nullable_fields(queryset.model, self.ordering)
+        queryset = order_by_keyset(queryset, self.ordering, reverse)
+        if position is not None:
+            queryset = queryset.filter(keyset_filter(self.ordering, position, nullable, reverse))
+
+        # Fetch one extra row to know whether another page follows.
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        page = results[:self.page_size]
+
+        if reverse:
+            page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = page
+        return page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+    def get_paginated_response(self, data):
+        payload = OrderedDict()
+        if self.count is not None:
+            payload['count'] = self.count
+        payload['next'] = self.get_next_link()
+        payload['previous'] = self.get_previous_link()
+        payload['results'] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'example': 123},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {'name': self.cursor_query_param, 'required': False, 'in': 'query',
+             'schema': {'type': 'string'}},
+            {'name': self.page_size_query_param, 'required': False, 'in': 'query',
+             'schema': {'type': 'integer'}},
+            {'name': self.count_query_param, 'required': False, 'in': 'query',
+             'schema': {'type': 'boolean'}},
+            {'name': self.paginate_query_param, 'required': False, 'in': 'query',
+             'schema': {'type': 'boolean'}},
+        ]
+
+
+class PagedKeysetPagination(KeysetPagination):
+    """KeysetPagination for endpoints that never returned a plain list, so they always page."""
+    paginate_by_default = True
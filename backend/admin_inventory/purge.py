@@ -0,0 +1,109 @@
+import gzip
+import json
+import time
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from django.dispatch import Signal
+
+from .models import AdoptionRequest, recount_pending_requests
+
+PURGE_BATCH_SIZE = 1000
+
+# Sent once per purged batch, inside its transaction, instead of post_delete for
+# every row: receivers get `pks` (the deleted ids) and `pet_ids` (pets whose
+# pending_requests changed). Cache invalidation listens to it in signals.py.
+requests_purged = Signal()
+
+ARCHIVE_FIELDS = (
+    'id', 'pet_id', 'pet__name', 'requester_name', 'email', 'status', 'created_at', 'status_changed_at',
+)
+
+
+def open_archive(path):
+    """A gzip'd JSON-lines file for jsonl_sink()."""
+    return gzip.open(path, 'wt', encoding='utf-8')
+
+
+def jsonl_sink(archive):
+    """purge_requests() sink writing each row as one JSON line to `archive`."""
+    def write(rows):
+        for row in rows:
+            archive.write(json.dumps(row, cls=DjangoJSONEncoder) + '\n')
+        archive.flush()
+    return write
+
+
+def delete_rows(model, pks, using='default'):
+    """
+    DELETE FROM <table> WHERE pk IN (pks), as one statement. queryset.delete()
+    would load every row to send pre/post_delete for each; callers send one
+    batch-level signal instead (requests_purged). Only for models no foreign
+    key points at, since nothing here collects cascades.
+    """
+    if not pks:
+        return 0
+    connection = connections[using]
+    table = connection.ops.quote_name(model._meta.db_table)
+    column = connection.ops.quote_name(model._meta.pk.column)
+    placeholders = ', '.join(['%s'] * len(pks))
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {table} WHERE {column} IN ({placeholders})', list(pks))
+        return cursor.rowcount
+
+
+def purge_requests(queryset=None, batch_size=PURGE_BATCH_SIZE, sink=None, progress=None, pause=0):
+    """
+    Deletes the adoption requests in `queryset` (all of them by default) in
+    primary key ranges of `batch_size`, one short transaction per range, so
+    SQLite's write lock is released between batches and other requests keep
+    going during a purge of millions of rows.
+
+    Each range is removed with a single DELETE (delete_rows) instead of
+    Model.delete()'s load-everything-then-signal path; nothing references
+    AdoptionRequest, so there are no cascades to collect. Pet.pending_requests
+    is recounted per batch here, and requests_purged stands in for post_delete
+    so the caches still hear about it.
+
+    sink:     callable(rows) given each batch as ARCHIVE_FIELDS dicts, in the
+              same transaction just before it is deleted (see jsonl_sink and
+              archive.archive_to_table).
+    progress: callable(deleted_so_far, total) called after every batch.
+    pause:    seconds to sleep between batches to leave room for other writers.
+
+    Returns the number of rows deleted.
+    """
+    if queryset is None:
+        queryset = AdoptionRequest.objects.all()
+    queryset = queryset.order_by().select_related(None)
+    total = queryset.count() if progress else None
+
+    deleted = 0
+    last_pk = 0
+    while True:
+        remaining = queryset.filter(pk__gt=last_pk)
+        upper = remaining.order_by('pk').values_list('pk', flat=True)[batch_size - 1:batch_size].first()
+        batch = remaining.filter(pk__lte=upper) if upper is not None else remaining
+
+        with transaction.atomic():
+            if sink is not None:
+                rows = list(batch.order_by('pk').values(*ARCHIVE_FIELDS))
+                sink(rows)
+            else:
+                rows = list(batch.order_by('pk').values('id', 'pet_id', 'status'))
+            pks = [row['id'] for row in rows]
+            pet_ids = {row['pet_id'] for row in rows if row['status'] == 'Pending'}
+            count = delete_rows(AdoptionRequest, pks, using=batch.db)
+            if pet_ids:
+                recount_pending_requests(pet_ids)
+            if count:
+                requests_purged.send(sender=AdoptionRequest, pks=pks, pet_ids=pet_ids)
+
+        deleted += count
+        if progress:
+            progress(deleted, total)
+        if upper is None:
+            return deleted
+        last_pk = upper
+        if pause:
+            time.sleep(pause)
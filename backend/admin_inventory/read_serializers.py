@@ -0,0 +1,172 @@
+from rest_framework import ISO_8601, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .fieldsets import SparseFieldsMixin
+from .models import Pet
+from .thumbnails import thumbnail_urls
+
+def datetime_formatter():
+    """
+    DateTimeField.to_representation with the timezone and output format looked
+    up once instead of for every value (ISO 8601 in the current timezone, 'Z'
+    for UTC). Naive values and non-ISO formats go through the DRF field itself.
+    """
+    field = serializers.DateTimeField()
+    timezone = field.default_timezone()
+    if timezone is None or str(api_settings.DATETIME_FORMAT).lower() != ISO_8601:
+        return field.to_representation
+
+    def to_representation(value):
+        if value is None:
+            return None
+        if value.utcoffset() is None:
+            return field.to_representation(value)
+        text = value.astimezone(timezone).isoformat()
+        return text[:-6] + 'Z' if text.endswith('+00:00') else text
+    return to_representation
+
+
+class ValuesSerializer:
+    """
+    Read-only stand-in for `ModelSerializer(queryset, many=True).data` on list
+    endpoints. Rows come from queryset.values(*columns) and are turned into dicts
+    by to_representation(), skipping model instances and the per-field
+    get_attribute / to_representation walk. The output must stay identical to
+    the ModelSerializer it replaces; tests/test_read_serializers.py checks
+    that.
+
+    `fields` maps each output field, in output order, to the column it is read
+    from; get_converters() supplies the ones that are not copied as they are.
+    Passing `fields=` (a ?fields= selection) keeps just those.
+    """
+    fields = {}
+
+    def __init__(self, rows, context=None, fields=None):
+        self.rows = rows
+        self.context = context or {}
+        self.datetime = datetime_formatter()
+        converters = self.get_converters()
+        self.plan = [
+            (name, column, converters.get(name))
+            for name, column in self.fields.items() if fields is None or name in fields
+        ]
+
+    @classmethod
+    def columns(cls, fields=None):
+        names = cls.fields if fields is None else [name for name in cls.fields if name in fields]
+        return list(dict.fromkeys(cls.fields[name] for name in names))
+
+    @classmethod
+    def prepare(cls, queryset, fields=None, extra=()):
+        return queryset.values(*dict.fromkeys([*cls.columns(fields), *extra]))
+
+    def get_converters(self):
+        return {}
+
+    def to_representation(self, row):
+        return {
+            name: row[column] if convert is None else convert(row[column])
+            for name, column, convert in self.plan
+        }
+
+    @property
+    def data(self):
+        return [self.to_representation(row) for row in self.rows]
+
+
+class PetReadSerializer(ValuesSerializer):
+    """PetSerializer output from Pet.objects.values()."""
+    fields = {
+        'id': 'id',
+        'has_pending_request': 'pending_requests',
+        'image_thumbnails': 'image_thumbnails',
+        'name': 'name',
+        'breed': 'breed',
+        'age': 'age',
+        'type': 'type',
+        'status': 'status',
+        'image': 'image',
+        'sex': 'sex',
+        'weight': 'weight',
+        'pending_requests': 'pending_requests',
+        'created_at': 'created_at',
+        'status_changed_at': 'status_changed_at',
+        'adopted_at': 'adopted_at',
+        'updated_at': 'updated_at',
+    }
+
+    def __init__(self, rows, context=None, fields=None):
+        self.request = (context or {}).get('request')
+        self.storage = Pet._meta.get_field('image').storage
+        super().__init__(rows, context, fields)
+
+    def image_url(self, name):
+        # ImageField.to_representation: absolute URL when there is a request.
+        if not name:
+            return None
+        url = self.storage.url(name)
+        return self.request.build_absolute_uri(url) if self.request is not None else url
+
+    def get_converters(self):
+        return {
+            'has_pending_request': lambda pending: pending > 0,
+            'image_thumbnails': lambda thumbnails: thumbnail_urls(thumbnails, self.storage, self.request),
+            'image': self.image_url,
+            'weight': lambda weight: None if weight is None else float(weight),
+            'created_at': self.datetime,
+            'status_changed_at': self.datetime,
+            'adopted_at': self.datetime,
+            'updated_at': self.datetime,
+        }
+
+
+class AdoptionRequestReadSerializer(ValuesSerializer):
+    """AdoptionRequestSerializer output; pet_name comes from the joined pet."""
+    fields = {
+        'id': 'id',
+        'pet': 'pet_id',
+        'pet_name': 'pet__name',
+        'requester_name': 'requester_name',
+        'email': 'email',
+        'status': 'status',
+        'created_at': 'created_at',
+    }
+
+    def get_converters(self):
+        return {'created_at': self.datetime}
+
+
+class ValuesListMixin(SparseFieldsMixin):
+    """
+    list() through `read_serializer_class` (a ValuesSerializer) instead of the
+    view's ModelSerializer. Filters, keyset pagination and ?ordering= work
+    unchanged, since they only add WHERE / ORDER BY / LIMIT to the values()
+    queryset. ?fields= / ?exclude= narrow the values() columns to the selected
+    fields plus whatever the keyset cursor is built from. Other actions keep
+    serializer_class.
+    """
+    read_serializer_class = None
+
+    def get_cursor_columns(self, queryset):
+        paginator = self.paginator
+        if paginator is None or not hasattr(paginator, 'get_ordering') or not paginator.is_requested(self.request):
+            return []
+        return [
+            'id' if column == 'pk' else column
+            for column in (field.lstrip('-') for field in paginator.get_ordering(self.request, queryset, self))
+        ]
+
+    def list(self, request, *args, **kwargs):
+        if self.read_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+        fields = self.get_sparse_fields()
+        queryset = self.filter_queryset(self.get_queryset())
+        extra = self.get_cursor_columns(queryset) if fields is not None else ()
+        queryset = self.read_serializer_class.prepare(queryset, fields, extra)
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else queryset
+        data = self.read_serializer_class(rows, context=self.get_serializer_context(), fields=fields).data
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
@@ -0,0 +1,91 @@
+import math
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional: without it the API renders with the stdlib json module
+    orjson = None
+
+# DRF's encoder turns what orjson can't (or formats differently) into JSON types:
+# datetimes ('...Z' for UTC), Decimals, lazy translation strings, querysets.
+_encode = JSONEncoder().default
+
+
+def _same_float(value):
+    """
+    Whether orjson writes `value` the way json.dumps does. Both print the
+    shortest round-tripping digits, but outside [1e-4, 1e16) Python uses an
+    exponent with a sign (1e-05, 1e+16) and orjson doesn't (0.00001, 1e16),
+    and orjson writes NaN and infinity as null where DRF raises ValueError.
+    """
+    return not value or 1e-4 <= abs(value) < 1e16
+
+
+# Leaves that can't hold a float; skipped without a trip round the loop below.
+_SCALARS = frozenset([str, int, bool, type(None)])
+
+
+def _has_other_floats(data):
+    """Whether any float in `data` fails _same_float()."""
+    stack, floats = [data], []
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            value = value.values()
+        elif isinstance(value, float):
+            floats.append(value)
+            continue
+        elif not isinstance(value, (list, tuple)):
+            continue
+        stack.extend([item for item in value if item.__class__ not in _SCALARS])
+    # One pass over all the floats at C speed instead of a check per float:
+    # NaN or infinity makes the sum non-finite.
+    magnitudes = list(map(abs, floats))
+    if not math.isfinite(sum(magnitudes)):
+        return True
+    magnitudes = list(filter(None, magnitudes))
+    return bool(magnitudes) and (min(magnitudes) < 1e-4 or max(magnitudes) >= 1e16)
+
+
+def _default(obj):
+    value = _encode(obj)
+    if isinstance(value, float) and not _same_float(value):
+        # Decimals come back as floats; make orjson give up so JSONRenderer renders it.
+        raise TypeError(f'{value!r} is rendered by JSONRenderer')
+    return value
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer on orjson when it is installed, several times faster on long
+    lists. Produces the same bytes as JSONRenderer for compact, non-ASCII-escaped
+    output (DRF's defaults); pretty-printed, ASCII-only or non-compact output,
+    data orjson rejects (e.g. ints wider than 64 bits) and data holding floats
+    orjson formats differently (exponent form, NaN, infinity) go through
+    JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+            or _has_other_floats(data)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=_default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same \u2028 / \u2029 escaping as JSONRenderer, so the output stays a strict JavaScript subset.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
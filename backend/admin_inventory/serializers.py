@@ -1,18 +1,30 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from .models import Pet, AdoptionRequest, FosterPet, FosterProfile, UserProfile
+from .matching import invalidate_match_predicates
+from .favorites import LegacyFavoritesField, set_favorites
+from .thumbnails import thumbnail_urls
 import base64
-from django.core.files.base import ContentFile
+import binascii
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.db import transaction
 import uuid
 
 # ---------------------
 # PET SERIALIZER
 # ---------------------
 class PetSerializer(serializers.ModelSerializer):
+    has_pending_request = serializers.BooleanField(read_only=True)
+    image_thumbnails = serializers.SerializerMethodField()
+
     class Meta:
         model = Pet
         fields = '__all__'
 
+    def get_image_thumbnails(self, obj):
+        return thumbnail_urls(obj.image_thumbnails, obj.image.storage, self.context.get('request'))
+
 
 # ---------------------
 # ADOPTION REQUEST SERIALIZER
@@ -62,16 +74,105 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         return user
 
 # Helper to handle Base64 images from React
+class DecodedImageFile(TemporaryUploadedFile):
+    """
+    Temporary file holding a decoded base64 image. Storage moves it into place
+    on save, and unlike multipart uploads nothing closes it at the end of the
+    request, so close it here instead of letting tempfile unlink a moved file.
+    """
+    def __del__(self):
+        self.close()
+
+
 class Base64ImageField(serializers.ImageField):
+    """
+    ImageField that also accepts "data:image/png;base64,..." strings.
+
+    The payload is decoded in chunks straight into a temporary file, so the
+    decoded image never sits in memory next to the request string, and its size
+    is worked out from the string length so oversized uploads are rejected
+    before anything is decoded. Regular multipart files go through unchanged
+    apart from the same size check.
+    """
+    CHUNK_SIZE = 64 * 1024  # base64 characters per decode step, must be a multiple of 4
+    EXTENSIONS = {'png': 'png', 'jpeg': 'jpg', 'jpg': 'jpg', 'gif': 'gif', 'webp': 'webp'}
+
+    default_error_messages = {
+        'invalid_base64': 'Invalid base64 image data.',
+        'max_size': 'Image is too large ({size} bytes). The limit is {max_size} bytes.',
+    }
+
+    def __init__(self, *args, max_size=None, **kwargs):
+        self.max_size = max_size
+        super().__init__(*args, **kwargs)
+
+    def get_max_size(self):
+        if self.max_size is not None:
+            return self.max_size
+        return settings.MAX_IMAGE_UPLOAD_SIZE
+
     def to_internal_value(self, data):
-        if isinstance(data, str) and data.startswith('data:image'):
-            # format: "data:image/png;base64,..."
-            format, imgstr = data.split(';base64,')
-            ext = format.split('/')[-1]
-            data = ContentFile(base64.b64decode(imgstr), name=f"{uuid.uuid4()}.{ext}")
+        if isinstance(data, str) and data.startswith('data:'):
+            data = self.decode_data_uri(data)
+        else:
+            size = getattr(data, 'size', None)
+            if size is not None and size > self.get_max_size():
+                self.fail('max_size', size=size, max_size=self.get_max_size())
         return super().to_internal_value(data)
 
+    def decode_data_uri(self, data):
+        # format: "data:image/png;base64,..." -- only the short header is sliced,
+        # the payload is read in place.
+        comma = data.find(',', 0, 256)
+        if comma == -1:
+            self.fail('invalid_base64')
+        mime, _, encoding = data[len('data:'):comma].partition(';')
+        kind, _, subtype = mime.lower().partition('/')
+        ext = self.EXTENSIONS.get(subtype)
+        if kind != 'image' or ext is None or encoding != 'base64':
+            self.fail('invalid_base64')
+        if any(data.find(space, comma + 1) != -1 for space in ' \t\r\n'):
+            # Line-wrapped (MIME style) payloads: drop the whitespace, which the
+            # strict decoder below would reject. Unwrapped data is not copied.
+            data = data[:comma + 1] + ''.join(data[comma + 1:].split())
+
+        length = len(data) - comma - 1
+        if length == 0 or length % 4:
+            self.fail('invalid_base64')
+        size = length // 4 * 3 - data.count('=', len(data) - 2)
+        if size > self.get_max_size():
+            self.fail('max_size', size=size, max_size=self.get_max_size())
+
+        upload = DecodedImageFile(f"{uuid.uuid4()}.{ext}", mime, size, None)
+        try:
+            for start in range(comma + 1, len(data), self.CHUNK_SIZE):
+                upload.write(base64.b64decode(data[start:start + self.CHUNK_SIZE], validate=True))
+        except binascii.Error:
+            upload.close()
+            self.fail('invalid_base64')
+        upload.seek(0)
+        return upload
+
+
+def save_user_fields(user, user_data):
+    """Writes only the username/email values that changed, if any."""
+    changed = [
+        field for field in ('username', 'email')
+        if field in user_data and getattr(user, field) != user_data[field]
+    ]
+    for field in changed:
+        setattr(user, field, user_data[field])
+    if changed:
+        user.save(update_fields=changed)
+
+
+FOSTER_PET_FIELDS = ('name', 'type', 'breed', 'age')
+
+
 class FosterPetSerializer(serializers.ModelSerializer):
+    # Writable so FosterProfileSerializer.update can match incoming pets to existing rows.
+    id = serializers.IntegerField(required=False)
+
     class Meta:
         model = FosterPet
         fields = ['id', 'name', 'type', 'breed', 'age']
@@ -83,6 +184,7 @@ class FosterProfileSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(source='user.email')
     currentFosters = FosterPetSerializer(source='current_fosters', many=True)
     profileImage = Base64ImageField(source='profile_image', required=False, allow_null=True)
+    profileImageThumbnails = serializers.SerializerMethodField()
 
     class Meta:
         model = FosterProfile
@@ -93,46 +195,94 @@ class FosterProfileSerializer(serializers.ModelSerializer):
             'address', 
             'household', 
             'currentFosters', 
-            'profileImage'
+            'profileImage',
+            'profileImageThumbnails'
         ]
 
+    def get_profileImageThumbnails(self, obj):
+        return thumbnail_urls(obj.profile_image_thumbnails, obj.profile_image.storage, self.context.get('request'))
+
+    @transaction.atomic
     def update(self, instance, validated_data):
         # 1. Update User model (username/email)
         user_data = validated_data.pop('user', {})
-        user = instance.user
-        if 'username' in user_data:
-            user.username = user_data['username']
-        if 'email' in user_data:
-            user.email = user_data['email']
-        user.save()
+        save_user_fields(instance.user, user_data)
+
+        # 2. Update Simple Profile Fields (only the ones that changed)
+        changed = [
+            field for field in ('phone', 'address', 'household')
+            if field in validated_data and getattr(instance, field) != validated_data[field]
+        ]
+        for field in changed:
+            setattr(instance, field, validated_data[field])
 
-        # 2. Update Simple Profile Fields
-        instance.phone = validated_data.get('phone', instance.phone)
-        instance.address = validated_data.get('address', instance.address)
-        instance.household = validated_data.get('household', instance.household)
-        
         if 'profile_image' in validated_data:
             instance.profile_image = validated_data['profile_image']
-        
-        instance.save()
+            changed.append('profile_image')
+
+        if changed:
+            instance.save(update_fields=changed)
 
         # 3. Update Nested Pets
-        # Strategy: Clear existing pets and re-add them to match the frontend list
         if 'current_fosters' in validated_data:
-            pets_data = validated_data['current_fosters']
-            # Delete old pets
-            instance.current_fosters.all().delete()
-            # Create new pets
-            for pet_data in pets_data:
-                FosterPet.objects.create(profile=instance, **pet_data)
+            self.sync_current_fosters(instance, validated_data['current_fosters'])
 
         return instance
+
+    def sync_current_fosters(self, instance, pets_data):
+        """
+        Makes the profile's FosterPet rows match the submitted list. Pets are
+        matched by id, so unchanged pets keep their rows and only the differences
+        are written: one DELETE, one bulk UPDATE and one bulk INSERT at most.
+        Pets sent without an id (older clients) reuse an unclaimed row with the
+        same values, so re-saving an unchanged list writes nothing; the rest,
+        like unknown or repeated ids, are new pets.
+        """
+        existing = {pet.id: pet for pet in instance.current_fosters.all()}
+        kept = set()
+        to_create, to_update, changed_fields = [], [], set()
+
+        claimed = {pet_data['id'] for pet_data in pets_data if pet_data.get('id') in existing}
+        unclaimed = {}
+        for pet in existing.values():
+            if pet.id not in claimed:
+                unclaimed.setdefault(tuple(getattr(pet, field) for field in FOSTER_PET_FIELDS), []).append(pet)
+
+        for pet_data in pets_data:
+            pet_data = dict(pet_data)
+            pet_id = pet_data.pop('id', None)
+            pet = existing.get(pet_id)
+            if pet_id is None:
+                same = unclaimed.get(tuple(pet_data.get(field) for field in FOSTER_PET_FIELDS))
+                if same:
+                    kept.add(same.pop().id)
+                    continue
+            if pet is None or pet.id in kept:
+                to_create.append(FosterPet(profile=instance, **pet_data))
+                continue
+            kept.add(pet.id)
+            changed = [field for field, value in pet_data.items() if getattr(pet, field) != value]
+            if changed:
+                for field in changed:
+                    setattr(pet, field, pet_data[field])
+                to_update.append(pet)
+                changed_fields.update(changed)
+
+        removed = [pk for pk in existing if pk not in kept]
+        if removed:
+            FosterPet.objects.filter(profile=instance, pk__in=removed).delete()
+        if to_update:
+            FosterPet.objects.bulk_update(to_update, sorted(changed_fields))
+        if to_create:
+            FosterPet.objects.bulk_create(to_create)
     
 class UserProfileSerializer(serializers.ModelSerializer):
     # Map frontend 'userName' to backend 'user.username'
     userName = serializers.CharField(source="user.username", required=False)
     email = serializers.EmailField(source="user.email", required=False)
     profileImage = Base64ImageField(source="profile_image", required=False, allow_null=True)
+    profileImageThumbnails = serializers.SerializerMethodField()
+    favorites = LegacyFavoritesField(required=False)
 
     class Meta:
         model = UserProfile
@@ -145,33 +295,31 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "favorites",
             # ⭐ ADDED: Include the new preferences field
             "preferences", 
-            "profileImage"
+            "profileImage",
+            "profileImageThumbnails"
         ]
 
+    def get_profileImageThumbnails(self, obj):
+        return thumbnail_urls(obj.profile_image_thumbnails, obj.profile_image.storage, self.context.get('request'))
+
     def update(self, instance, validated_data):
         # 1. Update User Model (username/email)
         user_data = validated_data.pop("user", {})
-        user = instance.user
-
-        if user_data:
-            if "username" in user_data:
-                user.username = user_data["username"]
-            if "email" in user_data:
-                user.email = user_data["email"]
-            user.save()
+        save_user_fields(instance.user, user_data)
 
         # 2. Update Profile Model
         instance.phone = validated_data.get("phone", instance.phone)
         instance.address = validated_data.get("address", instance.address)
         instance.household = validated_data.get("household", instance.household)
         
-        # Handle favorites
+        # Handle favorites (stored in the Favorite table)
         favorites_data = validated_data.get("favorites")
         if favorites_data is not None:
-            instance.favorites = favorites_data
+            set_favorites(instance.user, favorites_data)
 
         # ⭐ ADDED: Handle preferences
         preferences_data = validated_data.get("preferences")
+        preferences_changed = preferences_data is not None and preferences_data != instance.preferences
         if preferences_data is not None:
             instance.preferences = preferences_data
 
@@ -179,4 +327,8 @@ class UserProfileSerializer(serializers.ModelSerializer):
             instance.profile_image = validated_data["profile_image"]
 
         instance.save()
+
+        # Drop the cached /api/pets/matches/ predicate so the next lookup recompiles it
+        if preferences_changed:
+            invalidate_match_predicates(instance.user_id)
         return instance
\ No newline at end of file
@@ -0,0 +1,48 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .catalogue_cache import invalidate_catalogue
+from .models import Pet, AdoptionRequest, FosterProfile, UserProfile
+from .purge import requests_purged
+from .stats import invalidate_summary
+from .thumbnails import IMAGE_FIELDS, needs_thumbnails, schedule_thumbnails
+
+
+# --- Dashboard summary cache ---
+# Invalidated after commit, so a reader can't re-cache the pre-commit counts.
+@receiver(post_save, sender=Pet)
+@receiver(post_delete, sender=Pet)
+@receiver(post_save, sender=AdoptionRequest)
+@receiver(post_delete, sender=AdoptionRequest)
+@receiver(requests_purged, sender=AdoptionRequest)
+def invalidate_stats_summary(sender, **kwargs):
+    transaction.on_commit(invalidate_summary)
+
+
+# --- Public catalogue response cache ---
+# Applications change a pet's pending_requests, so they retire cached pages too.
+@receiver(post_save, sender=Pet)
+@receiver(post_delete, sender=Pet)
+@receiver(post_save, sender=AdoptionRequest)
+@receiver(post_delete, sender=AdoptionRequest)
+@receiver(requests_purged, sender=AdoptionRequest)
+def invalidate_catalogue_cache(sender, **kwargs):
+    transaction.on_commit(invalidate_catalogue)
+
+
+# --- Image thumbnails ---
+@receiver(post_save, sender=Pet)
+@receiver(post_save, sender=FosterProfile)
+@receiver(post_save, sender=UserProfile)
+def queue_thumbnails(sender, instance, raw=False, **kwargs):
+    image_field, thumbnails_field = IMAGE_FIELDS[sender]
+    if raw or image_field in instance.get_deferred_fields():
+        return
+    if not needs_thumbnails(instance, image_field, thumbnails_field):
+        return
+    if getattr(instance, image_field).name:
+        schedule_thumbnails(instance, image_field, thumbnails_field)
+    else:
+        # Image removed: forget the old thumbnails.
+        sender.objects.filter(pk=instance.pk).update(**{thumbnails_field: {}})
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+from .models import Pet, AdoptionRequest, ArchivedAdoptionRequest
+
+SUMMARY_CACHE_KEY = 'stats-summary'
+
+
+def compute_summary():
+    """
+    Dashboard counts from a few grouped aggregate queries, so the response size
+    and cost don't grow with the catalogue.
+    """
+    pets_by_type_status = {}
+    pet_totals = {'type': {}, 'status': {}}
+    total_pets = 0
+    for row in Pet.objects.order_by().values('type', 'status').annotate(total=Count('id')):
+        pets_by_type_status.setdefault(row['type'], {})[row['status']] = row['total']
+        pet_totals['type'][row['type']] = pet_totals['type'].get(row['type'], 0) + row['total']
+        pet_totals['status'][row['status']] = pet_totals['status'].get(row['status'], 0) + row['total']
+        total_pets += row['total']
+
+    # Closed requests moved to the archive still count towards the totals.
+    requests_by_status = {}
+    for model in (AdoptionRequest, ArchivedAdoptionRequest):
+        for row in model.objects.order_by().values('status').annotate(total=Count('id')):
+            requests_by_status[row['status']] = requests_by_status.get(row['status'], 0) + row['total']
+
+    return {
+        'total_pets': total_pets,
+        'total_dogs': pet_totals['type'].get('Dog', 0),
+        'total_cats': pet_totals['type'].get('Cat', 0),
+        'available_pets': pet_totals['status'].get('Available', 0),
+        'pending_pets': pet_totals['status'].get('Pending', 0),
+        'adopted_pets': pet_totals['status'].get('Adopted', 0),
+        'total_requests': sum(requests_by_status.values()),
+        'pending_requests': requests_by_status.get('Pending', 0),
+        'pets_by_type_status': pets_by_type_status,
+        'requests_by_status': requests_by_status,
+    }
+
+
+def get_summary():
+    summary = cache.get(SUMMARY_CACHE_KEY)
+    if summary is None:
+        summary = compute_summary()
+        cache.set(SUMMARY_CACHE_KEY, summary, getattr(settings, 'STATS_CACHE_TIMEOUT', 30))
+    return summary
+
+
+def invalidate_summary():
+    cache.delete(SUMMARY_CACHE_KEY)
@@ -0,0 +1,133 @@
+"""
+Seed data and the base TestCase for the admin_inventory tests. `manage.py
+benchmark` seeds its throwaway database with the same helpers.
+"""
+import random
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+
+def analyze():
+    """Refreshes planner statistics after seeding, like a production database would have."""
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+def explain_sql(sql):
+    """Returns the database's query plan for one captured SQL statement."""
+    prefix = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+    with connection.cursor() as cursor:
+        cursor.execute(prefix + sql)
+        rows = cursor.fetchall()
+    return '\n'.join(' '.join(str(col) for col in row) for row in rows)
+
+
+def captured_sql(func):
+    """Runs func and returns the SQL statements it sent (SELECTs only)."""
+    with CaptureQueriesContext(connection) as ctx:
+        func()
+    return [q['sql'] for q in ctx.captured_queries if q['sql'].lstrip().upper().startswith('SELECT')]
+
+
+def plan_uses_index(plan):
+    """True when an EXPLAIN plan reads the main table through an index."""
+    text = plan.upper()
+    if connection.vendor == 'sqlite':
+        for line in text.splitlines():
+            if 'SCAN' in line and 'USING' not in line and 'TEMP B-TREE' not in line:
+                return False
+        return 'USING' in text
+    return 'SEQ SCAN' not in text
+
+
+# ---------------------
+# SEED DATA
+# ---------------------
+
+BREEDS = {
+    'Dog': ['Labrador', 'German Shepherd', 'Poodle', 'Bulldog', 'Beagle', 'Aspin', 'Shih Tzu'],
+    'Cat': ['Siamese', 'Persian', 'Maine Coon', 'Puspin', 'Bengal', 'Ragdoll'],
+}
+
+
+def seed_pets(count, batch_size=5000, seed=42):
+    from admin_inventory.models import Pet
+
+    rng = random.Random(seed)
+    batch = []
+    for i in range(count):
+        pet_type = rng.choice(('Dog', 'Cat'))
+        batch.append(Pet(
+            name=f'Pet {i}',
+            breed=rng.choice(BREEDS[pet_type]),
+            age=rng.randint(0, 15),
+            type=pet_type,
+            status=rng.choices(('Available', 'Pending', 'Adopted'), weights=(6, 1, 3))[0],
+            sex=rng.choice(('MALE', 'FEMALE', 'UNKNOWN')),
+            weight=None if rng.random() < 0.05 else round(rng.uniform(1, 45), 1),
+        ))
+        if len(batch) >= batch_size:
+            Pet.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        Pet.objects.bulk_create(batch)
+
+
+def seed_applications(count, seed=42):
+    from admin_inventory.models import AdoptionRequest, Pet
+
+    rng = random.Random(seed)
+    pet_ids = list(Pet.objects.values_list('id', flat=True))
+    AdoptionRequest.objects.bulk_create([
+        AdoptionRequest(
+            pet_id=rng.choice(pet_ids),
+            requester_name=f'Requester {i}',
+            email=f'requester{i}@example.com',
+            status=rng.choices(('Pending', 'Approved', 'Rejected'), weights=(5, 3, 2))[0],
+        )
+        for i in range(count)
+    ], batch_size=5000)
+
+
+def seed_users(count, prefix='user'):
+    """Users with an Account and a UserProfile each, like RegisterAPIView creates."""
+    from django.contrib.auth.models import User
+    from admin_inventory.models import Account, UserProfile
+
+    users = User.objects.bulk_create([
+        User(username=f'{prefix}{i}', first_name=f'User {i}', password='!')
+        for i in range(count)
+    ], batch_size=5000)
+    if not users or users[0].pk is None:
+        users = list(User.objects.filter(username__startswith=prefix).order_by('id'))
+    Account.objects.bulk_create([Account(user=u, role='adopter') for u in users], batch_size=5000)
+    UserProfile.objects.bulk_create([UserProfile(user=u) for u in users], batch_size=5000)
+    return users
+
+
+class SeededTestCase(TestCase):
+    """TestCase with the seed helpers, an API client factory and EXPLAIN checks."""
+
+    seed_pets = staticmethod(seed_pets)
+    seed_applications = staticmethod(seed_applications)
+    seed_users = staticmethod(seed_users)
+
+    def setUp(self):
+        # Stats, match predicates and catalogue pages are cached across requests.
+        cache.clear()
+
+    def api_client(self, user=None):
+        client = APIClient()
+        if user is not None:
+            client.force_authenticate(user)
+        return client
+
+    def assertUsesIndexes(self, func, msg=''):
+        """Every SELECT func sends is answered through an index (no full table scan)."""
+        for sql in captured_sql(func):
+            plan = explain_sql(sql)
+            self.assertTrue(plan_uses_index(plan), f'{msg}: full table scan\n{sql}\n{plan}')
@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db.models.signals import post_save
+
+from admin_inventory.models import Account, FosterProfile, Pet, UserProfile
+
+from .base import SeededTestCase
+
+
+class AccountQueryCountTests(SeededTestCase):
+    """Register, login and profile saves write each row once, with no cascading re-saves."""
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('alice', email='alice@example.com', password='secret123')
+        UserProfile.objects.get_or_create(user=self.user)
+
+    def test_register(self):
+        # username check; user; profile lookup + insert (savepoint, release); account
+        with self.assertNumQueries(7):
+            response = self.api_client().post('/api/register/', {
+                'username': 'bob', 'password': 'secret123', 'first_name': 'Bob', 'role': 'adopter',
+            }, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(UserProfile.objects.filter(user__username='bob').exists())
+
+    def test_login(self):
+        # user + account, token lookup + insert (savepoint, release)
+        with self.assertNumQueries(5):
+            response = self.api_client().post('/api/login/', {
+                'username': 'alice', 'password': 'secret123',
+            }, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        # Second login: the token exists already.
+        with self.assertNumQueries(2):
+            self.api_client().post('/api/login/', {'username': 'alice', 'password': 'secret123'}, format='json')
+
+    def test_user_profile_update(self):
+        # profile + user, favorites, user email, profile
+        with self.assertNumQueries(4):
+            response = self.api_client(self.user).put('/api/user-profile/', {
+                'phone': '555-0100', 'email': 'alice@elsewhere.example',
+            }, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, 'alice@elsewhere.example')
+
+    def test_preferences_update_recomputes_matches(self):
+        Pet.objects.create(name='Rex', breed='Aspin', age=3, type='Dog', sex='MALE')
+        Pet.objects.create(name='Tom', breed='Puspin', age=3, type='Cat', sex='MALE')
+        client = self.api_client(self.user)
+        UserProfile.objects.filter(user=self.user).update(preferences=['Dog'])
+        self.assertEqual([pet['name'] for pet in client.get('/api/pets/matches/').json()], ['Rex'])
+
+        # What the AdoptPage preferences modal sends.
+        response = client.put('/api/user-profile/', {'preferences': ['Cat']}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(UserProfile.objects.get(user=self.user).preferences, ['Cat'])
+        self.assertEqual([pet['name'] for pet in client.get('/api/pets/matches/').json()], ['Tom'])
+
+    def test_foster_profile_update(self):
+        FosterProfile.objects.create(user=self.user)
+        # profile + user, fosters, savepoint, user email, profile, release, fosters
+        with self.assertNumQueries(7):
+            response = self.api_client(self.user).put('/api/profile/', {
+                'userName': 'alice', 'email': 'alice@elsewhere.example', 'phone': '555-0101',
+                'currentFosters': [],
+            }, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+
+    def test_staff_flag_change_promotes_account(self):
+        Account.objects.create(user=self.user, role='adopter')
+        self.user.is_staff = True
+        # user, account role
+        with self.assertNumQueries(2):
+            self.user.save(update_fields=['is_staff'])
+        self.assertEqual(Account.objects.get(user=self.user).role, 'admin')
+
+    def test_last_login_save_touches_nothing_else(self):
+        self.user.last_login = self.user.date_joined
+        with self.assertNumQueries(1):
+            self.user.save(update_fields=['last_login'])
+
+
+class ProfileSignalTests(SeededTestCase):
+    def test_existing_profile_is_kept(self):
+        # A profile created before post_save runs must not raise IntegrityError.
+        user = User(username='carol')
+        user.save()
+        self.assertEqual(UserProfile.objects.filter(user=user).count(), 1)
+        UserProfile.objects.filter(user=user).update(phone='555-0199')
+        post_save.send(sender=User, instance=user, created=True, raw=False)
+        self.assertEqual(UserProfile.objects.get(user=user).phone, '555-0199')
+
+    def test_loaddata_skips_profile_creation(self):
+        # Raw saves (fixtures) carry their own profile rows.
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'dave.json')
+            with open(path, 'w') as fixture:
+                json.dump(FIXTURE, fixture)
+            call_command('loaddata', path, verbosity=0)
+        self.assertEqual(UserProfile.objects.get(user__username='dave').phone, '555-0142')
+
+
+FIXTURE = [
+    {'model': 'auth.user', 'pk': 900, 'fields': {'username': 'dave', 'password': '!'}},
+    {'model': 'admin_inventory.userprofile', 'pk': 900, 'fields': {'user': 900, 'phone': '555-0142'}},
+]
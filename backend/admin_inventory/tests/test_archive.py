@@ -0,0 +1,44 @@
+import datetime
+
+from django.db import IntegrityError
+from django.utils import timezone
+
+from admin_inventory.archive import archive_closed_requests
+from admin_inventory.models import AdoptionRequest, ArchivedAdoptionRequest
+
+from .base import SeededTestCase
+
+
+class ArchiveClosedRequestsTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.seed_pets(10)
+        self.seed_applications(100)
+        old = timezone.now() - datetime.timedelta(days=365)
+        AdoptionRequest.objects.filter(id__lte=50).update(created_at=old, status_changed_at=old)
+        self.old_closed = set(
+            AdoptionRequest.objects.filter(id__lte=50, status__in=('Approved', 'Rejected')).values_list('id', flat=True)
+        )
+
+    def test_moves_old_closed_requests(self):
+        moved = archive_closed_requests(older_than_days=90, batch_size=7)
+
+        self.assertEqual(moved, len(self.old_closed))
+        self.assertEqual(set(ArchivedAdoptionRequest.objects.values_list('id', flat=True)), self.old_closed)
+        self.assertFalse(AdoptionRequest.objects.filter(id__in=self.old_closed).exists())
+        self.assertEqual(AdoptionRequest.objects.count(), 100 - moved)
+
+        response = self.api_client().get('/api/archived-applications/?status=Approved')
+        self.assertEqual(response.status_code, 200)
+
+    def test_conflict_aborts_the_batch(self):
+        # An id that is already archived must not lose its live row.
+        taken = min(self.old_closed)
+        ArchivedAdoptionRequest.objects.create(
+            id=taken, requester_name='Someone else', status='Approved', created_at=timezone.now(),
+        )
+        with self.assertRaises(IntegrityError):
+            archive_closed_requests(older_than_days=90, batch_size=1000)
+
+        self.assertEqual(AdoptionRequest.objects.filter(id__in=self.old_closed).count(), len(self.old_closed))
+        self.assertEqual(ArchivedAdoptionRequest.objects.count(), 1)
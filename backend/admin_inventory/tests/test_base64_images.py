@@ -0,0 +1,45 @@
+import base64
+import io
+import textwrap
+
+from django.test import SimpleTestCase
+from PIL import Image
+from rest_framework.exceptions import ValidationError
+
+from admin_inventory.serializers import Base64ImageField
+
+
+def png_data_uri(size=(64, 64)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, (200, 120, 40)).save(buffer, 'PNG')
+    return buffer.getvalue(), 'data:image/png;base64,' + base64.b64encode(buffer.getvalue()).decode()
+
+
+class Base64ImageFieldTests(SimpleTestCase):
+    def decode(self, data, **kwargs):
+        upload = Base64ImageField(**kwargs).to_internal_value(data)
+        upload.seek(0)
+        return upload.read()
+
+    def test_decodes_data_uri(self):
+        raw, uri = png_data_uri()
+        self.assertEqual(self.decode(uri), raw)
+
+    def test_accepts_line_wrapped_payload(self):
+        raw, uri = png_data_uri()
+        header, payload = uri.split(',', 1)
+        for separator in ('\n', '\r\n', ' '):
+            wrapped = header + ',' + separator.join(textwrap.wrap(payload, 76)) + separator
+            with self.subTest(separator=repr(separator)):
+                self.assertEqual(self.decode(wrapped), raw)
+
+    def test_rejects_invalid_base64(self):
+        _, uri = png_data_uri()
+        for data in (uri[:-1], uri[:40] + '!!!!' + uri[44:], 'data:image/png;base64,', 'data:text/plain;base64,AAAA'):
+            with self.subTest(data=data[:50]), self.assertRaises(ValidationError):
+                self.decode(data)
+
+    def test_size_limit(self):
+        raw, uri = png_data_uri()
+        with self.assertRaisesMessage(ValidationError, 'too large'):
+            self.decode(uri, max_size=len(raw) - 1)
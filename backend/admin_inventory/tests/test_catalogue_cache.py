@@ -0,0 +1,64 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test.utils import override_settings
+
+from admin_inventory.catalogue_cache import HITS_KEY, MISSES_KEY
+from admin_inventory.models import Pet
+
+from .base import SeededTestCase
+
+URL = '/api/pets/?status=Available&page_size=50'
+
+
+@override_settings(CATALOGUE_CACHE_TIMEOUT=300)
+class CatalogueCacheTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.seed_pets(100)
+        self.client = self.api_client()
+
+    def test_hit_runs_no_queries(self):
+        self.assertEqual(self.client.get(URL)['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            response = self.client.get(URL)
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    def test_equivalent_queries_share_an_entry(self):
+        self.client.get('/api/pets/?status=Available&type=Dog')
+        response = self.client.get('/api/pets/?type=Dog&status=Available&breed=')
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    def test_save_retires_cached_pages(self):
+        self.client.get(URL)
+        pet = Pet.objects.filter(status='Available').order_by('-id').first()
+        pet.name = 'Renamed'
+        with self.captureOnCommitCallbacks(execute=True):
+            pet.save()
+        response = self.client.get(URL)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIn(b'Renamed', response.content)
+
+    def test_counters_off_by_default(self):
+        self.client.get(URL)
+        self.client.get(URL)
+        self.assertIsNone(cache.get(HITS_KEY))
+        self.assertIsNone(cache.get(MISSES_KEY))
+
+    @override_settings(CATALOGUE_CACHE_STATS=True)
+    def test_counters(self):
+        self.client.get(URL)
+        self.client.get(URL)
+        self.client.get(URL)
+        self.assertEqual((cache.get(HITS_KEY), cache.get(MISSES_KEY)), (2, 1))
+
+
+class CatalogueCacheStatsViewTests(SeededTestCase):
+    def test_admin_only(self):
+        url = '/api/stats/catalogue-cache/'
+        self.assertEqual(self.api_client().get(url).status_code, 401)
+        user = User.objects.create_user('visitor', password='secret123')
+        self.assertEqual(self.api_client(user).get(url).status_code, 403)
+        staff = User.objects.create_user('staff', password='secret123', is_staff=True)
+        response = self.api_client(staff).get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()['enabled'])
@@ -0,0 +1,58 @@
+import gzip
+import unittest
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from django.test.utils import override_settings
+
+from admin_inventory.compression import CompressionMiddleware, brotli, choose_encoding
+
+BODY = b'{"name": "Rex"}' * 1000
+
+
+class CompressionMiddlewareTests(SimpleTestCase):
+    def process(self, response, accept='gzip, br'):
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def json(self, body=BODY, **kwargs):
+        return HttpResponse(body, content_type='application/json', **kwargs)
+
+    @override_settings(COMPRESSION_ENCODINGS=['gzip'])
+    def test_gzip_goes_through_django(self):
+        response = self.process(self.json(headers={'ETag': '"abc"'}))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+        self.assertEqual(gzip.decompress(response.content), BODY)
+        # GZipMiddleware's BREACH padding: a random-length file name in the header.
+        self.assertTrue(response.content[3] & gzip.FNAME)
+
+    @unittest.skipIf(brotli is None, 'brotli is not installed')
+    def test_brotli(self):
+        response = self.process(self.json())
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), BODY)
+
+    def test_skipped(self):
+        cases = [
+            ('small json', self.json(b'{"name": "Rex"}'), None),
+            ('jpeg', HttpResponse(BODY, content_type='image/jpeg'), None),
+            ('streaming', StreamingHttpResponse(iter([BODY]), content_type='application/json'), None),
+            ('already encoded', self.json(headers={'Content-Encoding': 'identity'}), 'identity'),
+        ]
+        for label, response, encoding in cases:
+            with self.subTest(label):
+                self.assertEqual(self.process(response).get('Content-Encoding'), encoding)
+
+    def test_refused_encoding(self):
+        response = self.process(self.json(), accept='gzip;q=0, br;q=0, identity')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response.content, BODY)
+
+    def test_choose_encoding(self):
+        self.assertEqual(choose_encoding('gzip, br', ['br', 'gzip']), 'br')
+        self.assertEqual(choose_encoding('gzip, br;q=0.5', ['br', 'gzip']), 'gzip')
+        self.assertEqual(choose_encoding('*', ['br', 'gzip']), 'br')
+        self.assertIsNone(choose_encoding('identity', ['br', 'gzip']))
@@ -0,0 +1,41 @@
+from django.test.utils import override_settings
+
+from admin_inventory.models import Pet, recount_pending_requests
+
+from .base import SeededTestCase
+
+# What AdoptPage, AdminInventory and AdminStats poll.
+URLS = [
+    '/api/pets/?paginate=false',
+    '/api/pets/?status=Available&page_size=50',
+    '/api/applications/?paginate=false',
+    '/api/stats/summary/',
+    '/api/adoption-trends/?granularity=day',
+]
+
+
+# Off so every request reaches the view; the catalogue cache has its own tests.
+@override_settings(CATALOGUE_CACHE_TIMEOUT=0)
+class ConditionalGetTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.seed_pets(100)
+        self.seed_applications(100)
+        recount_pending_requests(Pet.objects.values('id'))
+        self.client = self.api_client()
+
+    def test_not_modified(self):
+        for url in URLS:
+            with self.subTest(url):
+                etag = self.client.get(url).get('ETag')
+                self.assertTrue(etag)
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b'')
+
+    def test_write_changes_the_etag(self):
+        url = URLS[0]
+        etag = self.client.get(url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            Pet.objects.order_by('id').first().save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
@@ -0,0 +1,21 @@
+from admin_inventory.models import Favorite, Pet
+
+from .base import SeededTestCase
+
+
+class UserProfileListTests(SeededTestCase):
+    def test_large_profile_list(self):
+        # The favorites prefetch used to start from an `id = ... OR ...` query over
+        # every user on the page, which SQLite rejects ("Expression tree is too
+        # large") somewhere past a thousand profiles.
+        self.seed_pets(10)
+        users = self.seed_users(2000)
+        pet_ids = list(Pet.objects.values_list('id', flat=True)[:3])
+        Favorite.objects.bulk_create([Favorite(user=users[-1], pet_id=pet_id) for pet_id in pet_ids])
+
+        with self.assertNumQueries(2):
+            response = self.api_client().get('/api/user-profiles/')
+        self.assertEqual(response.status_code, 200)
+        profiles = response.json()
+        self.assertEqual(len(profiles), 2000)
+        self.assertEqual([favorite['pet']['id'] for favorite in profiles[-1]['favorites']], pet_ids)
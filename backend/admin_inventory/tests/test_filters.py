@@ -0,0 +1,116 @@
+from django.test.utils import override_settings
+
+from admin_inventory.models import AdoptionRequest, Pet
+
+from .base import SeededTestCase
+
+# name, type, sex, age, weight, breed, status
+PETS = [
+    ('Rex', 'Dog', 'MALE', 1, 4.0, 'Labrador', 'Available'),
+    ('Luna', 'Cat', 'FEMALE', 2, 5.0, 'Siamese', 'Available'),
+    ('Max', 'Dog', 'MALE', 3, 15.0, 'Aspin', 'Pending'),
+    ('Bella', 'Dog', 'FEMALE', 8, 16.0, 'Labrador', 'Adopted'),
+    ('Tom', 'Cat', 'UNKNOWN', 9, 30.0, 'Persian', 'Available'),
+    ('Bruno', 'Dog', 'MALE', 12, 30.5, 'Bulldog', 'Available'),
+    ('Mystery', 'Cat', 'UNKNOWN', 5, None, 'Puspin', 'Available'),
+]
+
+
+@override_settings(CATALOGUE_CACHE_TIMEOUT=0)
+class PetCatalogueFilterTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        for name, type, sex, age, weight, breed, status in PETS:
+            Pet.objects.create(name=name, type=type, sex=sex, age=age, weight=weight, breed=breed, status=status)
+        AdoptionRequest.objects.create(pet=Pet.objects.get(name='Max'), requester_name='ana')
+        self.client = self.api_client()
+
+    def names(self, query, status_code=200):
+        response = self.client.get(f'/api/pets/?{query}')
+        self.assertEqual(response.status_code, status_code, response.content)
+        if status_code != 200:
+            return response.json()
+        body = response.json()
+        rows = body['results'] if isinstance(body, dict) else body
+        return [row['name'] for row in rows]
+
+    def assertFilters(self, cases):
+        for query, expected in cases:
+            with self.subTest(query):
+                self.assertEqual(set(self.names(query)), set(expected))
+
+    def test_choices(self):
+        self.assertFilters([
+            ('type=Dog', ['Rex', 'Max', 'Bella', 'Bruno']),
+            ('type=dog,CAT', [row[0] for row in PETS]),
+            ('status=Available', ['Rex', 'Luna', 'Tom', 'Bruno', 'Mystery']),
+            ('status=pending,adopted', ['Max', 'Bella']),
+            ('sex=female', ['Luna', 'Bella']),
+            ('breed=Labrador,Persian', ['Rex', 'Bella', 'Tom']),
+            ('type=Dog&status=Available&sex=male', ['Rex', 'Bruno']),
+            ('has_pending=true', ['Max']),
+        ])
+
+    def test_age(self):
+        self.assertFilters([
+            ('age_min=3&age_max=9', ['Max', 'Bella', 'Tom', 'Mystery']),
+            ('age_group=young', ['Rex', 'Luna']),
+            ('age_group=adult', ['Max', 'Bella', 'Mystery']),
+            ('age_group=senior', ['Tom', 'Bruno']),
+            ('age_group=young,senior', ['Rex', 'Luna', 'Tom', 'Bruno']),
+        ])
+
+    def test_weight(self):
+        # Pets without a weight never match a weight filter.
+        self.assertFilters([
+            ('weight_min=5&weight_max=16', ['Luna', 'Max', 'Bella']),
+            ('weight_band=under-5', ['Rex']),
+            ('weight_band=5-15', ['Luna', 'Max']),
+            ('weight_band=16-30', ['Bella', 'Tom']),
+            ('weight_band=over-30', ['Bruno']),
+            ('weight_band=under-5,over-30', ['Rex', 'Bruno']),
+        ])
+
+    def test_search(self):
+        self.assertFilters([
+            ('search=lab', ['Rex', 'Bella']),
+            ('search=BRU', ['Bruno']),
+            ('search=%20', [row[0] for row in PETS]),
+        ])
+
+    def test_ordering(self):
+        self.assertEqual(self.names('ordering=age'), ['Rex', 'Luna', 'Max', 'Mystery', 'Bella', 'Tom', 'Bruno'])
+        self.assertEqual(self.names('ordering=-name&type=Cat'), ['Tom', 'Mystery', 'Luna'])
+        # NULL weights last either way.
+        self.assertEqual(self.names('ordering=-weight')[-1], 'Mystery')
+        self.assertEqual(self.names('ordering=weight')[-1], 'Mystery')
+
+    def test_invalid_values(self):
+        for query, param in (
+            ('type=Rabbit', 'type'),
+            ('status=Lost', 'status'),
+            ('sex=x', 'sex'),
+            ('age_min=old', 'age_min'),
+            ('weight_max=heavy', 'weight_max'),
+            ('age_group=baby', 'age_group'),
+            ('weight_band=huge', 'weight_band'),
+            ('ordering=status', 'ordering'),
+            ('ordering=age,-password', 'ordering'),
+        ):
+            with self.subTest(query):
+                self.assertIn(param, self.names(query, status_code=400))
+
+    def test_filters_with_cursor_pages(self):
+        url, seen = '/api/pets/?type=Dog,Cat&weight_min=1&ordering=-weight&page_size=2', []
+        while url:
+            body = self.client.get(url).json()
+            seen += [row['name'] for row in body['results']]
+            url = body['next']
+        self.assertEqual(seen, ['Bruno', 'Tom', 'Bella', 'Max', 'Luna', 'Rex'])
+
+        # A cursor is tied to its ordering, and the filters still apply on later pages.
+        first = self.client.get('/api/pets/?type=Dog&ordering=age&page_size=2').json()
+        self.assertEqual([row['name'] for row in first['results']], ['Rex', 'Max'])
+        self.assertEqual([row['name'] for row in self.client.get(first['next']).json()['results']], ['Bella', 'Bruno'])
+        cursor = first['next'].split('?', 1)[1]
+        self.assertEqual(self.client.get(f'/api/pets/?{cursor}'.replace('ordering=age', 'ordering=name')).status_code, 404)
@@ -0,0 +1,50 @@
+from django.contrib.auth.models import User
+
+from admin_inventory.models import FosterPet, FosterProfile
+
+from .base import SeededTestCase
+
+
+class FosterProfileSaveTests(SeededTestCase):
+    """PUT /api/profile/ with a handful of fosters, the common case."""
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create(username='foster', email='foster@example.com', password='!')
+        self.profile = FosterProfile.objects.create(user=self.user)
+        FosterPet.objects.bulk_create([
+            FosterPet(profile=self.profile, name=f'Foster {i}', type='Dog', breed='Aspin', age='2 Years')
+            for i in range(5)
+        ])
+        self.client = self.api_client(self.user)
+        self.body = self.client.get('/api/profile/').json()
+        del self.body['profileImage'], self.body['profileImageThumbnails']
+
+    def put(self, fosters, queries):
+        with self.assertNumQueries(queries):
+            response = self.client.put('/api/profile/', dict(self.body, currentFosters=fosters), format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['currentFosters']
+
+    def test_unchanged_list_writes_nothing(self):
+        # profile, fosters, savepoint, release, fosters for the response
+        pets = self.body['currentFosters']
+        self.assertEqual(self.put(pets, 5), pets)
+
+    def test_list_without_ids_keeps_rows(self):
+        pets = self.body['currentFosters']
+        without_ids = [{key: value for key, value in pet.items() if key != 'id'} for pet in pets]
+        self.assertEqual(self.put(without_ids, 5), pets)
+
+    def test_edit_remove_add(self):
+        # + one DELETE, one UPDATE, one INSERT
+        pets = [dict(pet) for pet in self.body['currentFosters']]
+        pets[0]['name'] = 'Renamed'
+        removed = pets.pop()
+        pets.append({'name': 'New', 'type': 'Cat', 'breed': 'Puspin', 'age': '3 Months'})
+        saved = self.put(pets, 8)
+
+        self.assertEqual([pet['id'] for pet in saved[:4]], [pet['id'] for pet in pets[:4]])
+        self.assertEqual(saved[0]['name'], 'Renamed')
+        self.assertNotIn(removed['id'], [pet['id'] for pet in saved])
+        self.assertEqual(saved[-1]['name'], 'New')
@@ -0,0 +1,137 @@
+from django.contrib.auth.models import User
+
+from admin_inventory.matching import compile_preference, compile_preferences, get_match_predicates
+from admin_inventory.models import Pet, UserProfile
+
+from .base import SeededTestCase
+
+
+def pet(name, type='Dog', sex='MALE', age=3, weight=10.0, breed='Aspin', status='Available'):
+    return Pet.objects.create(name=name, type=type, sex=sex, age=age, weight=weight, breed=breed, status=status)
+
+
+class CompilePreferenceTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.rex = pet('Rex', age=1, weight=4.0, breed='Labrador')
+        self.luna = pet('Luna', type='Cat', sex='FEMALE', age=5, weight=5.0, breed='Siamese')
+        self.max = pet('Max', age=9, weight=30.0)
+        self.bruno = pet('Bruno', sex='UNKNOWN', age=12, weight=31.5, breed='Bulldog')
+        self.nameless = pet('Nameless', age=4, weight=None)
+
+    def matching(self, preference):
+        key, q = compile_preference(preference)
+        return key, set(Pet.objects.filter(q).values_list('name', flat=True))
+
+    def test_type(self):
+        self.assertEqual(self.matching('Dog'), ('type:Dog', {'Rex', 'Max', 'Bruno', 'Nameless'}))
+        self.assertEqual(self.matching('cat lover'), ('type:Cat', {'Luna'}))
+
+    def test_sex(self):
+        self.assertEqual(self.matching('Female'), ('sex:FEMALE', {'Luna'}))
+        self.assertEqual(self.matching('unknown'), ('sex:UNKNOWN', {'Bruno'}))
+
+    def test_age_group(self):
+        self.assertEqual(self.matching('Young (0-2)'), ('age:young', {'Rex'}))
+        self.assertEqual(self.matching('Adult (3-8)'), ('age:adult', {'Luna', 'Nameless'}))
+        self.assertEqual(self.matching('Senior (9+)'), ('age:senior', {'Max', 'Bruno'}))
+
+    def test_weight_band(self):
+        # Same bounds as the AdoptPage filters: "Under 5" excludes 5, "Over 30" excludes 30.
+        self.assertEqual(self.matching('Under 5 kg'), ('weight:under-5', {'Rex'}))
+        self.assertEqual(self.matching('5 - 15 kg'), ('weight:5-15', {'Luna'}))
+        self.assertEqual(self.matching('16 - 30 kg'), ('weight:16-30', {'Max'}))
+        self.assertEqual(self.matching('Over 30 kg'), ('weight:over-30', {'Bruno'}))
+
+    def test_breed(self):
+        self.assertEqual(self.matching('labrador'), ('breed:labrador', {'Rex'}))
+        self.assertEqual(self.matching('Rabbit'), ('breed:rabbit', set()))
+
+    def test_blank(self):
+        self.assertIsNone(compile_preference('  '))
+
+    def test_duplicates_collapse(self):
+        self.assertEqual(len(compile_preferences(['Dog', 'dog', 'DOG lover', 'Female'])), 2)
+        self.assertEqual(compile_preferences(None), [])
+
+
+class MatchesEndpointTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('adopter', password='secret123')
+        self.profile = UserProfile.objects.get(user=self.user)
+        self.profile.preferences = ['Dog', 'Female', 'Young (0-2)']
+        self.profile.save()
+        # Scores: Bella 3, Daisy 2, Rex 2, Tom 1 (Female), Max 1 (Dog); Garfield 0.
+        pet('Max', age=9)
+        pet('Rex', age=1)
+        pet('Daisy', sex='FEMALE', age=5)
+        pet('Bella', sex='FEMALE', age=2)
+        pet('Tom', type='Cat', sex='FEMALE', age=6, status='Adopted')
+        pet('Garfield', type='Cat', age=7)
+        self.client = self.api_client(self.user)
+
+    def names(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        body = response.json()
+        rows = body['results'] if isinstance(body, dict) else body
+        return [(row['name'], row['match_score']) for row in rows]
+
+    def test_ranked(self):
+        # Ties on the score go to the newest pet.
+        self.assertEqual(self.names('/api/pets/matches/'), [
+            ('Bella', 3), ('Daisy', 2), ('Rex', 2), ('Tom', 1), ('Max', 1),
+        ])
+
+    def test_catalogue_filters_apply(self):
+        self.assertEqual([name for name, _ in self.names('/api/pets/matches/?status=Available&type=Dog')],
+                         ['Bella', 'Daisy', 'Rex', 'Max'])
+
+    def test_pages(self):
+        url, seen = '/api/pets/matches/?page_size=2', []
+        while url:
+            body = self.client.get(url).json()
+            self.assertLessEqual(len(body['results']), 2)
+            seen += [row['name'] for row in body['results']]
+            url = body['next']
+        self.assertEqual(seen, ['Bella', 'Daisy', 'Rex', 'Tom', 'Max'])
+
+    def test_no_preferences(self):
+        self.profile.preferences = []
+        self.profile.save()
+        self.assertEqual(self.names('/api/pets/matches/'), [])
+
+    def test_login_required(self):
+        self.assertEqual(self.api_client().get('/api/pets/matches/').status_code, 401)
+
+
+class MatchInvalidationTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('adopter', password='secret123')
+        UserProfile.objects.filter(user=self.user).update(preferences=['Dog'])
+        self.profile = UserProfile.objects.get(user=self.user)
+        self.client = self.api_client(self.user)
+        self.assertEqual(len(get_match_predicates(self.user)), 1)
+
+    def test_predicates_are_cached(self):
+        UserProfile.objects.filter(user=self.user).update(preferences=['Dog', 'Female'])
+        with self.assertNumQueries(0):
+            self.assertEqual(len(get_match_predicates(self.user)), 1)
+
+    def test_user_profile_put(self):
+        response = self.client.put('/api/user-profile/', {'preferences': ['Dog', 'Female']}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(len(get_match_predicates(self.user)), 2)
+
+    def test_user_profiles_patch(self):
+        response = self.client.patch(f'/api/user-profiles/{self.profile.pk}/',
+                                     {'preferences': ['Cat', 'Female', 'Senior (9+)']}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(len(get_match_predicates(self.user)), 3)
+
+    def test_unchanged_preferences_keep_the_cache(self):
+        self.client.put('/api/user-profile/', {'preferences': ['Dog'], 'phone': '555-0100'}, format='json')
+        with self.assertNumQueries(0):
+            get_match_predicates(self.user)
@@ -0,0 +1,136 @@
+import datetime
+from urllib.parse import parse_qs, quote, urlsplit
+
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from admin_inventory.models import AdoptionRequest, Pet
+
+from .base import SeededTestCase
+
+
+@override_settings(CATALOGUE_CACHE_TIMEOUT=0)
+class KeysetPaginationTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.seed_pets(23)
+        self.client = self.api_client()
+
+    def get(self, url, status_code=200):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status_code, response.content)
+        return response.json()
+
+    def cursor(self, url):
+        return parse_qs(urlsplit(url).query)['cursor'][0]
+
+    def walk(self, url):
+        """Follows `next` from url; returns the ids of each page."""
+        pages = []
+        while url:
+            body = self.get(url)
+            pages.append([row['id'] for row in body['results']])
+            url = body['next']
+        return pages
+
+    def test_forward(self):
+        pages = self.walk('/api/pets/?page_size=10')
+        self.assertEqual([len(page) for page in pages], [10, 10, 3])
+        self.assertEqual(sum(pages, []), list(Pet.objects.order_by('-id').values_list('id', flat=True)))
+
+    def test_back(self):
+        first = self.get('/api/pets/?page_size=10')
+        self.assertIsNone(first['previous'])
+        second = self.get(first['next'])
+        third = self.get(second['next'])
+        self.assertIsNone(third['next'])
+        back = self.get(third['previous'])
+        self.assertEqual(back['results'], second['results'])
+        self.assertEqual(self.get(back['previous'])['results'], first['results'])
+
+    def test_null_weights_across_pages(self):
+        Pet.objects.filter(id__in=Pet.objects.order_by('id').values('id')[:7]).update(weight=None)
+        for ordering in ('weight', '-weight'):
+            with self.subTest(ordering):
+                pages = self.walk(f'/api/pets/?page_size=4&ordering={ordering}')
+                ids = sum(pages, [])
+                self.assertEqual(len(ids), 23)
+                self.assertEqual(len(set(ids)), 23)
+                # Values in order, NULLs after them; ties broken by id.
+                rows = dict(Pet.objects.values_list('id', 'weight'))
+                weights = [rows[pk] for pk in ids]
+                self.assertEqual(weights[-7:], [None] * 7)
+                expected = sorted(
+                    (pk for pk in ids if rows[pk] is not None),
+                    key=lambda pk: (rows[pk], pk), reverse=ordering.startswith('-'),
+                )
+                self.assertEqual(ids[:16], expected)
+                nulls = sorted(ids[16:], reverse=ordering.startswith('-'))
+                self.assertEqual(ids[16:], nulls)
+
+                # And back again from the last page.
+                url = f'/api/pets/?page_size=4&ordering={ordering}'
+                bodies = [self.get(url)]
+                while bodies[-1]['next']:
+                    bodies.append(self.get(bodies[-1]['next']))
+                back = [[row['id'] for row in bodies[-1]['results']]]
+                url = bodies[-1]['previous']
+                while url:
+                    body = self.get(url)
+                    back.insert(0, [row['id'] for row in body['results']])
+                    url = body['previous']
+                self.assertEqual(back, pages)
+
+    def test_tampered_cursor(self):
+        cursor = self.cursor(self.get('/api/pets/?page_size=10')['next'])
+        self.get(f'/api/pets/?page_size=10&cursor={quote(cursor[:-2])}xx', status_code=404)
+        self.get('/api/pets/?cursor=garbage', status_code=404)
+
+    def test_cursor_from_another_ordering(self):
+        cursor = quote(self.cursor(self.get('/api/pets/?page_size=10&ordering=age')['next']))
+        self.get(f'/api/pets/?page_size=10&ordering=name&cursor={cursor}', status_code=404)
+        self.get(f'/api/pets/?page_size=10&cursor={cursor}', status_code=404)
+
+    def test_count(self):
+        body = self.get('/api/pets/?page_size=5&count=true&type=Dog')
+        self.assertEqual(body['count'], Pet.objects.filter(type='Dog').count())
+        self.assertNotIn('count', self.get('/api/pets/?page_size=5'))
+
+    def test_paginate_false(self):
+        body = self.get('/api/pets/?paginate=false&page_size=5')
+        self.assertIsInstance(body, list)
+        self.assertEqual(len(body), 23)
+
+    def test_legacy_default(self):
+        with self.settings(API_PAGINATE_BY_DEFAULT=False):
+            self.assertEqual(len(self.get('/api/pets/')), 23)
+        with self.settings(API_PAGINATE_BY_DEFAULT=True):
+            body = self.get('/api/pets/')
+            self.assertEqual(len(body['results']), 23)
+            self.assertIsNone(body['next'])
+        self.assertEqual(len(self.get('/api/pets/?paginate=true')['results']), 23)
+
+    def test_invalid_page_size_uses_the_default(self):
+        for size in ('0', '-3', 'abc'):
+            with self.subTest(size=size):
+                self.assertEqual(len(self.get(f'/api/pets/?page_size={size}')['results']), 23)
+
+
+class ApplicationPaginationTests(SeededTestCase):
+    def test_created_at_ties(self):
+        pet = Pet.objects.create(name='Rex', breed='Aspin', age=3, type='Dog')
+        AdoptionRequest.objects.bulk_create([
+            AdoptionRequest(pet=pet, requester_name=f'Requester {i}') for i in range(9)
+        ])
+        # Three rows per timestamp, so every page boundary falls inside a tie.
+        start = timezone.now()
+        for index, pk in enumerate(AdoptionRequest.objects.order_by('id').values_list('id', flat=True)):
+            AdoptionRequest.objects.filter(pk=pk).update(created_at=start + datetime.timedelta(minutes=index // 3))
+
+        client, url, ids = self.api_client(), '/api/applications/?page_size=2', []
+        while url:
+            body = client.get(url).json()
+            ids += [row['id'] for row in body['results']]
+            url = body['next']
+        expected = list(AdoptionRequest.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
@@ -0,0 +1,101 @@
+from django.test.utils import override_settings
+
+from admin_inventory.models import AdoptionRequest, Pet
+
+from .base import SeededTestCase
+
+
+class PendingRequestCounterTests(SeededTestCase):
+    """Pet.pending_requests follows the Pending AdoptionRequests through every write path."""
+
+    def setUp(self):
+        super().setUp()
+        self.rex = Pet.objects.create(name='Rex', breed='Aspin', age=3, type='Dog')
+        self.luna = Pet.objects.create(name='Luna', breed='Puspin', age=2, type='Cat')
+
+    def request(self, pet, name='ana', **kwargs):
+        return AdoptionRequest.objects.create(pet=pet, requester_name=name, **kwargs)
+
+    def assertCounts(self, rex, luna):
+        self.rex.refresh_from_db()
+        self.luna.refresh_from_db()
+        self.assertEqual((self.rex.pending_requests, self.luna.pending_requests), (rex, luna))
+        # The counter must agree with the rows it summarises.
+        for pet in (self.rex, self.luna):
+            self.assertEqual(pet.pending_requests, pet.requests.filter(status='Pending').count())
+
+    def test_create(self):
+        self.request(self.rex)
+        self.request(self.rex, 'ben')
+        self.request(self.rex, 'cy', status='Rejected')
+        self.assertCounts(2, 0)
+
+    def test_status_change(self):
+        request = self.request(self.rex)
+        request.status = 'Approved'
+        request.save()
+        self.assertCounts(0, 0)
+        # Back to Pending, from a freshly loaded instance.
+        request = AdoptionRequest.objects.get(pk=request.pk)
+        request.status = 'Pending'
+        request.save()
+        self.assertCounts(1, 0)
+        # Saving without a change leaves the counter alone.
+        request.save()
+        self.assertCounts(1, 0)
+
+    def test_move_to_another_pet(self):
+        request = self.request(self.rex)
+        request = AdoptionRequest.objects.get(pk=request.pk)
+        request.pet = self.luna
+        request.save()
+        self.assertCounts(0, 1)
+
+    def test_single_delete(self):
+        self.request(self.rex)
+        self.request(self.rex, 'ben').delete()
+        self.assertCounts(1, 0)
+
+    def test_queryset_delete(self):
+        for name in ('ana', 'ben', 'cy'):
+            self.request(self.rex, name)
+        self.request(self.luna)
+        self.request(self.rex, 'dee', status='Rejected')
+        AdoptionRequest.objects.filter(pet=self.rex, requester_name__in=['ana', 'ben', 'dee']).delete()
+        self.assertCounts(1, 1)
+
+    def test_pet_cascade_delete(self):
+        self.request(self.rex)
+        self.request(self.luna)
+        self.request(self.luna, 'ben')
+        self.rex.delete()
+        self.assertEqual(AdoptionRequest.objects.count(), 2)
+        self.luna.refresh_from_db()
+        self.assertEqual(self.luna.pending_requests, 2)
+
+    def test_never_negative(self):
+        request = self.request(self.rex)
+        Pet.objects.filter(pk=self.rex.pk).update(pending_requests=0)
+        request.delete()
+        self.rex.refresh_from_db()
+        self.assertEqual(self.rex.pending_requests, 0)
+
+
+@override_settings(CATALOGUE_CACHE_TIMEOUT=0)
+class HasPendingFilterTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        rex = Pet.objects.create(name='Rex', breed='Aspin', age=3, type='Dog')
+        Pet.objects.create(name='Luna', breed='Puspin', age=2, type='Cat')
+        AdoptionRequest.objects.create(pet=rex, requester_name='ana')
+        self.client = self.api_client()
+
+    def names(self, query):
+        response = self.client.get(f'/api/pets/?{query}')
+        self.assertEqual(response.status_code, 200, response.content)
+        return [(pet['name'], pet['has_pending_request']) for pet in response.json()]
+
+    def test_has_pending(self):
+        self.assertEqual(self.names('has_pending=true'), [('Rex', True)])
+        self.assertEqual(self.names('has_pending=false'), [('Luna', False)])
+        self.assertEqual(self.names('has_pending='), [('Luna', False), ('Rex', True)])
@@ -0,0 +1,81 @@
+from django.contrib.auth.models import User
+
+from admin_inventory.catalogue_cache import invalidate_catalogue
+from admin_inventory.models import AdoptionRequest, Pet, recount_pending_requests
+from admin_inventory.purge import purge_requests, requests_purged
+from admin_inventory.stats import invalidate_summary
+
+from .base import SeededTestCase
+
+
+class PurgeRequestsTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.seed_pets(20)
+        self.seed_applications(250)
+        recount_pending_requests(Pet.objects.values('id'))
+
+    def test_purges_everything_in_batches(self):
+        progress, batches = [], []
+
+        def purged(sender, pks, pet_ids, **kwargs):
+            batches.append(len(pks))
+        requests_purged.connect(purged, sender=AdoptionRequest)
+        self.addCleanup(requests_purged.disconnect, purged, sender=AdoptionRequest)
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            deleted = purge_requests(batch_size=100, progress=lambda done, total: progress.append((done, total)))
+
+        self.assertEqual(deleted, 250)
+        self.assertFalse(AdoptionRequest.objects.exists())
+        self.assertFalse(Pet.objects.filter(pending_requests__gt=0).exists())
+        self.assertEqual(progress, [(100, 250), (200, 250), (250, 250)])
+        self.assertEqual(batches, [100, 100, 50])
+        self.assertIn(invalidate_catalogue, callbacks)
+        self.assertIn(invalidate_summary, callbacks)
+
+    def test_purges_only_the_queryset(self):
+        rows = []
+        deleted = purge_requests(AdoptionRequest.objects.filter(status='Pending'), batch_size=40, sink=rows.extend)
+
+        self.assertEqual(deleted, len(rows))
+        self.assertTrue(all(row['status'] == 'Pending' for row in rows))
+        self.assertFalse(AdoptionRequest.objects.filter(status='Pending').exists())
+        self.assertEqual(AdoptionRequest.objects.count(), 250 - deleted)
+        self.assertFalse(Pet.objects.filter(pending_requests__gt=0).exists())
+
+
+class PurgeEndpointTests(SeededTestCase):
+    URL = '/api/applications/purge/'
+
+    def setUp(self):
+        super().setUp()
+        self.rex = Pet.objects.create(name='Rex', breed='Aspin', age=3, type='Dog')
+        for name, status in (('ana', 'Pending'), ('ben', 'Pending'), ('cy', 'Rejected'), ('dee', 'Approved')):
+            AdoptionRequest.objects.create(pet=self.rex, requester_name=name, status=status)
+        self.admin = User.objects.create_user('admin', password='secret123', is_staff=True)
+
+    def test_purges_the_filtered_applications(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.api_client(self.admin).post(f'{self.URL}?status=Pending,Rejected')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json(), {'deleted': 3})
+        self.assertEqual(list(AdoptionRequest.objects.values_list('requester_name', flat=True)), ['dee'])
+        self.rex.refresh_from_db()
+        self.assertEqual(self.rex.pending_requests, 0)
+
+    def test_admin_only(self):
+        user = User.objects.create_user('adopter', password='secret123')
+        self.assertEqual(self.api_client().post(self.URL).status_code, 401)
+        self.assertEqual(self.api_client(user).post(self.URL).status_code, 403)
+        self.assertEqual(AdoptionRequest.objects.count(), 4)
+
+    def test_single_delete_is_unchanged(self):
+        request = AdoptionRequest.objects.get(requester_name='ana')
+        response = self.api_client().delete(f'/api/applications/{request.pk}/')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(AdoptionRequest.objects.count(), 3)
+        self.rex.refresh_from_db()
+        self.assertEqual(self.rex.pending_requests, 1)
+        # There is no DELETE-all on the list route.
+        self.assertEqual(self.api_client(self.admin).delete('/api/applications/').status_code, 405)
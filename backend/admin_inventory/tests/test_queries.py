@@ -0,0 +1,60 @@
+from django.core.cache import cache
+
+from admin_inventory.models import Favorite, FosterPet, FosterProfile, Pet, UserProfile
+
+from .base import SeededTestCase
+
+# (url, needs a logged-in user, queries). The count must not depend on how many
+# rows the endpoint returns.
+ENDPOINTS = [
+    ('/api/pets/', False, 2),                        # version, page
+    ('/api/pets/?page_size=50', False, 2),
+    ('/api/pets/matches/', True, 2),                 # preferences, ranked page
+    ('/api/applications/', False, 3),                # version, pets version, page
+    ('/api/applications/?page_size=50', False, 3),
+    ('/api/archived-applications/', False, 1),
+    ('/api/accounts/', False, 1),
+    ('/api/user-profiles/', False, 2),               # profiles + users, favorites
+    ('/api/profile/', True, 2),
+    ('/api/user-profile/', True, 2),
+    ('/api/favorites/', True, 1),
+    ('/api/stats/summary/', False, 6),
+    ('/api/adoption-trends/', False, 2),
+]
+
+
+class EndpointQueryCountTests(SeededTestCase):
+    """No N+1: each endpoint takes the same number of queries at 10, 100 and 1000 rows."""
+
+    def seed(self, count):
+        self.seed_pets(count)
+        self.seed_applications(count)
+        user = self.seed_users(count)[0]
+        UserProfile.objects.filter(user=user).update(preferences=['Dog', 'Female', 'Young (0-2)'])
+        profile = FosterProfile.objects.create(user=user)
+        FosterPet.objects.bulk_create([
+            FosterPet(profile=profile, name=f'Foster {i}', type='Dog', breed='Aspin', age='2 Years')
+            for i in range(count)
+        ])
+        Favorite.objects.bulk_create([
+            Favorite(user=user, pet_id=pet_id) for pet_id in Pet.objects.values_list('id', flat=True)
+        ])
+        return user
+
+    def check_query_counts(self, count):
+        user = self.seed(count)
+        for url, needs_user, queries in ENDPOINTS:
+            client = self.api_client(user if needs_user else None)
+            cache.clear()
+            with self.subTest(url=url, rows=count), self.assertNumQueries(queries):
+                response = client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+
+    def test_10_rows(self):
+        self.check_query_counts(10)
+
+    def test_100_rows(self):
+        self.check_query_counts(100)
+
+    def test_1000_rows(self):
+        self.check_query_counts(1000)
@@ -0,0 +1,63 @@
+import datetime
+import decimal
+import unittest
+
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from admin_inventory.api import AdoptionRequestSerializer, PetSerializer
+from admin_inventory.models import AdoptionRequest, Pet
+from admin_inventory.renderers import FastJSONRenderer, orjson
+
+from .base import SeededTestCase
+
+# Values the views put in Response() themselves rather than through a serializer.
+EDGE_CASES = {
+    'aware': timezone.now(),
+    'naive': datetime.datetime(2024, 5, 1, 12, 30, 15, 123456),
+    'day': datetime.date(2024, 5, 1),
+    'decimal': decimal.Decimal('12.50'),
+    'lazy': gettext_lazy('This field is required.'),
+    'separators': 'line\u2028paragraph\u2029',
+    'unicode': 'Ñoño 🐶',
+    'int_keys': {1: 'a', 2: 'b'},
+    'big': 2 ** 70,
+    'nested': [{'start': datetime.date(2024, 1, 1), 'count': 3}, None, True, 1.5],
+}
+
+# Floats json.dumps and orjson format differently.
+FLOATS = [
+    1e-05, -1e-05, 1e+16, 1e+22, 1.5e+300, 1.7976931348623157e+308, 5e-324,
+    decimal.Decimal('1E-7'), decimal.Decimal('1E+20'),
+]
+NON_FINITE = [float('nan'), float('inf'), float('-inf'), decimal.Decimal('NaN')]
+
+
+@unittest.skipIf(orjson is None, 'orjson is not installed')
+class FastJSONRendererTests(SeededTestCase):
+    """FastJSONRenderer must produce exactly what JSONRenderer does."""
+
+    def assertSameOutput(self, data):
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_edge_cases(self):
+        self.assertSameOutput(EDGE_CASES)
+
+    def test_floats(self):
+        for value in FLOATS + [0.0, -0.0, 0.0001, 0.1, 2.5, 9999999999999998.0]:
+            with self.subTest(value=value):
+                self.assertSameOutput({'value': value, 'nested': [(value,)]})
+
+    def test_non_finite_floats_raise(self):
+        for value in NON_FINITE:
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                FastJSONRenderer().render({'nested': [value]})
+
+    def test_serialized_lists(self):
+        self.seed_pets(200)
+        self.seed_applications(200)
+        self.assertSameOutput(PetSerializer(Pet.objects.order_by('-id'), many=True).data)
+        self.assertSameOutput(AdoptionRequestSerializer(
+            AdoptionRequest.objects.select_related('pet').order_by('-id'), many=True,
+        ).data)
@@ -0,0 +1,40 @@
+import unittest
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import SimpleTestCase
+
+from backend.settings import sqlite_init_command
+
+
+@unittest.skipUnless(connection.vendor == 'sqlite', 'SQLite only')
+class SQLitePragmaTests(SimpleTestCase):
+    databases = {'default'}
+
+    def test_init_command_applies_pragmas(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            self.assertEqual(cursor.fetchone()[0], settings.SQLITE_PRAGMAS['busy_timeout'])
+            cursor.execute('PRAGMA cache_size')
+            self.assertEqual(cursor.fetchone()[0], settings.SQLITE_PRAGMAS['cache_size'])
+
+
+class SQLiteInitCommandTests(SimpleTestCase):
+    def test_builds_statements(self):
+        self.assertEqual(
+            sqlite_init_command({'journal_mode': 'wal', 'cache_size': -64000}),
+            'PRAGMA journal_mode = wal;PRAGMA cache_size = -64000',
+        )
+
+    def test_rejects_unsafe_input(self):
+        for pragmas in (
+            {'journal_mode': 'wal; DROP TABLE auth_user'},
+            {'journal_mode': 'wal --'},
+            {'busy_timeout': '5000 5000'},
+            {'cache_size = 1; PRAGMA foo': 1},
+            {'Journal_Mode': 'wal'},
+            {'journal_mode': ''},
+        ):
+            with self.subTest(pragmas=pragmas), self.assertRaisesMessage(ImproperlyConfigured, 'Invalid SQLite pragma'):
+                sqlite_init_command(pragmas)
@@ -0,0 +1,107 @@
+from django.core.cache import cache
+from django.utils import timezone
+
+from admin_inventory.models import AdoptionRequest, ArchivedAdoptionRequest, Pet
+from admin_inventory.purge import purge_requests
+from admin_inventory.stats import SUMMARY_CACHE_KEY
+
+from .base import SeededTestCase
+
+URL = '/api/stats/summary/'
+
+
+class StatsSummaryTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.rex = Pet.objects.create(name='Rex', breed='Aspin', age=3, type='Dog')
+        self.max = Pet.objects.create(name='Max', breed='Aspin', age=5, type='Dog', status='Adopted')
+        self.luna = Pet.objects.create(name='Luna', breed='Puspin', age=2, type='Cat', status='Pending')
+        for name, status in (('ana', 'Pending'), ('ben', 'Pending'), ('cy', 'Rejected')):
+            AdoptionRequest.objects.create(pet=self.rex, requester_name=name, status=status)
+        ArchivedAdoptionRequest.objects.create(
+            id=1000, pet=self.max, requester_name='dee', status='Approved', created_at=timezone.now(),
+        )
+        self.client = self.api_client()
+
+    def summary(self):
+        response = self.client.get(URL)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_counts(self):
+        self.assertEqual(self.summary(), {
+            'total_pets': 3,
+            'total_dogs': 2,
+            'total_cats': 1,
+            'available_pets': 1,
+            'pending_pets': 1,
+            'adopted_pets': 1,
+            # Archived requests still count.
+            'total_requests': 4,
+            'pending_requests': 2,
+            'pets_by_type_status': {'Dog': {'Available': 1, 'Adopted': 1}, 'Cat': {'Pending': 1}},
+            'requests_by_status': {'Pending': 2, 'Rejected': 1, 'Approved': 1},
+        })
+
+    def test_empty(self):
+        Pet.objects.all().delete()
+        ArchivedAdoptionRequest.objects.all().delete()
+        cache.clear()
+        body = self.summary()
+        self.assertEqual((body['total_pets'], body['total_requests']), (0, 0))
+        self.assertEqual(body['pets_by_type_status'], {})
+
+    def test_served_from_cache(self):
+        self.summary()
+        self.assertIsNotNone(cache.get(SUMMARY_CACHE_KEY))
+        # A write that bypasses the signals is not seen until the entry expires.
+        Pet.objects.filter(pk=self.rex.pk).update(status='Adopted')
+        self.assertEqual(self.summary()['adopted_pets'], 1)
+
+    def assertInvalidatedBy(self, write, **expected):
+        self.summary()
+        with self.captureOnCommitCallbacks(execute=True):
+            write()
+        self.assertIsNone(cache.get(SUMMARY_CACHE_KEY))
+        body = self.summary()
+        self.assertEqual({key: body[key] for key in expected}, expected)
+
+    def test_pet_save(self):
+        self.rex.status = 'Adopted'
+        self.assertInvalidatedBy(self.rex.save, available_pets=0, adopted_pets=2)
+
+    def test_pet_create(self):
+        self.assertInvalidatedBy(
+            lambda: Pet.objects.create(name='Tom', breed='Persian', age=4, type='Cat'),
+            total_pets=4, total_cats=2,
+        )
+
+    def test_pet_delete(self):
+        self.assertInvalidatedBy(self.luna.delete, total_pets=2, total_cats=0, pending_pets=0)
+
+    def test_request_save(self):
+        request = AdoptionRequest.objects.get(requester_name='ana')
+        request.status = 'Rejected'
+        self.assertInvalidatedBy(request.save, pending_requests=1, total_requests=4)
+
+    def test_request_create(self):
+        self.assertInvalidatedBy(
+            lambda: AdoptionRequest.objects.create(pet=self.luna, requester_name='eve'),
+            pending_requests=3, total_requests=5,
+        )
+
+    def test_request_delete(self):
+        request = AdoptionRequest.objects.get(requester_name='ben')
+        self.assertInvalidatedBy(request.delete, pending_requests=1, total_requests=3)
+
+    def test_request_purge(self):
+        self.assertInvalidatedBy(
+            lambda: purge_requests(AdoptionRequest.objects.filter(status='Pending')),
+            pending_requests=0, total_requests=2,
+        )
+
+    def test_not_invalidated_before_commit(self):
+        self.summary()
+        with self.captureOnCommitCallbacks(execute=False):
+            self.rex.save()
+            self.assertIsNotNone(cache.get(SUMMARY_CACHE_KEY))
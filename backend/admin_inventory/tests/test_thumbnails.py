@@ -0,0 +1,139 @@
+import io
+import os
+import shutil
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test.utils import override_settings
+from PIL import Image
+
+from admin_inventory.models import Pet
+from admin_inventory.thumbnails import THUMBNAIL_FORMATS, THUMBNAIL_WIDTHS, build_thumbnails
+
+from .base import SeededTestCase
+
+
+def png(size=(1000, 500), color=(200, 120, 40)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'PNG')
+    return SimpleUploadedFile('photo.png', buffer.getvalue(), content_type='image/png')
+
+
+class ThumbnailTestCase(SeededTestCase):
+    """Renders thumbnails inline, into a throwaway MEDIA_ROOT."""
+
+    def setUp(self):
+        super().setUp()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        overrides = override_settings(MEDIA_ROOT=self.media_root, THUMBNAIL_ASYNC=False)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+    def create_pet(self, name='Rex', image=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Pet.objects.create(name=name, breed='Aspin', age=3, type='Dog', image=image or png())
+
+    def paths(self, pet):
+        return [path for variants in pet.image_thumbnails['sizes'].values() for path in variants.values()]
+
+    def mtimes(self, pet):
+        return {path: os.stat(os.path.join(self.media_root, path)).st_mtime_ns for path in self.paths(pet)}
+
+
+class ThumbnailTests(ThumbnailTestCase):
+    def test_generated_on_upload(self):
+        pet = self.create_pet()
+        pet.refresh_from_db()
+        thumbnails = pet.image_thumbnails
+        self.assertEqual(thumbnails['source'], pet.image.name)
+        self.assertEqual(set(thumbnails['sizes']), {str(width) for width in THUMBNAIL_WIDTHS})
+        for width, variants in thumbnails['sizes'].items():
+            self.assertEqual(set(variants), {ext for ext, _ in THUMBNAIL_FORMATS})
+            for path in variants.values():
+                with self.subTest(path=path), Image.open(os.path.join(self.media_root, path)) as image:
+                    # Aspect ratio kept, never wider than the bucket.
+                    self.assertEqual(image.size, (int(width), int(width) // 2))
+
+        body = self.api_client().get(f'/api/pets/{pet.pk}/').json()
+        self.assertTrue(body['image_thumbnails']['400']['webp'].endswith('/400.webp'))
+
+    def test_small_images_are_not_upscaled(self):
+        pet = self.create_pet(image=png(size=(120, 90)))
+        pet.refresh_from_db()
+        with Image.open(os.path.join(self.media_root, pet.image_thumbnails['sizes']['800']['jpeg'])) as image:
+            self.assertEqual(image.size, (120, 90))
+
+    def test_unchanged_image_is_skipped(self):
+        pet = self.create_pet()
+        pet.refresh_from_db()
+        before = pet.image_thumbnails
+        # A rebuild would put this file back.
+        removed = os.path.join(self.media_root, self.paths(pet)[0])
+        os.remove(removed)
+        with self.captureOnCommitCallbacks(execute=True):
+            pet.name = 'Renamed'
+            pet.save()
+        self.assertFalse(os.path.exists(removed))
+        pet.refresh_from_db()
+        self.assertEqual(pet.image_thumbnails, before)
+
+    def test_same_photo_reuses_files(self):
+        first = self.create_pet('Rex')
+        second = self.create_pet('Max')
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertNotEqual(first.image.name, second.image.name)
+        self.assertEqual(self.paths(first), self.paths(second))
+        self.assertEqual(len(os.listdir(os.path.join(self.media_root, 'pet_images', 'thumbs'))), 1)
+
+    def test_force_renders_again(self):
+        pet = self.create_pet()
+        pet.refresh_from_db()
+        path = self.paths(pet)[0]
+        with open(os.path.join(self.media_root, path), 'wb') as handle:
+            handle.write(b'stale')
+        self.assertEqual(build_thumbnails(pet.image)['sizes'], pet.image_thumbnails['sizes'])
+        with open(os.path.join(self.media_root, path), 'rb') as handle:
+            self.assertEqual(handle.read(), b'stale')
+        self.assertEqual(build_thumbnails(pet.image, force=True)['sizes'], pet.image_thumbnails['sizes'])
+        with open(os.path.join(self.media_root, path), 'rb') as handle:
+            self.assertNotEqual(handle.read(), b'stale')
+
+
+class GenerateThumbnailsCommandTests(ThumbnailTestCase):
+    def setUp(self):
+        super().setUp()
+        self.pet = self.create_pet()
+        self.pet.refresh_from_db()
+        Pet.objects.create(name='No photo', breed='Aspin', age=2, type='Dog')
+
+    def run_command(self, *args):
+        out = io.StringIO()
+        call_command('generate_thumbnails', *args, stdout=out, stderr=io.StringIO())
+        return out.getvalue()
+
+    def test_backfills_missing(self):
+        Pet.objects.filter(pk=self.pet.pk).update(image_thumbnails={})
+        self.assertIn('Pet: 1 generated, 0 failed', self.run_command())
+        self.pet.refresh_from_db()
+        self.assertEqual(self.pet.image_thumbnails['source'], self.pet.image.name)
+
+    def test_skips_up_to_date(self):
+        before = self.mtimes(self.pet)
+        self.assertIn('Pet: 0 generated, 0 failed', self.run_command())
+        self.assertEqual(self.mtimes(self.pet), before)
+
+    def test_force(self):
+        path = os.path.join(self.media_root, self.paths(self.pet)[0])
+        with open(path, 'wb') as handle:
+            handle.write(b'stale')
+        self.assertIn('Pet: 1 generated, 0 failed', self.run_command('--force'))
+        with Image.open(path) as image:
+            image.verify()
+
+    def test_missing_original_is_reported(self):
+        os.remove(os.path.join(self.media_root, self.pet.image.name))
+        self.assertIn('Pet: 0 generated, 1 failed', self.run_command('--force'))
+
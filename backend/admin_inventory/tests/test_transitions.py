@@ -0,0 +1,101 @@
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from admin_inventory.models import AdoptionRequest, Pet, StatusRollup
+from admin_inventory.transitions import TransitionConflict, bulk_transition
+
+from .base import SeededTestCase
+
+URL = '/api/applications/bulk-status/'
+
+
+def rollups():
+    today = timezone.localdate()
+    return {
+        (kind, status): count
+        for kind, status, count in StatusRollup.objects.filter(day=today).values_list('kind', 'status', 'count')
+    }
+
+
+class BulkTransitionTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.rex = Pet.objects.create(name='Rex', breed='Aspin', age=3, type='Dog')
+        self.luna = Pet.objects.create(name='Luna', breed='Puspin', age=2, type='Cat')
+        self.requests = {
+            name: AdoptionRequest.objects.create(pet=pet, requester_name=name, email=f'{name}@example.com')
+            for name, pet in (('ana', self.rex), ('ben', self.rex), ('cy', self.rex), ('dee', self.luna))
+        }
+        self.client = self.api_client()
+
+    def ids(self, *names):
+        return [self.requests[name].pk for name in names]
+
+    def statuses(self):
+        return dict(AdoptionRequest.objects.values_list('requester_name', 'status'))
+
+    def post(self, body, status_code=200):
+        response = self.client.post(URL, body, format='json')
+        self.assertEqual(response.status_code, status_code, response.content)
+        return response.json()
+
+    def test_reject(self):
+        before = rollups()
+        body = self.post({'ids': self.ids('ana', 'ben'), 'status': 'Rejected'})
+        self.assertEqual(body, {'updated': self.ids('ana', 'ben'), 'auto_rejected': [], 'adopted_pets': []})
+        self.assertEqual(self.statuses(), {'ana': 'Rejected', 'ben': 'Rejected', 'cy': 'Pending', 'dee': 'Pending'})
+        self.rex.refresh_from_db()
+        self.assertEqual((self.rex.status, self.rex.pending_requests), ('Available', 1))
+        self.assertEqual(rollups().get(('request', 'Rejected'), 0) - before.get(('request', 'Rejected'), 0), 2)
+
+    def test_approve_rejects_competing_requests(self):
+        before = rollups()
+        body = self.post({'ids': self.ids('ana'), 'status': 'Approved'})
+        self.assertEqual(body['updated'], self.ids('ana'))
+        self.assertEqual(sorted(body['auto_rejected']), self.ids('ben', 'cy'))
+        self.assertEqual(body['adopted_pets'], [self.rex.pk])
+        self.assertEqual(self.statuses(), {'ana': 'Approved', 'ben': 'Rejected', 'cy': 'Rejected', 'dee': 'Pending'})
+
+        self.rex.refresh_from_db()
+        self.luna.refresh_from_db()
+        self.assertEqual((self.rex.status, self.rex.pending_requests), ('Adopted', 0))
+        self.assertIsNotNone(self.rex.adopted_at)
+        self.assertEqual((self.luna.status, self.luna.pending_requests), ('Available', 1))
+
+        after = rollups()
+        for key, added in ((('request', 'Approved'), 1), (('request', 'Rejected'), 2), (('pet', 'Adopted'), 1)):
+            with self.subTest(key):
+                self.assertEqual(after.get(key, 0) - before.get(key, 0), added)
+
+    def test_stale_expected_status_is_a_conflict(self):
+        AdoptionRequest.objects.filter(pk=self.requests['ben'].pk).update(status='Approved')
+        before = rollups()
+        body = self.post({'ids': self.ids('ana', 'ben'), 'status': 'Rejected'}, status_code=409)
+        self.assertEqual(body['conflicts'], [{'id': self.requests['ben'].pk, 'status': 'Approved'}])
+        # Nothing written, not even the requests that were still Pending.
+        self.assertEqual(self.statuses(), {'ana': 'Pending', 'ben': 'Approved', 'cy': 'Pending', 'dee': 'Pending'})
+        self.assertEqual(rollups(), before)
+
+    def test_deleted_request_is_a_conflict(self):
+        missing = self.requests['cy'].pk
+        self.requests['cy'].delete()
+        with self.assertRaises(TransitionConflict) as raised:
+            bulk_transition(self.ids('ana') + [missing], 'Rejected')
+        self.assertEqual(raised.exception.conflicts, [{'id': missing, 'status': None}])
+        self.assertEqual(self.statuses()['ana'], 'Pending')
+
+    def test_one_approval_per_pet(self):
+        self.post({'ids': self.ids('ana', 'ben'), 'status': 'Approved'}, status_code=400)
+        with self.assertRaises(ValidationError):
+            bulk_transition(self.ids('ana', 'ben'), 'Approved')
+        self.assertEqual(set(self.statuses().values()), {'Pending'})
+
+    def test_invalid_payloads(self):
+        for body in (
+            {'ids': [], 'status': 'Rejected'},
+            {'ids': self.ids('ana'), 'status': 'Pending'},
+            {'ids': self.ids('ana'), 'status': 'Maybe'},
+            {'ids': [0], 'status': 'Rejected'},
+        ):
+            with self.subTest(body=body):
+                self.post(body, status_code=400)
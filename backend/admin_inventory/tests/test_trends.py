@@ -0,0 +1,115 @@
+import datetime
+
+from django.utils import timezone
+
+from admin_inventory.models import Pet, StatusRollup
+from admin_inventory.trends import MAX_BUCKETS, trend_series
+
+from .base import SeededTestCase
+
+URL = '/api/adoption-trends/'
+
+
+def at(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time(12)))
+
+
+class StatusRollupTests(SeededTestCase):
+    def test_record_increments_the_day(self):
+        day = datetime.date(2025, 3, 4)
+        StatusRollup.record('pet', 'Adopted', at(day))
+        StatusRollup.record('pet', 'Adopted', at(day), count=3)
+        StatusRollup.record('pet', 'Adopted', at(day + datetime.timedelta(days=1)))
+        StatusRollup.record('request', 'Adopted', at(day))
+        self.assertEqual(
+            list(StatusRollup.objects.filter(kind='pet').order_by('day').values_list('day', 'count')),
+            [(day, 4), (day + datetime.timedelta(days=1), 1)],
+        )
+        self.assertEqual(StatusRollup.objects.get(kind='request').count, 1)
+
+    def test_pet_status_change_is_recorded(self):
+        pet = Pet.objects.create(name='Rex', breed='Aspin', age=3, type='Dog')
+        pet.status = 'Adopted'
+        pet.save()
+        pet.save()  # unchanged: not counted again
+        today = timezone.localdate()
+        self.assertEqual(StatusRollup.objects.get(kind='pet', status='Adopted', day=today).count, 1)
+        self.assertEqual(StatusRollup.objects.get(kind='pet', status='Available', day=today).count, 1)
+
+
+class TrendSeriesTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        # 2025-03-03 is a Monday.
+        for day, count in (('2025-02-27', 1), ('2025-03-03', 2), ('2025-03-05', 4), ('2025-03-12', 8)):
+            StatusRollup.record('pet', 'Adopted', at(datetime.date.fromisoformat(day)), count=count)
+        StatusRollup.record('pet', 'Available', at(datetime.date(2025, 3, 5)), count=16)
+
+    def test_day(self):
+        series = trend_series('pet', 'Adopted', 'day', datetime.date(2025, 3, 2), datetime.date(2025, 3, 6))
+        self.assertEqual([(day.isoformat(), count) for day, count in series], [
+            ('2025-03-02', 0), ('2025-03-03', 2), ('2025-03-04', 0), ('2025-03-05', 4), ('2025-03-06', 0),
+        ])
+
+    def test_week(self):
+        # Buckets start on Monday, including one that starts before `start`.
+        series = trend_series('pet', 'Adopted', 'week', datetime.date(2025, 2, 26), datetime.date(2025, 3, 20))
+        self.assertEqual([(day.isoformat(), count) for day, count in series], [
+            ('2025-02-24', 1), ('2025-03-03', 6), ('2025-03-10', 8), ('2025-03-17', 0),
+        ])
+
+    def test_month(self):
+        series = trend_series('pet', 'Adopted', 'month', datetime.date(2025, 1, 15), datetime.date(2025, 4, 1))
+        self.assertEqual([(day.isoformat(), count) for day, count in series], [
+            ('2025-01-01', 0), ('2025-02-01', 1), ('2025-03-01', 14), ('2025-04-01', 0),
+        ])
+
+    def test_range_is_inclusive(self):
+        series = trend_series('pet', 'Adopted', 'day', datetime.date(2025, 3, 5), datetime.date(2025, 3, 5))
+        self.assertEqual(series, [(datetime.date(2025, 3, 5), 4)])
+
+
+class AdoptionTrendsEndpointTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        StatusRollup.record('pet', 'Adopted', at(datetime.date(2025, 3, 5)), count=2)
+        StatusRollup.record('request', 'Rejected', at(datetime.date(2025, 3, 5)), count=5)
+        self.client = self.api_client()
+
+    def get(self, query, status_code=200):
+        response = self.client.get(f'{URL}?{query}')
+        self.assertEqual(response.status_code, status_code, response.content)
+        return response.json()
+
+    def test_month(self):
+        body = self.get('start=2025-01-01&end=2025-03-31')
+        self.assertEqual(body['granularity'], 'month')
+        self.assertEqual(body['trends'], [0, 0, 2])
+        self.assertEqual(body['months'], ['Jan 2025', 'Feb 2025', 'Mar 2025'])
+        self.assertEqual(body['buckets'][2], {'start': '2025-03-01', 'count': 2})
+
+    def test_kind_and_status(self):
+        body = self.get('granularity=day&start=2025-03-04&end=2025-03-05&kind=request&status=Rejected')
+        self.assertEqual(body['trends'], [0, 5])
+        self.assertEqual(body['months'], ['04 Mar 2025', '05 Mar 2025'])
+
+    def test_default_range(self):
+        for granularity in ('day', 'week', 'month'):
+            with self.subTest(granularity):
+                body = self.get(f'granularity={granularity}')
+                self.assertEqual(len(body['trends']), 7)
+                self.assertLessEqual(body['buckets'][-1]['start'], timezone.localdate().isoformat())
+
+    def test_invalid(self):
+        too_long = datetime.date(2025, 3, 5) - datetime.timedelta(days=MAX_BUCKETS + 1)
+        for query, field in (
+            ('granularity=year', 'granularity'),
+            ('kind=user', 'kind'),
+            ('start=yesterday', 'start'),
+            ('start=2025-03-06&end=2025-03-05', 'start'),
+            (f'granularity=day&start={too_long}&end=2025-03-05', 'start'),
+        ):
+            with self.subTest(query):
+                self.assertIn(field, self.get(query, status_code=400))
+        # The same span is fine in weeks.
+        self.get(f'granularity=week&start={too_long}&end=2025-03-05')
@@ -0,0 +1,44 @@
+from .base import SeededTestCase
+
+
+class UserLookupTests(SeededTestCase):
+    def setUp(self):
+        super().setUp()
+        self.users = self.seed_users(3)
+        self.client = self.api_client()
+
+    def get(self, url, status_code=200):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status_code, response.content)
+        return response.json()
+
+    def test_accounts_by_username_param(self):
+        self.assertEqual(self.get('/api/accounts/?username=user1'), [
+            {'id': self.users[1].pk, 'username': 'user1', 'first_name': 'User 1', 'role': 'adopter'},
+        ])
+        # Exact match only.
+        self.assertEqual(self.get('/api/accounts/?username=USER1'), [])
+        self.assertEqual(self.get('/api/accounts/?username=user'), [])
+        self.assertEqual(len(self.get('/api/accounts/')), 3)
+
+    def test_by_username(self):
+        body = self.get('/api/accounts/by-username/user2/')
+        self.assertEqual((body['id'], body['username']), (self.users[2].pk, 'user2'))
+        self.assertEqual(self.get('/api/accounts/by-username/nobody/', status_code=404), {'detail': 'Not found.'})
+
+    def test_profiles_by_user(self):
+        rows = self.get(f'/api/user-profiles/?user={self.users[0].pk}')
+        self.assertEqual([row['user'] for row in rows], [self.users[0].pk])
+        self.assertEqual(self.get('/api/user-profiles/?user=999999'), [])
+
+    def test_profiles_by_username(self):
+        rows = self.get('/api/user-profiles/?username=user2')
+        self.assertEqual([row['user'] for row in rows], [self.users[2].pk])
+        # Both filters apply together.
+        self.assertEqual(self.get(f'/api/user-profiles/?user={self.users[0].pk}&username=user2'), [])
+
+    def test_profiles_by_invalid_user(self):
+        for value in ('abc', '-1', '1.5', ''):
+            with self.subTest(value=value):
+                body = self.get(f'/api/user-profiles/?user={value}', status_code=400)
+                self.assertEqual(body, {'user': ['A valid integer is required.']})
@@ -0,0 +1,140 @@
+import hashlib
+import io
+import logging
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from .catalogue_cache import invalidate_catalogue
+from .models import Pet, FosterProfile, UserProfile
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_WIDTHS = (200, 400, 800)
+THUMBNAIL_FORMATS = (('webp', 'WEBP'), ('jpeg', 'JPEG'))
+THUMBNAIL_QUALITY = 82
+
+# model -> (image field, field holding its thumbnail paths)
+IMAGE_FIELDS = {
+    Pet: ('image', 'image_thumbnails'),
+    FosterProfile: ('profile_image', 'profile_image_thumbnails'),
+    UserProfile: ('profile_image', 'profile_image_thumbnails'),
+}
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'THUMBNAIL_WORKERS', 2),
+            thread_name_prefix='thumbnails',
+        )
+    return _executor
+
+
+def _render(image, width, pil_format):
+    thumb = image.copy()
+    # thumbnail() keeps the aspect ratio and never upscales small originals.
+    thumb.thumbnail((width, width * 4), Image.LANCZOS)
+    if pil_format == 'JPEG' and thumb.mode != 'RGB':
+        background = Image.new('RGB', thumb.size, (255, 255, 255))
+        rgba = thumb.convert('RGBA')
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        thumb = background
+    buffer = io.BytesIO()
+    thumb.save(buffer, pil_format, quality=THUMBNAIL_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+def build_thumbnails(field_file, force=False):
+    """
+    Renders every THUMBNAIL_WIDTHS x THUMBNAIL_FORMATS variant of an uploaded
+    image. Files are content-addressed next to the original
+    (pet_images/thumbs/<sha256>/400.webp), so re-uploading the same photo reuses
+    the existing thumbnails; `force` renders them again anyway.
+    """
+    storage = field_file.storage
+    with storage.open(field_file.name, 'rb') as handle:
+        content = handle.read()
+    digest = hashlib.sha256(content).hexdigest()
+    base = posixpath.join(posixpath.dirname(field_file.name), 'thumbs', digest)
+
+    image = None
+    sizes = {}
+    for width in THUMBNAIL_WIDTHS:
+        variants = {}
+        for ext, pil_format in THUMBNAIL_FORMATS:
+            path = f'{base}/{width}.{ext}'
+            exists = storage.exists(path)
+            if force or not exists:
+                if image is None:
+                    image = ImageOps.exif_transpose(Image.open(io.BytesIO(content)))
+                    image.load()
+                if exists:
+                    # storage.save() would pick a new name rather than overwrite.
+                    storage.delete(path)
+                storage.save(path, ContentFile(_render(image, width, pil_format)))
+            variants[ext] = path
+        sizes[str(width)] = variants
+    return {'source': field_file.name, 'digest': digest, 'sizes': sizes}
+
+
+def needs_thumbnails(instance, image_field, thumbnails_field):
+    name = getattr(instance, image_field).name or ''
+    return (getattr(instance, thumbnails_field) or {}).get('source', '') != name
+
+
+def generate_thumbnails(model, pk, image_field, thumbnails_field, force=False):
+    """Builds and stores thumbnails for one row. Safe to call from any thread."""
+    instance = model.objects.filter(pk=pk).only(image_field, thumbnails_field).first()
+    if instance is None:
+        return
+    field_file = getattr(instance, image_field)
+    if not field_file.name:
+        return
+    thumbnails = build_thumbnails(field_file, force=force)
+    changes = {thumbnails_field: thumbnails}
+    if any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+        # The thumbnail URLs are part of the API output, so conditional GETs must see the change.
+        changes['updated_at'] = timezone.now()
+    # Only write if the image wasn't replaced meanwhile; update() skips save() and signals.
+    updated = model.objects.filter(pk=pk, **{image_field: field_file.name}).update(**changes)
+    if updated and model is Pet:
+        invalidate_catalogue()
+
+
+def _run_in_background(model, pk, image_field, thumbnails_field):
+    try:
+        generate_thumbnails(model, pk, image_field, thumbnails_field)
+    except Exception:
+        logger.exception('Thumbnail generation failed for %s %s', model.__name__, pk)
+    finally:
+        # Worker threads get their own connections; don't leave them open.
+        connections.close_all()
+
+
+def schedule_thumbnails(instance, image_field, thumbnails_field):
+    """Queues thumbnail generation once the upload is committed, off the request thread."""
+    args = (type(instance), instance.pk, image_field, thumbnails_field)
+    if getattr(settings, 'THUMBNAIL_ASYNC', True):
+        transaction.on_commit(lambda: _get_executor().submit(_run_in_background, *args))
+    else:
+        transaction.on_commit(lambda: generate_thumbnails(*args))
+
+
+def thumbnail_urls(thumbnails, storage, request=None):
+    """{'200': {'webp': url, 'jpeg': url}, ...} for a serializer."""
+    urls = {}
+    for width, variants in (thumbnails or {}).get('sizes', {}).items():
+        urls[width] = {}
+        for ext, path in variants.items():
+            url = storage.url(path)
+            urls[width][ext] = request.build_absolute_uri(url) if request is not None else url
+    return urls
@@ -0,0 +1,90 @@
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .catalogue_cache import invalidate_catalogue
+from .models import AdoptionRequest, Pet, StatusRollup, recount_pending_requests
+from .stats import invalidate_summary
+
+MAX_BULK_IDS = 1000
+
+
+class TransitionConflict(Exception):
+    """Some requests were not in the expected status; nothing was changed."""
+    def __init__(self, conflicts):
+        super().__init__(conflicts)
+        self.conflicts = conflicts  # [{'id': 3, 'status': 'Approved'}, ...], status None if deleted
+
+
+def _conflicts(ids, expected_status):
+    current = dict(AdoptionRequest.objects.filter(pk__in=ids).values_list('id', 'status'))
+    return [
+        {'id': pk, 'status': current.get(pk)}
+        for pk in ids if current.get(pk) != expected_status
+    ]
+
+
+def bulk_transition(ids, status, expected_status='Pending'):
+    """
+    Moves the given adoption requests from `expected_status` to `status` in one
+    UPDATE. If any of them is no longer in `expected_status` (someone else got
+    there first) nothing is written and TransitionConflict is raised.
+
+    Approving also, in the same transaction, rejects every other Pending
+    request for the approved pets and marks those pets Adopted. Because
+    update() skips the model save() methods, the Pet.pending_requests counters,
+    the StatusRollup rows and the dashboard cache are kept in step here.
+    """
+    ids = sorted(set(ids))
+    with transaction.atomic():
+        rows = list(
+            AdoptionRequest.objects.select_for_update()
+            .filter(pk__in=ids)
+            .values_list('id', 'pet_id', 'status')
+        )
+        if len(rows) != len(ids) or any(current != expected_status for _, _, current in rows):
+            raise TransitionConflict(_conflicts(ids, expected_status))
+
+        pet_ids = sorted({pet_id for _, pet_id, _ in rows})
+        if status == 'Approved' and len(pet_ids) != len(rows):
+            raise ValidationError({'ids': ['Only one application per pet can be approved.']})
+
+        now = timezone.now()
+        updated = AdoptionRequest.objects.filter(pk__in=ids, status=expected_status).update(
+            status=status, status_changed_at=now, updated_at=now
+        )
+        if updated != len(ids):
+            # Changed between the read and the write (no row locks on SQLite);
+            # raising rolls the UPDATE back.
+            raise TransitionConflict(_conflicts(ids, expected_status))
+
+        auto_rejected = []
+        adopted = []
+        if status == 'Approved':
+            auto_rejected = list(
+                AdoptionRequest.objects.filter(pet_id__in=pet_ids, status='Pending')
+                .exclude(pk__in=ids)
+                .values_list('id', flat=True)
+            )
+            if auto_rejected:
+                AdoptionRequest.objects.filter(pk__in=auto_rejected).update(
+                    status='Rejected', status_changed_at=now, updated_at=now
+                )
+            adopted = list(
+                Pet.objects.filter(pk__in=pet_ids).exclude(status='Adopted').values_list('id', flat=True)
+            )
+            if adopted:
+                Pet.objects.filter(pk__in=adopted).update(
+                    status='Adopted', status_changed_at=now, adopted_at=now, updated_at=now
+                )
+
+        recount_pending_requests(pet_ids)
+        StatusRollup.record('request', status, now, count=len(ids))
+        if auto_rejected:
+            StatusRollup.record('request', 'Rejected', now, count=len(auto_rejected))
+        if adopted:
+            StatusRollup.record('pet', 'Adopted', now, count=len(adopted))
+        transaction.on_commit(invalidate_summary)
+        transaction.on_commit(invalidate_catalogue)
+
+    return {'updated': ids, 'auto_rejected': auto_rejected, 'adopted_pets': adopted}
@@ -0,0 +1,88 @@
+import datetime
+
+from django.db.models import Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+from rest_framework import serializers
+
+from .models import StatusRollup
+
+TRUNCATE = {'day': TruncDay, 'week': TruncWeek, 'month': TruncMonth}
+LABEL_FORMATS = {'day': '%d %b %Y', 'week': '%d %b %Y', 'month': '%b %Y'}
+MAX_BUCKETS = 1000
+
+
+def bucket_start(day, granularity):
+    if granularity == 'week':
+        return day - datetime.timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(day, granularity):
+    if granularity == 'week':
+        return day + datetime.timedelta(weeks=1)
+    if granularity == 'month':
+        return (day.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+    return day + datetime.timedelta(days=1)
+
+
+def default_start(end, granularity):
+    """Seven buckets ending with the current one, like the AdminStats chart."""
+    start = bucket_start(end, granularity)
+    for _ in range(6):
+        start = bucket_start(start - datetime.timedelta(days=1), granularity)
+    return start
+
+
+class TrendsQuerySerializer(serializers.Serializer):
+    granularity = serializers.ChoiceField(choices=list(TRUNCATE), default='month')
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    kind = serializers.ChoiceField(choices=[k for k, _ in StatusRollup.KIND_CHOICES], default='pet')
+    status = serializers.CharField(max_length=10, default='Adopted')
+
+    def validate(self, attrs):
+        granularity = attrs['granularity']
+        attrs.setdefault('end', timezone.localdate())
+        attrs.setdefault('start', default_start(attrs['end'], granularity))
+        if attrs['start'] > attrs['end']:
+            raise serializers.ValidationError({'start': 'start must be on or before end.'})
+        buckets = (attrs['end'] - attrs['start']).days
+        if granularity == 'week':
+            buckets //= 7
+        elif granularity == 'month':
+            buckets //= 28
+        if buckets > MAX_BUCKETS:
+            raise serializers.ValidationError(
+                {'start': f'Range too long for {granularity} buckets (max {MAX_BUCKETS}).'}
+            )
+        return attrs
+
+
+def trend_series(kind, status, granularity, start, end):
+    """
+    Transitions into `status` per day/week/month between start and end
+    (inclusive), read from StatusRollup. Empty buckets are returned as 0.
+    """
+    rows = (
+        StatusRollup.objects.filter(kind=kind, status=status, day__range=(start, end))
+        .annotate(bucket=TRUNCATE[granularity]('day'))
+        .values('bucket')
+        .annotate(total=Sum('count'))
+        .order_by('bucket')
+    )
+    totals = {}
+    for row in rows:
+        bucket = row['bucket']
+        if isinstance(bucket, datetime.datetime):
+            bucket = bucket.date()
+        totals[bucket] = row['total']
+
+    series = []
+    current = bucket_start(start, granularity)
+    while current <= end:
+        series.append((current, totals.get(current, 0)))
+        current = next_bucket(current, granularity)
+    return series
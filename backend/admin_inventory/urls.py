@@ -1,5 +1,8 @@
 from django.urls import path, include
-from .api import router, AdoptionTrendsAPIView, RegisterAPIView, LoginAPIView
+from .api import (
+    router, AdoptionTrendsAPIView, RegisterAPIView, LoginAPIView, StatsSummaryAPIView,
+    CatalogueCacheStatsAPIView,
+)
 from .views import FosterProfileView, UserProfileView
 
 
@@ -7,6 +10,8 @@ urlpatterns = [
     path('register/', RegisterAPIView.as_view(), name='register'),
     path('login/', LoginAPIView.as_view(), name='login'),
     path('adoption-trends/', AdoptionTrendsAPIView.as_view(), name='adoption-trends'),
+    path('stats/summary/', StatsSummaryAPIView.as_view(), name='stats-summary'),
+    path('stats/catalogue-cache/', CatalogueCacheStatsAPIView.as_view(), name='catalogue-cache-stats'),
     path('profile/', FosterProfileView.as_view(), name='foster-profile'),
     path('user-profile/', UserProfileView.as_view(), name='user-profile'), 
     path('', include(router.urls)),
@@ -8,6 +8,10 @@ from .models import Pet, AdoptionRequest
 
 from .serializers import PetSerializer, AdoptionRequestSerializer
 
+from .pagination import KeysetPagination
+
+from .filters import PetCatalogueFilter
+
 
 
 # --- ViewSet for Pet Management ---
@@ -30,6 +34,12 @@ class PetViewSet(viewsets.ModelViewSet):
 
     parser_classes = [MultiPartParser, FormParser]
 
+    pagination_class = KeysetPagination
+
+    filter_backends = [PetCatalogueFilter]
+
+    cursor_ordering = '-id'
+
 
 
     def destroy(self, request, *args, **kwargs):
@@ -58,10 +68,14 @@ class AdoptionRequestViewSet(viewsets.ModelViewSet):
 
     """
 
-    queryset = AdoptionRequest.objects.all().order_by('-created_at')
+    queryset = AdoptionRequest.objects.select_related('pet').order_by('-created_at')
 
     serializer_class = AdoptionRequestSerializer
 
+    pagination_class = KeysetPagination
+
+    cursor_ordering = '-created_at'
+
 
 
     def get_queryset(self):
@@ -156,30 +170,46 @@ class AdoptionRequestViewSet(viewsets.ModelViewSet):
     
 
 from rest_framework import generics, permissions
+from .parsers import FastJSONParser
 from rest_framework.response import Response
 from .models import FosterProfile, UserProfile
 from .serializers import FosterProfileSerializer, UserProfileSerializer
+from .favorites import favorites_prefetch
 
 class FosterProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = FosterProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # JSON for base64 images, multipart so clients can upload the file directly
+    parser_classes = [FastJSONParser, MultiPartParser, FormParser]
 
     def get_object(self):
         # Ensure the profile exists, or create it if missing
-        profile, created = FosterProfile.objects.get_or_create(user=self.request.user)
+        profile, created = (
+            FosterProfile.objects.select_related('user')
+            .prefetch_related('current_fosters')
+            .get_or_create(user=self.request.user)
+        )
         return profile
 
     def update(self, request, *args, **kwargs):
-        # Optional: Add custom logic here if needed, otherwise default is fine
+        # A multipart upload usually carries just the image (nested fosters don't
+        # fit in form fields), so only update what was sent.
+        if request.content_type.startswith('multipart/'):
+            kwargs['partial'] = True
         return super().update(request, *args, **kwargs)
     
 class UserProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = UserProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [FastJSONParser, MultiPartParser, FormParser]
 
     def get_object(self):
         # Ensures the profile exists for the logged-in user
-        profile, created = UserProfile.objects.get_or_create(user=self.request.user)
+        profile, created = (
+            UserProfile.objects.select_related('user')
+            .prefetch_related(favorites_prefetch())
+            .get_or_create(user=self.request.user)
+        )
         return profile
     
     # ⭐ FIX: Override update to allow partial updates on PUT requests.
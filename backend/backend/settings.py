@@ -10,9 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
+import re
 from pathlib import Path
 from django.conf import settings
 from django.conf.urls.static import static
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -53,11 +56,75 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
+    # orjson-backed JSON when orjson is installed, DRF's stdlib json otherwise
+    # (admin_inventory/renderers.py, admin_inventory/parsers.py).
+    'DEFAULT_RENDERER_CLASSES': [
+        'admin_inventory.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'admin_inventory.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+# Keyset pagination for pets/ and applications/ (see admin_inventory/pagination.py).
+# Keep API_PAGINATE_BY_DEFAULT off until every frontend page sends ?page_size=,
+# so older clients still receive the plain list.
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 500
+API_PAGINATE_BY_DEFAULT = False
+
+# Seconds /api/stats/summary/ may be served from cache; saves and deletes invalidate it sooner.
+STATS_CACHE_TIMEOUT = 30
+
+# Seconds an anonymous /api/pets/ page may be served from cache (admin_inventory/catalogue_cache.py).
+# Pet and application writes retire cached pages straight away.
+CATALOGUE_CACHE_TIMEOUT = 300
+
+# Count catalogue cache hits and misses for /api/stats/catalogue-cache/. Each
+# count is a cache write per request (a file write with CACHE_BACKEND=file), so
+# turn it on only while measuring.
+CATALOGUE_CACHE_STATS = os.environ.get('CATALOGUE_CACHE_STATS', '').lower() in ('1', 'true', 'yes', 'on')
+
+# Cache for the summary, match predicates and catalogue pages. locmem lives in one
+# process, so with several gunicorn workers an invalidation only reaches the
+# worker that made the change: use CACHE_BACKEND=file (shared directory) or
+# redis (any Redis-compatible server; needs the redis package) there.
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem')
+CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'petadoption'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', str(BASE_DIR / 'cache')),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379/1'),
 }
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND][0],
+        'LOCATION': os.environ.get('CACHE_LOCATION', CACHE_BACKENDS[CACHE_BACKEND][1]),
+    }
+}
+
+# Response compression (admin_inventory/compression.py): Brotli when the brotli
+# package is installed and the client accepts it, otherwise gzip through Django's
+# GZipMiddleware (level 6, with its BREACH padding). Bodies smaller than
+# COMPRESSION_MIN_SIZE bytes aren't worth the CPU and go out as they are.
+# `manage.py benchmark compression` prints size and cost per level.
+COMPRESSION_ENCODINGS = [
+    coding.strip() for coding in os.environ.get('COMPRESSION_ENCODINGS', 'br,gzip').split(',') if coding.strip()
+]
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', 4))
+
+# `manage.py archive_applications` moves Approved/Rejected requests closed this
+# many days ago into the archive table.
+ARCHIVE_CLOSED_REQUESTS_AFTER_DAYS = 90
 
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Early in the list so it compresses the body every later middleware produced.
+    'admin_inventory.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -101,12 +168,79 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+# SQLite by default. Set DB_ENGINE=postgresql (and DB_NAME, DB_USER, DB_PASSWORD,
+# DB_HOST, DB_PORT) to run on PostgreSQL, which needs psycopg (requirements-postgres.txt).
+
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite3')
+
+# PRAGMAs for every SQLite connection, passed to the backend as init_command.
+# WAL lets readers carry on while a write is in progress; busy_timeout (ms)
+# makes a writer wait for the lock instead of failing.
+SQLITE_PRAGMAS = {
+    'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'wal'),
+    'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'normal'),
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000)),
+    'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+    'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', -64000)),  # negative: KiB, so ~64 MB
+    'temp_store': os.environ.get('SQLITE_TEMP_STORE', 'memory'),
 }
+PRAGMA_NAME = re.compile(r'^[a-z_]+$')
+PRAGMA_VALUE = re.compile(r'^-?\w+$')
+
+
+def sqlite_init_command(pragmas):
+    """`PRAGMA name = value; ...` for OPTIONS['init_command']."""
+    statements = []
+    for name, value in pragmas.items():
+        # Values come from the environment and PRAGMA can't take parameters.
+        if not PRAGMA_NAME.match(name) or not PRAGMA_VALUE.match(str(value)):
+            raise ImproperlyConfigured(f'Invalid SQLite pragma: {name} = {value!r}')
+        statements.append(f'PRAGMA {name} = {value}')
+    return ';'.join(statements)
+
+
+if DB_ENGINE in ('postgresql', 'postgres'):
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'petadoption'),
+            'USER': os.environ.get('DB_USER', 'petadoption'),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+            # Keep a worker's connection open between requests (seconds, 0 closes
+            # it after each request) and ping it before reusing it, so a restarted
+            # server or a dropped idle connection doesn't fail the next request.
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'true').lower() in ('1', 'true', 'yes', 'on'),
+            'OPTIONS': {},
+        }
+    }
+    # DB_POOL=true hands connections to psycopg's pool instead (psycopg[pool]).
+    # Django refuses a pool together with persistent connections, so CONN_MAX_AGE
+    # goes back to 0; each request borrows a connection and returns it.
+    if os.environ.get('DB_POOL', '').lower() in ('1', 'true', 'yes', 'on'):
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {
+                # Take the write lock when a transaction starts instead of upgrading a
+                # read lock mid-way, which fails at once with "database is locked"
+                # when two gunicorn workers try it together.
+                'transaction_mode': os.environ.get('SQLITE_TRANSACTION_MODE', 'IMMEDIATE'),
+                # Run on every new connection by the SQLite backend itself.
+                'init_command': sqlite_init_command(SQLITE_PRAGMAS),
+            },
+        }
+    }
 
 
 # Password validation
@@ -144,6 +278,14 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# Thumbnails for uploaded images are rendered on a small thread pool after the
+# upload commits; set THUMBNAIL_ASYNC = False to render them inline instead.
+THUMBNAIL_ASYNC = True
+THUMBNAIL_WORKERS = 2
+
+# Largest decoded profile image accepted (base64 or multipart), in bytes.
+MAX_IMAGE_UPLOAD_SIZE = 10 * 1024 * 1024
 STATIC_URL = 'static/'
 
 # Default primary key field type
@@ -28,17 +28,15 @@ const fetchPets = async () => {
     throw lastError;
 };
 
-const updateUserProfile = async (token, favoritesData) => {
-    const res = await fetch(`${API_BASE}user-profile/`, {
-        method: 'PUT',
+// Adds or removes a single favorite; the server writes one row either way.
+const setFavorite = async (token, petId, isFavorite) => {
+    const res = await fetch(`${API_BASE}favorites/${petId}/`, {
+        method: isFavorite ? 'PUT' : 'DELETE',
         headers: {
-            'Content-Type': 'application/json',
             'Authorization': `Token ${token}`
-        },
-        body: JSON.stringify({ favorites: favoritesData })
+        }
     });
     if (!res.ok) throw new Error('Failed to update favorites');
-    return await res.json();
 };
 
 const updateUserPreferences = async (token, preferencesData) => {
@@ -70,19 +68,6 @@ const fetchUserProfile = async (userId, token) => {
     return null; 
 };
 
-const fetchApplications = async () => {
-    try {
-        const res = await fetch(`${API_BASE}applications/`);
-        if (!res.ok) throw new Error('Failed to fetch applications');
-        return await res.json();
-    } catch (e) {
-        return [
-            { id: 1, pet_name: 'Max (Dog)', status: 'Pending' },
-            { id: 2, pet_name: 'Luna (Cat)', status: 'Approved' },
-        ];
-    }
-};
-
 const createApplication = async ({ petId, requester_name, email }) => {
     const res = await fetch(`${API_BASE}applications/`, {
         method: 'POST',
@@ -441,19 +426,12 @@ const Adopt = () => {
     const loadPets = useCallback(async () => {
         setLoading(true);
         try {
-            const [petsData, applicationData] = await Promise.all([
-                fetchPets(),
-                fetchApplications()
-            ]);
-
-            const pendingApplications = applicationData.filter(app => app.status === 'Pending');
+            const petsData = await fetchPets();
 
+            // The backend keeps a pending-application flag on each pet, so the
+            // applications list no longer has to be downloaded and joined by name.
             const mergedPets = petsData.map(pet => {
-                const hasPendingApplication = pendingApplications.some(app =>
-                    app.pet_name && app.pet_name.includes(pet.name) && pet.status !== 'Adopted'
-                );
-
-                if (pet.status === 'Available' && hasPendingApplication) {
+                if (pet.status === 'Available' && pet.has_pending_request) {
                     return { ...pet, status: 'Pending' };
                 }
                 return pet;
@@ -552,9 +530,9 @@ const Adopt = () => {
         }
 
         try {
-            const updatedProfile = await updateUserProfile(currentUser.token, newFavorites);
+            await setFavorite(currentUser.token, pet.id, !isPetFavorite);
             
-            const updatedUser = { ...currentUser, favorites: updatedProfile.favorites };
+            const updatedUser = { ...currentUser, favorites: newFavorites };
             localStorage.setItem('petUser', JSON.stringify(updatedUser));
             setCurrentUser(updatedUser);
             setNotification({ 
@@ -50,9 +50,13 @@ const API_BASE = "http://127.0.0.1:8000/api/";
 
 const api = {
 
-  fetchPets: async () => {
+  // Counts are aggregated on the server, so the payload stays the same size
 
-    const res = await fetch(`${API_BASE}pets/`);
+  // no matter how many pets and applications exist.
+
+  fetchSummary: async () => {
+
+    const res = await fetch(`${API_BASE}stats/summary/`);
 
     if (!res.ok) throw new Error(`HTTP error! status: ${res.status}`);
 
@@ -60,11 +64,11 @@ const api = {
 
   },
 
-  fetchRequests: async () => {
+  // Monthly adoptions read from the server's daily rollups ({ trends, months }).
 
-    // ⭐ UPDATED: Fetching requests from the new 'applications' endpoint
+  fetchTrends: async () => {
 
-    const res = await fetch(`${API_BASE}applications/`);
+    const res = await fetch(`${API_BASE}adoption-trends/?granularity=month`);
 
     if (!res.ok) throw new Error(`HTTP error! status: ${res.status}`);
 
@@ -122,6 +126,38 @@ const GENERATE_REQUESTS = () => [
 
 
 
+// Mirrors the /api/stats/summary/ response, built from the mock lists above.
+
+const GENERATE_SUMMARY = () => {
+
+  const pets = GENERATE_PETS();
+
+  const requests = GENERATE_REQUESTS();
+
+  const count = (list, key, value) => list.filter((item) => item[key] === value).length;
+
+  return {
+
+    total_pets: pets.length,
+
+    total_dogs: count(pets, "type", "Dog"),
+
+    total_cats: count(pets, "type", "Cat"),
+
+    available_pets: count(pets, "status", "Available"),
+
+    pending_pets: count(pets, "status", "Pending"),
+
+    adopted_pets: count(pets, "status", "Adopted"),
+
+    pending_requests: count(requests, "status", "Pending"),
+
+  };
+
+};
+
+
+
 // Static chart labels
 
 const CHART_LABELS = ["Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"];
@@ -652,9 +688,9 @@ const PetDistributionChart = React.memo(({ dogs, cats }) => {
 
 const AdminDashboard = () => {
 
-  const [pets, setPets] = useState([]);
+  const [summary, setSummary] = useState({});
 
-  const [requests, setRequests] = useState([]);
+  const [trendData, setTrendData] = useState(null);
 
   const [loading, setLoading] = useState(true);
 
@@ -732,17 +768,17 @@ const AdminDashboard = () => {
 
       setLoading(true);
 
-      const [petsData, reqData] = await Promise.all([
+      const [summaryData, trendsData] = await Promise.all([
 
-        fetchWithFallback(api.fetchPets, GENERATE_PETS, "pets"),
+        fetchWithFallback(api.fetchSummary, GENERATE_SUMMARY, "summary"),
 
-        fetchWithFallback(api.fetchRequests, GENERATE_REQUESTS, "requests"),
+        fetchWithFallback(api.fetchTrends, () => null, "trends"),
 
       ]);
 
-      setPets(petsData);
+      setSummary(summaryData);
 
-      setRequests(reqData);
+      setTrendData(trendsData);
 
       setLoading(false);
 
@@ -758,19 +794,21 @@ const AdminDashboard = () => {
 
   const stats = {
 
-    totalDogs: pets.filter((p) => p.type === "Dog").length,
+    totalPets: summary.total_pets || 0,
 
-    totalCats: pets.filter((p) => p.type === "Cat").length,
+    totalDogs: summary.total_dogs || 0,
 
-    pendingRequests: requests.filter((r) => r.status === "Pending").length,
+    totalCats: summary.total_cats || 0,
 
-    adoptedTotal: pets.filter((p) => p.status === "Adopted").length,
+    pendingRequests: summary.pending_requests || 0,
+
+    adoptedTotal: summary.adopted_pets || 0,
 
     // --- NEW STATS FOR PET STATUS BREAKDOWN ---
 
-    availablePets: pets.filter((p) => p.status === "Available").length,
+    availablePets: summary.available_pets || 0,
 
-    pendingPets: pets.filter((p) => p.status === "Pending").length,
+    pendingPets: summary.pending_pets || 0,
 
     // -----------------------------------------
 
@@ -814,13 +852,17 @@ const AdminDashboard = () => {
 
   // Generate dynamic trend data for the chart
 
-  const adoptionTrends = createDynamicTrendData(stats.adoptedTotal);
+  // Real monthly counts when the API answers, the generated curve otherwise.
+
+  const adoptionTrends = trendData ? trendData.trends : createDynamicTrendData(stats.adoptedTotal);
+
+  const adoptionTrendLabels = trendData ? trendData.months : CHART_LABELS;
 
 
 
   // Capacity calculation and display
 
-  const currentCapacity = pets.length;
+  const currentCapacity = stats.totalPets;
 
   const capacityPercentage = Math.round((currentCapacity / MAX_CAPACITY) * 100);
 
@@ -1018,7 +1060,7 @@ const AdminDashboard = () => {
 
             title="Total Animals"
 
-            value={pets.length}
+            value={stats.totalPets}
 
             icon={<Dog size={24} />}
 
@@ -1170,7 +1212,7 @@ const AdminDashboard = () => {
 
                 data={adoptionTrends} 
 
-                labels={CHART_LABELS}
+                labels={adoptionTrendLabels}
 
                 loading={loading}
 
@@ -1228,7 +1270,7 @@ const AdminDashboard = () => {
 
                       <span className="text-2xl sm:text-3xl font-black text-slate-900 animate-[zoomIn_0.5s_ease-out]"> {/* Reduced font size */}
 
-                        {pets.length}
+                        {stats.totalPets}
 
                       </span>
 
@@ -1250,9 +1292,9 @@ const AdminDashboard = () => {
 
                       <span className="text-orange-600 font-black text-lg">
 
-                        {pets.length > 0
+                        {stats.totalPets > 0
 
-                          ? Math.round((stats.totalDogs / pets.length) * 100)
+                          ? Math.round((stats.totalDogs / stats.totalPets) * 100)
 
                           : 0}
 
@@ -1276,9 +1318,9 @@ const AdminDashboard = () => {
 
                       <span className="text-blue-600 font-black text-lg">
 
-                        {pets.length > 0
+                        {stats.totalPets > 0
 
-                          ? Math.round((stats.totalCats / pets.length) * 100)
+                          ? Math.round((stats.totalCats / stats.totalPets) * 100)
 
                           : 0}
 